@@ -30,23 +30,69 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-# noinspection PyUnresolvedReferences
-from pygameMenu.menu import Menu
+import importlib as _importlib
+import sys as _sys
 
 # noinspection PyUnresolvedReferences
-from pygameMenu.textmenu import TextMenu
+import pygameMenu.events
 
 # noinspection PyUnresolvedReferences
-from pygameMenu.sound import Sound
+import pygameMenu.locals
 
-# noinspection PyUnresolvedReferences
-import pygameMenu.fonts as fonts
+# Objects imported on first access (module, name), these modules import pygame
+_LAZY = {
+    'ControlMap': ('pygameMenu.controls', 'ControlMap'),
+    'Menu': ('pygameMenu.menu', 'Menu'),
+    'MenuFactory': ('pygameMenu.menu', 'MenuFactory'),
+    'Sound': ('pygameMenu.sound', 'Sound'),
+    'TextMenu': ('pygameMenu.textmenu', 'TextMenu'),
 
-# noinspection PyUnresolvedReferences
-import pygameMenu.events
+    # Submodules
+    'config_controls': ('pygameMenu.config_controls', None),
+    'config_menu': ('pygameMenu.config_menu', None),
+    'config_textmenu': ('pygameMenu.config_textmenu', None),
+    'controls': ('pygameMenu.controls', None),
+    'fonts': ('pygameMenu.fonts', None),
+    'menu': ('pygameMenu.menu', None),
+    'sound': ('pygameMenu.sound', None),
+    'textmenu': ('pygameMenu.textmenu', None),
+    'utils': ('pygameMenu.utils', None),
+    'widgets': ('pygameMenu.widgets', None),
+}
 
-# noinspection PyUnresolvedReferences
-import pygameMenu.locals
+
+def __getattr__(name):
+    """
+    Import the lazy objects of the package (PEP 562).
+
+    :param name: Attribute name
+    :type name: basestring
+    :return: Object
+    :rtype: object
+    """
+    if name not in _LAZY:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    module_name, attr = _LAZY[name]
+    value = _importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value  # Next accesses do not call __getattr__
+    return value
+
+
+def __dir__():
+    """
+    List the attributes of the package, including the lazy objects.
+
+    :return: Attribute names
+    :rtype: list
+    """
+    return sorted(set(globals().keys()) | set(_LAZY.keys()))
+
+
+if _sys.version_info < (3, 7):  # Module __getattr__ is not supported, import all now
+    for _name in _LAZY.keys():
+        __getattr__(_name)
 
 # Other
 __author__ = 'ppizarror'
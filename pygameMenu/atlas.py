@@ -0,0 +1,410 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+FONT ATLAS
+Text renderer that draws glyphs from a surface rasterized once.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import pygame as _pygame
+import pygame.font as _font
+from pygameMenu.utils import get_cache_file as _get_file
+from pygameMenu.utils import read_cache_file as _read_file
+from pygameMenu.utils import write_cache_file as _write_file
+
+# Width of the atlas surfaces (px)
+_ATLAS_WIDTH = 512
+
+# Version of the prebaked atlas files, change it if the data changes
+_CACHE_VERSION = 1
+
+# Image.frombytes() and tobytes() replace fromstring() and tostring() since pygame 2.1.3
+if hasattr(_pygame.image, 'frombytes'):
+    _frombytes, _tobytes = _pygame.image.frombytes, _pygame.image.tobytes
+else:
+    _frombytes, _tobytes = _pygame.image.fromstring, _pygame.image.tostring
+
+
+class FontAtlas(object):
+    """
+    Font that rasterizes each glyph once into an atlas surface, and renders
+    text by blitting the glyphs with their cached advances and kerning. It
+    has the same rendering methods as pygame.font.Font.
+    """
+
+    def __init__(self, name, size):
+        """
+        Constructor.
+
+        :param name: Font file
+        :type name: basestring
+        :param size: Font size
+        :type size: int
+        """
+        self._font = _font.Font(name, size)  # Loaded on demand if prebaked
+        self._height = self._font.get_height()
+        self._name = name
+        self._size = size
+
+        # Metrics
+        self._advances = {}  # Advance of each character
+        self._kerning = {}  # Kerning of each pair of characters
+        self._metrics = (self._font.get_ascent(), self._font.get_descent(), self._font.get_linesize())
+        self._widths = {}  # Width of the prebaked texts
+
+        # Atlas of white glyphs, with and without antialias
+        self._atlas = {}
+        self._glyphs = {True: {}, False: {}}  # Rect of each glyph in the atlas
+        self._shelf = {True: [0, 0], False: [0, 0]}  # Next free position of the atlas
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Create an atlas from the data returned by to_data(), the font file is
+        only loaded if a glyph or metric is not in the data.
+
+        :param data: Atlas data
+        :type data: dict
+        :return: Font atlas
+        :rtype: FontAtlas
+        """
+        atlas = cls.__new__(cls)
+        atlas._font = None
+        atlas._height = data['height']
+        atlas._name = data['name']
+        atlas._size = data['size']
+        atlas._advances = data['advances']
+        atlas._kerning = data['kerning']
+        atlas._metrics = data['metrics']
+        atlas._widths = data['widths']
+        atlas._atlas = {}
+        for antialias in data['atlas'].keys():
+            size, pixels = data['atlas'][antialias]
+            atlas._atlas[antialias] = _frombytes(pixels, size, 'RGBA')
+        atlas._glyphs = data['glyphs']
+        atlas._shelf = data['shelf']
+        return atlas
+
+    def to_data(self):
+        """
+        Return the atlas data, made only of builtin types so it can be
+        pickled.
+
+        :return: Atlas data
+        :rtype: dict
+        """
+        atlas = {}
+        for antialias in self._atlas.keys():
+            surface = self._atlas[antialias]
+            atlas[antialias] = (surface.get_size(), _tobytes(surface, 'RGBA'))
+        return {
+            'advances': self._advances,
+            'atlas': atlas,
+            'glyphs': self._glyphs,
+            'height': self._height,
+            'kerning': self._kerning,
+            'metrics': self._metrics,
+            'name': self._name,
+            'shelf': self._shelf,
+            'size': self._size,
+            'widths': self._widths
+        }
+
+    def prebake(self, chars='', lines=()):
+        """
+        Rasterize the glyphs and measure the metrics used by some text.
+
+        :param chars: Characters, kerning is measured for all the pairs
+        :type chars: basestring
+        :param lines: Lines of text, kerning is measured for the adjacent characters and the width of each
+            line is stored
+        :type lines: list, tuple
+        :return: None
+        """
+        for antialias in (True, False):
+            for char in chars:
+                self._get_glyph(char, antialias)
+            for line in lines:
+                for char in line:
+                    self._get_glyph(char, antialias)
+        for left in chars:
+            for right in chars:
+                self._get_kerning(left, right)
+        for line in lines:
+            self._get_positions(line)
+            self._widths[line] = self._get_font().size(line)[0]
+
+    def _get_font(self):
+        """
+        Return the font, loading it if the atlas was prebaked.
+
+        :return: Font
+        :rtype: pygame.font.Font
+        """
+        if self._font is None:
+            self._font = _font.Font(self._name, self._size)
+        return self._font
+
+    def _get_width(self, text):
+        """
+        Return the width of a text.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width (px)
+        :rtype: int
+        """
+        width = self._widths.get(text)
+        if width is None:
+            width = self._get_font().size(text)[0]
+        return width
+
+    def _get_glyph(self, char, antialias):
+        """
+        Return the rect of a glyph in the atlas, rasterizing it if needed.
+
+        :param char: Character
+        :type char: basestring
+        :param antialias: Glyph is antialiased
+        :type antialias: bool
+        :return: Rect (x, y, width, height)
+        :rtype: tuple
+        """
+        rect = self._glyphs[antialias].get(char)
+        if rect is not None:
+            return rect
+        glyph = self._get_font().render(char, antialias, (255, 255, 255))
+        width = glyph.get_width()
+
+        # Pack the glyph in the current row, or start a new row
+        shelf = self._shelf[antialias]
+        if shelf[0] + width > _ATLAS_WIDTH:
+            shelf[0] = 0
+            shelf[1] += self._height
+        atlas = self._atlas.get(antialias)
+        if atlas is None or shelf[1] + self._height > atlas.get_height():  # Double the height
+            height = self._height if atlas is None else 2 * atlas.get_height()
+            # noinspection PyArgumentList
+            surface = _pygame.Surface((max(_ATLAS_WIDTH, width), height), _pygame.SRCALPHA, 32)
+            surface.fill((0, 0, 0, 0))
+            if atlas is not None:
+                surface.blit(atlas, (0, 0))
+            atlas = surface
+            self._atlas[antialias] = atlas
+
+        atlas.blit(glyph, shelf[:])
+        rect = (shelf[0], shelf[1], width, self._height)
+        shelf[0] += width
+        self._glyphs[antialias][char] = rect
+        return rect
+
+    def _get_advance(self, char):
+        """
+        Return the advance of a character.
+
+        :param char: Character
+        :type char: basestring
+        :return: Advance (px)
+        :rtype: int
+        """
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._get_font().size(char)[0]
+            self._advances[char] = advance
+        return advance
+
+    def _get_kerning(self, left, right):
+        """
+        Return the kerning between two characters.
+
+        :param left: Left character
+        :type left: basestring
+        :param right: Right character
+        :type right: basestring
+        :return: Kerning (px)
+        :rtype: int
+        """
+        pair = left + right
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            kerning = self._get_font().size(pair)[0] - self._get_advance(left) - self._get_advance(right)
+            self._kerning[pair] = kerning
+        return kerning
+
+    def _get_positions(self, text):
+        """
+        Return the position of each character, and the text width.
+
+        :param text: Text
+        :type text: basestring
+        :return: Positions and width
+        :rtype: tuple
+        """
+        positions = []
+        x = 0
+        prev = None
+        for char in text:
+            if prev is not None:
+                x += self._get_kerning(prev, char)
+            positions.append(x)
+            x += self._get_advance(char)
+            prev = char
+
+        # Advances are rounded per character, spread the difference with the
+        # exact width through the string
+        width = self._get_width(text)
+        if x != width and x > 0:
+            positions = [(pos * width + x // 2) // x for pos in positions]
+        return positions, width
+
+    def get_ascent(self):
+        """
+        Return the ascent of the font.
+
+        :return: Ascent (px)
+        :rtype: int
+        """
+        return self._metrics[0]
+
+    def get_descent(self):
+        """
+        Return the descent of the font.
+
+        :return: Descent (px)
+        :rtype: int
+        """
+        return self._metrics[1]
+
+    def get_height(self):
+        """
+        Return the height of the font.
+
+        :return: Height (px)
+        :rtype: int
+        """
+        return self._height
+
+    def get_linesize(self):
+        """
+        Return the line size of the font.
+
+        :return: Line size (px)
+        :rtype: int
+        """
+        return self._metrics[2]
+
+    def render(self, text, antialias, color, background=None):
+        """
+        Render text on a new surface, glyphs are blitted from the atlas.
+
+        :param text: Text
+        :type text: basestring
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :param background: Background color, transparent if None
+        :type background: tuple, NoneType
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        antialias = bool(antialias)
+        positions, width = self._get_positions(text)
+        rects = [self._get_glyph(char, antialias) for char in text]
+        for i in range(len(rects)):
+            width = max(width, positions[i] + rects[i][2])
+
+        # noinspection PyArgumentList
+        surface = _pygame.Surface((width, self._height), _pygame.SRCALPHA, 32)
+        surface.fill((0, 0, 0, 0))
+        atlas = self._atlas.get(antialias)
+        for i in range(len(rects)):
+            surface.blit(atlas, (positions[i], 0), rects[i], _pygame.BLEND_RGBA_MAX)
+        surface.fill((color[0], color[1], color[2], 255), special_flags=_pygame.BLEND_RGBA_MULT)
+
+        if background is not None:
+            text_surface = surface
+            surface = _pygame.Surface((width, self._height))
+            surface.fill(background)
+            surface.blit(text_surface, (0, 0))
+        return surface
+
+    def size(self, text):
+        """
+        Return the size of the rendered text.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width and height (px)
+        :rtype: tuple
+        """
+        return self._get_width(text), self._height
+
+
+def _get_cache_file(name, size):
+    """
+    Return the file of the prebaked atlas of a font.
+
+    :param name: Font file
+    :type name: basestring
+    :param size: Font size
+    :type size: int
+    :return: File path
+    :rtype: basestring
+    """
+    return _get_file('atlas', name, (_CACHE_VERSION, size))
+
+
+def load_atlas(name, size):
+    """
+    Load the prebaked atlas of a font.
+
+    :param name: Font file
+    :type name: basestring
+    :param size: Font size
+    :type size: int
+    :return: Font atlas, None if it has not been prebaked
+    :rtype: FontAtlas, NoneType
+    """
+    data = _read_file(_get_cache_file(name, size))
+    if data is None or data.get('version') != _CACHE_VERSION:
+        return None
+    return FontAtlas.from_data(data['atlas'])
+
+
+def save_atlas(atlas):
+    """
+    Save an atlas to the cache directory.
+
+    :param atlas: Font atlas
+    :type atlas: FontAtlas
+    :return: File path
+    :rtype: basestring
+    """
+    path = _get_cache_file(atlas._name, atlas._size)
+    _write_file(path, {'version': _CACHE_VERSION, 'atlas': atlas.to_data()})
+    return path
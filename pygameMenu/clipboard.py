@@ -0,0 +1,222 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+CLIPBOARD
+Clipboard access that does not stall the frame.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+
+import threading as _threading
+
+import pygame as _pygame
+
+_pyperclip = None  # Imported on first use, False if it is not installed
+
+
+def _get_pyperclip():
+    """
+    Return the pyperclip module, it is imported on first use as it looks for
+    the clipboard programs of the system.
+
+    :return: Pyperclip module or None if it is not installed
+    :rtype: module, NoneType
+    """
+    global _pyperclip
+    if _pyperclip is None:
+        try:
+            import pyperclip
+            _pyperclip = pyperclip
+        except ImportError:
+            _pyperclip = False
+    return _pyperclip or None
+
+
+class Clipboard(object):
+    """
+    Clipboard object.
+
+    The text is copied and pasted in-process with ``pygame.scrap`` if it is
+    available, else ``pyperclip`` is called on a worker thread, as it may spawn
+    a process (xclip, xsel) that would stall the frame. The pasted text is
+    read with ``get_paste()`` once it is received.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self._lock = _threading.Lock()
+        self._paste_text = None  # Received text, not read yet
+        self._paste_thread = None
+        self._scrap = None  # pygame.scrap module, False if it cannot be used
+
+    def _get_scrap(self):
+        """
+        Return the scrap module if it can be used.
+
+        :return: Scrap module or None
+        :rtype: module, NoneType
+        """
+        if self._scrap is None:
+            try:
+                import pygame.scrap as scrap
+                if not hasattr(scrap, 'get_text'):
+                    if _pygame.display.get_surface() is None:
+                        return None  # scrap needs a display mode, try later
+                    if not scrap.get_init():
+                        scrap.init()
+                self._scrap = scrap
+            except (ImportError, NotImplementedError, _pygame.error):
+                self._scrap = False
+        return self._scrap or None
+
+    def _scrap_copy(self, text):
+        """
+        Copy the text with pygame.scrap.
+
+        :param text: Text
+        :type text: basestring
+        :return: True if the text was copied
+        :rtype: bool
+        """
+        scrap = self._get_scrap()
+        if scrap is None:
+            return False
+        try:
+            if hasattr(scrap, 'put_text'):
+                scrap.put_text(text)
+            else:
+                scrap.put(_pygame.SCRAP_TEXT, text.encode('utf-8'))
+            return True
+        except _pygame.error:
+            self._scrap = False  # The clipboard is not available, use pyperclip
+            return False
+
+    def _scrap_paste(self):
+        """
+        Paste the text with pygame.scrap.
+
+        :return: Text, None if scrap cannot be used or returned no text
+        :rtype: basestring, NoneType
+        """
+        scrap = self._get_scrap()
+        if scrap is None:
+            return None
+        try:
+            if hasattr(scrap, 'get_text'):
+                return scrap.get_text()
+            text = scrap.get(_pygame.SCRAP_TEXT)
+        except _pygame.error:
+            self._scrap = False
+            return None
+        if text is None:
+            return None
+        return text.decode('utf-8', 'ignore').rstrip('\0')
+
+    def copy(self, text):
+        """
+        Copy text to the clipboard.
+
+        :param text: Text
+        :type text: basestring
+        :return: None
+        """
+        if self._scrap_copy(text) or _get_pyperclip() is None:
+            return
+        thread = _threading.Thread(target=self._pyperclip_copy, args=(text,))
+        thread.daemon = True
+        thread.start()
+
+    def get_paste(self):
+        """
+        Return the text received from the last ``paste()`` call, the text is
+        returned only once.
+
+        :return: Text, None if no text has been received
+        :rtype: basestring, NoneType
+        """
+        if self._paste_text is None:
+            return None
+        with self._lock:
+            text = self._paste_text
+            self._paste_text = None
+        return text
+
+    def is_pasting(self):
+        """
+        Return True if a paste is waiting for the clipboard.
+
+        :return: Paste in progress
+        :rtype: bool
+        """
+        return self._paste_thread is not None and self._paste_thread.is_alive()
+
+    def paste(self):
+        """
+        Request the text of the clipboard, read it with ``get_paste()``. If
+        pygame.scrap is used, the text is available immediately.
+
+        :return: None
+        """
+        text = self._scrap_paste()
+        if text is not None or _get_pyperclip() is None:
+            with self._lock:
+                self._paste_text = text or ''
+            return
+        if self.is_pasting():
+            return
+        self._paste_thread = _threading.Thread(target=self._pyperclip_paste)
+        self._paste_thread.daemon = True
+        self._paste_thread.start()
+
+    @staticmethod
+    def _pyperclip_copy(text):
+        """
+        Copy the text with pyperclip, run on a worker thread.
+
+        :param text: Text
+        :type text: basestring
+        :return: None
+        """
+        try:
+            _pyperclip.copy(text)
+        except _pyperclip.PyperclipException:
+            pass
+
+    def _pyperclip_paste(self):
+        """
+        Paste the text with pyperclip, run on a worker thread.
+
+        :return: None
+        """
+        try:
+            text = _pyperclip.paste()
+        except _pyperclip.PyperclipException:
+            text = ''
+        with self._lock:
+            self._paste_text = text
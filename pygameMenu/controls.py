@@ -0,0 +1,231 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+CONTROL MAP
+Bindings between input events and menu actions.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+
+import pygame as _pygame
+import pygameMenu.config_controls as _ctrl
+import pygameMenu.locals as _locals
+
+_ACTIONS = (_locals.PYGAME_CTRL_BACK, _locals.PYGAME_CTRL_CLOSE_MENU, _locals.PYGAME_CTRL_DOWN,
+            _locals.PYGAME_CTRL_ENTER, _locals.PYGAME_CTRL_LEFT, _locals.PYGAME_CTRL_RIGHT,
+            _locals.PYGAME_CTRL_UP)
+
+
+class ControlMap(object):
+    """
+    Control map, binds keys and joystick inputs to menu actions.
+
+    Each menu (and its widgets) reads the actions from its own map, so a map
+    can be modified or replaced at runtime without changing the defaults of
+    ``config_controls``.
+    """
+
+    def __init__(self, joy_deadzone=_locals.JOY_DEADZONE):
+        """
+        Constructor, the map is created with the default controls.
+
+        :param joy_deadzone: Joystick axis deadzone
+        :type joy_deadzone: float
+        """
+        assert isinstance(joy_deadzone, (int, float))
+        assert 0 <= joy_deadzone < 1, 'joy_deadzone must be between 0 and 1'
+
+        self._joy_deadzone = joy_deadzone
+        self._keys = {
+            _ctrl.MENU_CTRL_BACK: _locals.PYGAME_CTRL_BACK,
+            _ctrl.MENU_CTRL_CLOSE_MENU: _locals.PYGAME_CTRL_CLOSE_MENU,
+            _ctrl.MENU_CTRL_DOWN: _locals.PYGAME_CTRL_DOWN,
+            _ctrl.MENU_CTRL_ENTER: _locals.PYGAME_CTRL_ENTER,
+            _ctrl.MENU_CTRL_LEFT: _locals.PYGAME_CTRL_LEFT,
+            _ctrl.MENU_CTRL_RIGHT: _locals.PYGAME_CTRL_RIGHT,
+            _ctrl.MENU_CTRL_UP: _locals.PYGAME_CTRL_UP,
+        }
+        self._joy_axes = {
+            (_locals.JOY_AXIS_X, -1): _locals.PYGAME_CTRL_LEFT,
+            (_locals.JOY_AXIS_X, 1): _locals.PYGAME_CTRL_RIGHT,
+            (_locals.JOY_AXIS_Y, -1): _locals.PYGAME_CTRL_DOWN,
+            (_locals.JOY_AXIS_Y, 1): _locals.PYGAME_CTRL_UP,
+        }
+        self._joy_buttons = {
+            _locals.JOY_BUTTON_BACK: _locals.PYGAME_CTRL_BACK,
+            _locals.JOY_BUTTON_SELECT: _locals.PYGAME_CTRL_ENTER,
+        }
+        self._joy_hats = {
+            _locals.JOY_DOWN: _locals.PYGAME_CTRL_DOWN,
+            _locals.JOY_LEFT: _locals.PYGAME_CTRL_LEFT,
+            _locals.JOY_RIGHT: _locals.PYGAME_CTRL_RIGHT,
+            _locals.JOY_UP: _locals.PYGAME_CTRL_UP,
+        }
+
+    @staticmethod
+    def _check_action(action):
+        """
+        Check the action is valid.
+
+        :param action: Control action
+        :type action: basestring
+        :return: None
+        """
+        if action not in _ACTIONS:
+            raise ValueError('Incorrect control action "{0}"'.format(action))
+
+    def bind_key(self, key, action):
+        """
+        Bind a key to an action, replacing the previous action of the key.
+
+        :param key: Pygame key
+        :type key: int
+        :param action: Control action, see PYGAME_CTRL_* in pygameMenu.locals
+        :type action: basestring
+        :return: None
+        """
+        assert isinstance(key, int)
+        self._check_action(action)
+        self._keys[key] = action
+
+    def bind_joy_axis(self, axis, direction, action):
+        """
+        Bind a joystick axis direction to an action.
+
+        :param axis: Joystick axis
+        :type axis: int
+        :param direction: Direction of the axis, -1 or 1
+        :type direction: int
+        :param action: Control action, see PYGAME_CTRL_* in pygameMenu.locals
+        :type action: basestring
+        :return: None
+        """
+        assert isinstance(axis, int)
+        assert direction in (-1, 1), 'direction must be -1 or 1'
+        self._check_action(action)
+        self._joy_axes[(axis, direction)] = action
+
+    def bind_joy_button(self, button, action):
+        """
+        Bind a joystick button to an action.
+
+        :param button: Joystick button
+        :type button: int
+        :param action: Control action, see PYGAME_CTRL_* in pygameMenu.locals
+        :type action: basestring
+        :return: None
+        """
+        assert isinstance(button, int)
+        self._check_action(action)
+        self._joy_buttons[button] = action
+
+    def bind_joy_hat(self, value, action):
+        """
+        Bind a joystick hat value to an action.
+
+        :param value: Hat value, for example JOY_UP in pygameMenu.locals
+        :type value: tuple
+        :param action: Control action, see PYGAME_CTRL_* in pygameMenu.locals
+        :type action: basestring
+        :return: None
+        """
+        assert isinstance(value, tuple) and len(value) == 2
+        self._check_action(action)
+        self._joy_hats[value] = action
+
+    def copy(self):
+        """
+        Return a copy of the map.
+
+        :return: Control map
+        :rtype: ControlMap
+        """
+        control_map = ControlMap(self._joy_deadzone)
+        control_map._keys = self._keys.copy()
+        control_map._joy_axes = self._joy_axes.copy()
+        control_map._joy_buttons = self._joy_buttons.copy()
+        control_map._joy_hats = self._joy_hats.copy()
+        return control_map
+
+    def get_action(self, event, joystick=True):
+        """
+        Return the action bound to the given event.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :param joystick: Joystick events are accepted
+        :type joystick: bool
+        :return: Control action, None if the event is not bound
+        :rtype: basestring, NoneType
+        """
+        if event.type == _pygame.KEYDOWN:
+            return self._keys.get(event.key)
+        if not joystick:
+            return None
+        if event.type == _pygame.JOYHATMOTION:
+            return self._joy_hats.get(tuple(event.value))
+        if event.type == _pygame.JOYBUTTONDOWN:
+            return self._joy_buttons.get(event.button)
+        if event.type == _pygame.JOYAXISMOTION:
+            if event.value < -self._joy_deadzone:
+                return self._joy_axes.get((event.axis, -1))
+            if event.value > self._joy_deadzone:
+                return self._joy_axes.get((event.axis, 1))
+        return None
+
+    def get_key_action(self, key):
+        """
+        Return the action bound to the given key.
+
+        :param key: Pygame key
+        :type key: int
+        :return: Control action, None if the key is not bound
+        :rtype: basestring, NoneType
+        """
+        return self._keys.get(key)
+
+    def get_keys(self, action):
+        """
+        Return the keys bound to the given action.
+
+        :param action: Control action, see PYGAME_CTRL_* in pygameMenu.locals
+        :type action: basestring
+        :return: List of keys
+        :rtype: list
+        """
+        self._check_action(action)
+        return [key for key in self._keys if self._keys[key] == action]
+
+    def unbind_key(self, key):
+        """
+        Remove the action bound to the given key.
+
+        :param key: Pygame key
+        :type key: int
+        :return: None
+        """
+        self._keys.pop(key, None)
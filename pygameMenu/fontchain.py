@@ -0,0 +1,281 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+FONT CHAIN
+Font that renders each character with the first font of a list that has it.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import pygame as _pygame
+import pygame.freetype as _freetype
+from pygameMenu.utils import get_cache_file as _get_cache_file
+from pygameMenu.utils import read_cache_file as _read_cache_file
+from pygameMenu.utils import write_cache_file as _write_cache_file
+
+# Version of the coverage files, change it if the data changes
+_COVERAGE_VERSION = 1
+
+# Characters of the basic multilingual plane, stored in the coverage bitmaps
+_BMP_SIZE = 0x10000
+
+# Coverage of each font file
+_coverages = {}
+
+
+class GlyphCoverage(object):
+    """
+    Characters that have a glyph in a font file. The basic multilingual plane
+    is stored as a bitmap, computed once and cached on disk; other characters
+    are checked when needed.
+    """
+
+    def __init__(self, name, bitmap=None):
+        """
+        Constructor.
+
+        :param name: Font file
+        :type name: basestring
+        :param bitmap: Bitmap of the BMP characters, if None compute it
+        :type bitmap: bytes, NoneType
+        """
+        self._font = None
+        self._name = name
+        self._others = {}  # Characters out of the bitmap
+        if bitmap is None:
+            bitmap = bytearray(_BMP_SIZE // 8)
+            chars = [chr(c) for c in range(1, _BMP_SIZE) if not 0xD800 <= c < 0xE000]  # No surrogates
+            for char, metrics in zip(chars, self._get_font().get_metrics(''.join(chars))):
+                if metrics is not None:
+                    code = ord(char)
+                    bitmap[code >> 3] |= 1 << (code & 7)
+            bitmap = bytes(bitmap)
+        self.bitmap = bitmap
+
+    def _get_font(self):
+        """
+        Return the FreeType font used to check the glyphs.
+
+        :return: Font
+        :rtype: pygame.freetype.Font
+        """
+        if self._font is None:
+            if not _freetype.get_init():
+                _freetype.init()
+            self._font = _freetype.Font(self._name, 12)
+        return self._font
+
+    def has_glyph(self, char):
+        """
+        Check if the font has the glyph of a character.
+
+        :param char: Character
+        :type char: basestring
+        :return: True if the glyph exists
+        :rtype: bool
+        """
+        code = ord(char)
+        if code < _BMP_SIZE:
+            return self.bitmap[code >> 3] & (1 << (code & 7)) != 0
+        covered = self._others.get(char)
+        if covered is None:
+            covered = self._get_font().get_metrics(char)[0] is not None
+            self._others[char] = covered
+        return covered
+
+
+def get_coverage(name):
+    """
+    Return the glyph coverage of a font file, loaded from the cache on disk
+    if possible.
+
+    :param name: Font file
+    :type name: basestring
+    :return: Coverage
+    :rtype: GlyphCoverage
+    """
+    coverage = _coverages.get(name)
+    if coverage is None:
+        path = _get_cache_file('coverage', name, (_COVERAGE_VERSION,))
+        bitmap = _read_cache_file(path)
+        if isinstance(bitmap, bytes) and len(bitmap) == _BMP_SIZE // 8:
+            coverage = GlyphCoverage(name, bitmap)
+        else:
+            coverage = GlyphCoverage(name)
+            try:
+                _write_cache_file(path, coverage.bitmap)
+            except (IOError, OSError):  # Cache is not writable, compute it again the next time
+                pass
+        _coverages[name] = coverage
+    return coverage
+
+
+class FontChain(object):
+    """
+    Font made of a list of fonts, each character is rendered with the first
+    font that has its glyph. It has the same rendering methods as
+    pygame.font.Font, the fonts share the same baseline.
+    """
+
+    def __init__(self, fonts, coverages):
+        """
+        Constructor.
+
+        :param fonts: Fonts, in order of preference
+        :type fonts: list
+        :param coverages: Glyph coverage of each font
+        :type coverages: list
+        """
+        assert len(fonts) == len(coverages)
+        assert len(fonts) > 0
+        self._coverages = coverages
+        self._fonts = fonts
+
+        # Metrics, lines fit the tallest font
+        self._ascent = max(font.get_ascent() for font in fonts)
+        self._height = max(self._ascent - font.get_ascent() + font.get_height() for font in fonts)
+        self._linesize = max(font.get_linesize() for font in fonts)
+
+    def _get_runs(self, text):
+        """
+        Split a text in runs of characters rendered by the same font.
+        Characters that no font has are rendered by the first one.
+
+        :param text: Text
+        :type text: basestring
+        :return: List of (font index, text)
+        :rtype: list
+        """
+        runs = []
+        start = 0
+        current = 0
+        coverages = self._coverages
+        for i in range(len(text)):
+            char = text[i]
+            index = 0
+            for j in range(len(coverages)):
+                if coverages[j].has_glyph(char):
+                    index = j
+                    break
+            if index != current:
+                if i > start:
+                    runs.append((current, text[start:i]))
+                start = i
+                current = index
+        if len(text) > start:
+            runs.append((current, text[start:]))
+        return runs
+
+    def get_ascent(self):
+        """
+        Return the ascent of the font.
+
+        :return: Ascent (px)
+        :rtype: int
+        """
+        return self._ascent
+
+    def get_descent(self):
+        """
+        Return the descent of the font.
+
+        :return: Descent (px)
+        :rtype: int
+        """
+        return self._ascent - self._height
+
+    def get_height(self):
+        """
+        Return the height of the font.
+
+        :return: Height (px)
+        :rtype: int
+        """
+        return self._height
+
+    def get_linesize(self):
+        """
+        Return the line size of the font.
+
+        :return: Line size (px)
+        :rtype: int
+        """
+        return self._linesize
+
+    def render(self, text, antialias, color, background=None):
+        """
+        Render text on a new surface, each run with its font.
+
+        :param text: Text
+        :type text: basestring
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :param background: Background color, transparent if None
+        :type background: tuple, NoneType
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        runs = self._get_runs(text)
+        if len(runs) == 1:
+            font = self._fonts[runs[0][0]]
+            if font.get_ascent() == self._ascent and font.get_height() == self._height:
+                return font.render(text, antialias, color, background)
+
+        surfaces = []
+        width = 0
+        for index, string in runs:
+            font = self._fonts[index]
+            surfaces.append((font.render(string, antialias, color), (width, self._ascent - font.get_ascent())))
+            width += surfaces[-1][0].get_width()
+        if background is None:
+            # noinspection PyArgumentList
+            surface = _pygame.Surface((width, self._height), _pygame.SRCALPHA, 32)
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = _pygame.Surface((width, self._height))
+            surface.fill(background)
+        for text_surface, pos in surfaces:
+            if background is None and text_surface.get_flags() & _pygame.SRCALPHA:
+                surface.blit(text_surface, pos, special_flags=_pygame.BLEND_RGBA_MAX)  # Keep the alpha
+            else:
+                surface.blit(text_surface, pos)
+        return surface
+
+    def size(self, text):
+        """
+        Return the size of the rendered text.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width and height (px)
+        :rtype: tuple
+        """
+        width = 0
+        for index, string in self._get_runs(text):
+            width += self._fonts[index].size(string)[0]
+        return width, self._height
@@ -33,6 +33,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # Get actual folder
 import os.path as _path
 import pygame.font as _font
+import pygameMenu.locals as _locals
 
 __actualpath = str(_path.abspath(_path.dirname(__file__))).replace('\\', '/')
 __fontdir = '{0}/fonts/{1}.ttf'
@@ -48,51 +49,158 @@ FONT_NEVIS = __fontdir.format(__actualpath, 'nevis')
 FONT_OPEN_SANS = __fontdir.format(__actualpath, 'open_sans')
 FONT_PT_SERIF = __fontdir.format(__actualpath, 'pt_serif')
 
+# Native size of the pixel fonts, used by the pixel renderer
+PIXEL_FONT_SIZES = {
+    FONT_8BIT: 12,
+    FONT_MUNRO: 10
+}
 
-def get_font(name, size):
+# Renderers
+_RENDERERS = (_locals.PYGAME_RENDERER_ATLAS, _locals.PYGAME_RENDERER_FONT, _locals.PYGAME_RENDERER_FREETYPE,
+              _locals.PYGAME_RENDERER_PIXEL)
+_renderer = _locals.PYGAME_RENDERER_FONT  # Default renderer
+_atlas_cache = {}  # Atlas of each font file and size
+_freetype_cache = {}  # FreeType font of each font file and size
+_pixel_cache = {}  # Raster of each pixel font file
+
+
+def get_default_renderer():
+    """
+    Return the renderer used by get_font() if none is given.
+
+    :return: Renderer
+    :rtype: basestring
     """
-    Return a pygame.Font from a name.
+    return _renderer
+
+
+def set_default_renderer(renderer):
+    """
+    Set the renderer used by get_font() if none is given, fonts loaded
+    afterwards (e.g. when creating menus) use it.
+
+    :param renderer: Renderer, see locals
+    :type renderer: basestring
+    :return: None
+    """
+    global _renderer
+    if renderer not in _RENDERERS:
+        raise ValueError('Unknown font renderer')
+    _renderer = renderer
+
+
+def get_font_file(name):
+    """
+    Return the file of a font from a name.
 
     :param name: font name or path
+    :type name: str
+    :return: Font file
+    :rtype: str
+    """
+    if name == '':
+        raise ValueError('Font name cannot be empty')
+
+    # Font is not a file, then use a system font
+    if not _path.isfile(name):
+        font_name = name
+        name = _font.match_font(font_name)
+
+        if name is None:  # Show system avaiable fonts
+            from difflib import SequenceMatcher
+            system_fonts = _font.get_fonts()
+            most_similar = 0
+            most_similar_index = 0
+            for i in range(len(system_fonts)):
+                # noinspection PyArgumentEqualDefault
+                sim = SequenceMatcher(None, system_fonts[i], font_name).ratio()  # Similarity
+                if sim > most_similar:
+                    most_similar = sim
+                    most_similar_index = i
+            sys_font_sim = system_fonts[most_similar_index]
+            sys_message = 'Check system fonts with pygame.font.get_fonts() function'
+            raise ValueError('System font "{0}" unknown, use "{1}" instead\n{2}'.format(font_name,
+                                                                                        sys_font_sim,
+                                                                                        sys_message))
+    return name
+
+
+def get_font(name, size, renderer=None):
+    """
+    Return a font object from a name.
+
+    Renderers:
+        - PYGAME_RENDERER_FONT: pygame.font.Font
+        - PYGAME_RENDERER_ATLAS: pygameMenu.atlas.FontAtlas, that rasterizes
+          each glyph once and renders text by blitting them. An atlas is
+          shared by all the fonts of the same file and size, and is loaded
+          from the cache if it was prebaked (see pygameMenu.prebake).
+        - PYGAME_RENDERER_FREETYPE: pygameMenu.ftfont.FreeTypeFont, that
+          renders with pygame.freetype and can render straight into other
+          surfaces. Use get_styled() to get its strong or oblique style.
+        - PYGAME_RENDERER_PIXEL: pygameMenu.pixelfont.PixelFont for the fonts
+          in PIXEL_FONT_SIZES, rasterized once at their native size and scaled
+          by the nearest integer factor. Other fonts use pygame.font.Font.
+
+    If name is a list, return a pygameMenu.fontchain.FontChain that renders
+    each character with the first font of the list that has its glyph.
+
+    :param name: font name or path, or list of them
     :param size: font size
-    :type name: Font or str
+    :param renderer: Font renderer, if None use the default renderer
+    :type name: Font, str, list or tuple
     :type size: int
+    :type renderer: basestring, NoneType
     :return: Font object
-    :rtype: pygame.font.Font
+    :rtype: pygame.font.Font, pygameMenu.atlas.FontAtlas, pygameMenu.ftfont.FreeTypeFont,
+        pygameMenu.pixelfont.PixelFont, pygameMenu.fontchain.FontChain
     """
-    if isinstance(name, _font.Font):
+    if renderer is None:
+        renderer = _renderer
+    if renderer not in _RENDERERS:
+        raise ValueError('Unknown font renderer')
+
+    if isinstance(name, (list, tuple)):  # Fallback fonts
+        if len(name) == 0:
+            raise ValueError('Font list cannot be empty')
+        if len(name) == 1:
+            return get_font(name[0], size, renderer)
+        from pygameMenu.fontchain import FontChain, get_coverage
+        files = [get_font_file(font) for font in name]
+        return FontChain([get_font(font, size, renderer) for font in files],
+                         [get_coverage(font) for font in files])
+    elif not isinstance(name, str):  # Font object
         return name
     else:
-
-        if name == '':
-            raise ValueError('Font name cannot be empty')
-
-        # Font is not a file, then use a system font
-        if not _path.isfile(name):
-            font_name = name
-            name = _font.match_font(font_name)
-
-            if name is None:  # Show system avaiable fonts
-                from difflib import SequenceMatcher
-                system_fonts = _font.get_fonts()
-                most_similar = 0
-                most_similar_index = 0
-                for i in range(len(system_fonts)):
-                    # noinspection PyArgumentEqualDefault
-                    sim = SequenceMatcher(None, system_fonts[i], font_name).ratio()  # Similarity
-                    if sim > most_similar:
-                        most_similar = sim
-                        most_similar_index = i
-                sys_font_sim = system_fonts[most_similar_index]
-                sys_message = 'Check system fonts with pygame.font.get_fonts() function'
-                raise ValueError('System font "{0}" unknown, use "{1}" instead\n{2}'.format(font_name,
-                                                                                            sys_font_sim,
-                                                                                            sys_message))
+        name = get_font_file(name)
 
         # Try to load the font
         font = None
         try:
-            font = _font.Font(name, size)
+            if renderer == _locals.PYGAME_RENDERER_ATLAS:
+                font = _atlas_cache.get((name, size))
+                if font is None:
+                    from pygameMenu.atlas import FontAtlas, load_atlas
+                    font = load_atlas(name, size)  # Prebaked atlas
+                    if font is None:
+                        font = FontAtlas(name, size)
+                    _atlas_cache[(name, size)] = font
+            elif renderer == _locals.PYGAME_RENDERER_FREETYPE:
+                font = _freetype_cache.get((name, size))
+                if font is None:
+                    from pygameMenu.ftfont import FreeTypeFont
+                    font = FreeTypeFont(name, size)
+                    _freetype_cache[(name, size)] = font
+            elif renderer == _locals.PYGAME_RENDERER_PIXEL and name in PIXEL_FONT_SIZES:
+                raster = _pixel_cache.get(name)
+                if raster is None:
+                    from pygameMenu.pixelfont import PixelRaster
+                    raster = PixelRaster(name, PIXEL_FONT_SIZES[name])
+                    _pixel_cache[name] = raster
+                from pygameMenu.pixelfont import PixelFont
+                font = PixelFont(raster, size)
+            else:
+                font = _font.Font(name, size)
         except IOError:
             pass
 
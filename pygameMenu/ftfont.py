@@ -0,0 +1,269 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+FREETYPE FONT
+Text renderer that uses pygame.freetype, rendering directly into surfaces.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import math as _math
+import pygame as _pygame
+import pygame.freetype as _freetype
+
+
+class FreeTypeFont(object):
+    """
+    Font that renders text with pygame.freetype. It has the same rendering
+    methods as pygame.font.Font, and can render text straight into another
+    surface with render_to(). The strong and oblique styles are applied by
+    FreeType, without loading other font files.
+    """
+
+    def __init__(self, name, size, strong=False, oblique=False, font=None):
+        """
+        Constructor.
+
+        :param name: Font file
+        :type name: basestring
+        :param size: Font size
+        :type size: int
+        :param strong: Text is bold
+        :type strong: bool
+        :param oblique: Text is slanted
+        :type oblique: bool
+        :param font: FreeType font to share, if None load the file
+        :type font: pygame.freetype.Font, NoneType
+        """
+        if font is None:
+            if not _freetype.get_init():
+                _freetype.init()
+            font = _freetype.Font(name, size)
+            font.origin = True  # Positions are the baseline of the text
+        self._font = font
+        self._name = name
+        self._size = size
+        self._strong = strong
+        self._oblique = oblique
+
+        self._style = _freetype.STYLE_NORMAL
+        if strong:
+            self._style |= _freetype.STYLE_STRONG
+        if oblique:
+            self._style |= _freetype.STYLE_OBLIQUE
+
+        # Metrics
+        self._ascent = font.get_sized_ascender(size)
+        self._descent = font.get_sized_descender(size)
+        self._height = font.get_sized_height(size)
+        self._advances = {}  # Advance of each character
+
+    def get_styled(self, strong=False, oblique=False):
+        """
+        Return the same font with other style, both share the FreeType font.
+
+        :param strong: Text is bold
+        :type strong: bool
+        :param oblique: Text is slanted
+        :type oblique: bool
+        :return: Font
+        :rtype: FreeTypeFont
+        """
+        return FreeTypeFont(self._name, self._size, strong, oblique, self._font)
+
+    def get_ascent(self):
+        """
+        Return the ascent of the font.
+
+        :return: Ascent (px)
+        :rtype: int
+        """
+        return self._ascent
+
+    def get_descent(self):
+        """
+        Return the descent of the font.
+
+        :return: Descent (px)
+        :rtype: int
+        """
+        return self._descent
+
+    def get_height(self):
+        """
+        Return the height of the font.
+
+        :return: Height (px)
+        :rtype: int
+        """
+        return self._height
+
+    def get_linesize(self):
+        """
+        Return the line size of the font.
+
+        :return: Line size (px)
+        :rtype: int
+        """
+        return self._height
+
+    def get_metrics(self, text):
+        """
+        Return the metrics of each character of a text, see
+        pygame.freetype.Font.get_metrics.
+
+        :param text: Text
+        :type text: basestring
+        :return: List of (min_x, max_x, min_y, max_y, advance_x, advance_y), None for missing glyphs
+        :rtype: list
+        """
+        return self._font.get_metrics(text, self._size)
+
+    def _get_layout(self, text):
+        """
+        Return the position of the text origin, and the text width.
+
+        :param text: Text
+        :type text: basestring
+        :return: Origin x position and width (px)
+        :rtype: tuple
+        """
+        if text == '':
+            return 0, 0
+        return self._get_rect_layout(text, self._font.get_rect(text, style=self._style, size=self._size))
+
+    def _get_rect_layout(self, text, rect):
+        """
+        Return the position of the text origin, and the text width, from the
+        bounding rect of the text relative to its origin. The width includes
+        the advance of the last character, so widths of consecutive texts add
+        up.
+
+        :param text: Text
+        :type text: basestring
+        :param rect: Bounding rect
+        :type rect: pygame.rect.RectType
+        :return: Origin x position and width (px)
+        :rtype: tuple
+        """
+        advance = 0.0
+        for char in text:
+            char_advance = self._advances.get(char)
+            if char_advance is None:
+                metrics = self._font.get_metrics(char, self._size)[0]
+                char_advance = metrics[4] if metrics is not None else 0.0
+                self._advances[char] = char_advance
+            advance += char_advance
+        x = max(0, -rect.x)  # Glyphs drawn left of the origin
+        return x, x + max(int(_math.ceil(advance)), rect.right)
+
+    def render(self, text, antialias, color, background=None):
+        """
+        Render text on a new surface. The width is taken from the rendered
+        glyphs and the cached advances, so the text is only laid out once.
+
+        :param text: Text
+        :type text: basestring
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :param background: Background color, transparent if None
+        :type background: tuple, NoneType
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        glyphs = None
+        x = width = 0
+        if text != '':
+            self._font.antialiased = bool(antialias)  # The FreeType font is shared
+            glyphs, rect = self._font.render(text, color, style=self._style, size=self._size)
+            x, width = self._get_rect_layout(text, rect)
+            dest = (x + rect.x, self._ascent - rect.y)
+        if background is None:
+            # noinspection PyArgumentList
+            surface = _pygame.Surface((width, self._height), _pygame.SRCALPHA, 32)
+            surface.fill((0, 0, 0, 0))
+            if glyphs is not None:  # Copy the glyphs and their alpha, text without antialias uses a colorkey
+                flags = _pygame.BLEND_RGBA_MAX if glyphs.get_flags() & _pygame.SRCALPHA else 0
+                surface.blit(glyphs, dest, special_flags=flags)
+        else:
+            surface = _pygame.Surface((width, self._height))
+            surface.fill(background)
+            if glyphs is not None:
+                surface.blit(glyphs, dest)
+        return surface
+
+    def render_to(self, surface, dest, text, antialias, color):
+        """
+        Render text straight into a surface, without intermediate surfaces.
+
+        :param surface: Surface to draw on
+        :type surface: pygame.surface.SurfaceType
+        :param dest: Top left position of the text, same as blitting render()
+        :type dest: tuple
+        :param text: Text
+        :type text: basestring
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :return: None
+        """
+        if text != '':
+            self._render_to(surface, dest[0] + self._get_layout(text)[0], dest[1], text, antialias, color)
+
+    def _render_to(self, surface, x, y, text, antialias, color):
+        """
+        Render text with its origin at the given position.
+
+        :param surface: Surface to draw on
+        :type surface: pygame.surface.SurfaceType
+        :param x: Origin x position
+        :type x: int
+        :param y: Top of the line
+        :type y: int
+        :param text: Text
+        :type text: basestring
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :return: None
+        """
+        self._font.antialiased = bool(antialias)  # The FreeType font is shared
+        self._font.render_to(surface, (x, y + self._ascent), text, color, style=self._style, size=self._size)
+
+    def size(self, text):
+        """
+        Return the size of the rendered text.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width and height (px)
+        :rtype: tuple
+        """
+        return self._get_layout(text)[1], self._height
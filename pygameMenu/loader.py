@@ -0,0 +1,472 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+LOADER
+Build menus from a declarative definition (JSON file or dict).
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import pygameMenu.events as _events
+import pygameMenu.fonts as _fonts
+import pygameMenu.locals as _locals
+from pygameMenu.utils import get_cache_dir as _get_cache_dir
+from pygameMenu.utils import read_cache_file as _read_cache_file
+from pygameMenu.utils import write_cache_file as _write_cache_file
+
+# Version of the compiled definitions, change it if the compiled data changes
+_COMPILED_VERSION = 1
+
+# Options whose value can be the name of a constant of pygameMenu.locals
+_CONSTANT_OPTIONS = ('align', 'input_type', 'option_shadow_position', 'text_align', 'widget_alignment')
+
+# Menu options that are functions or events, resolved when the menus are built
+_CALLBACK_OPTIONS = ('bgfun', 'onchange', 'onclose', 'onreturn')
+
+# Keys of a menu object
+_MENU_KEYS = ('options', 'style', 'title', 'type', 'widgets')
+
+# Options given by the loader
+_RESERVED_OPTIONS = ('self', 'surface', 'title', 'kwargs')
+
+# Widget types, and the menu types that accept them
+_WIDGET_TYPES = {
+    'line': ('text',),
+    'option': ('menu', 'text'),
+    'selector': ('menu',),
+    'text_input': ('menu',),
+}
+
+
+class _Ref(object):
+    """
+    Reference to an object that is resolved when the menus are built: a
+    callback, an event or another menu.
+    """
+
+    def __init__(self, kind, name):
+        """
+        Constructor.
+
+        :param kind: 'callback', 'event' or 'menu'
+        :type kind: basestring
+        :param name: Name of the object
+        :type name: basestring
+        """
+        self.kind = kind
+        self.name = name
+
+
+def _get_arguments(cls):
+    """
+    Return the names of the constructor arguments of a menu class.
+
+    :param cls: Menu class
+    :type cls: type
+    :return: Argument names
+    :rtype: set
+    """
+    args = set()
+    for c in cls.__mro__:
+        init = c.__dict__.get('__init__')
+        if hasattr(init, '__code__'):  # Python functions, not object.__init__
+            code = init.__code__
+            args.update(code.co_varnames[:code.co_argcount])
+    return args
+
+
+def _check(condition, path, message):
+    """
+    Raise a ValueError if a condition of the definition fails.
+
+    :param condition: Condition
+    :type condition: bool
+    :param path: Location in the definition
+    :type path: basestring
+    :param message: Error message
+    :type message: basestring
+    :return: None
+    """
+    if not condition:
+        raise ValueError('Invalid menu definition at {0}: {1}'.format(path, message))
+
+
+def _compile_value(key, value, path):
+    """
+    Compile a menu or widget option.
+
+    :param key: Option name
+    :type key: basestring
+    :param value: Option value from the definition
+    :type value: object
+    :param path: Location in the definition
+    :type path: basestring
+    :return: Compiled value
+    :rtype: object
+    """
+    if key in ('font', 'font_title'):
+        if value is None:
+            return None
+        fonts = value if isinstance(value, list) else [value]
+        _check(len(fonts) > 0 and all(isinstance(f, str) for f in fonts), path,
+               'font must be a name or a list of names')
+        files = []
+        for font in fonts:
+            embedded = 'FONT_' + font.upper()
+            if hasattr(_fonts, embedded):
+                font = getattr(_fonts, embedded)
+            files.append(_fonts.get_font_file(font))  # Font discovery is stored in the compiled data
+        return files if isinstance(value, list) else files[0]
+    if key in _CALLBACK_OPTIONS:
+        if value is None:
+            return None
+        _check(isinstance(value, str), path, 'must be the name of a callback or an event')
+        event = value if value.startswith('PYGAMEMENU_') else 'PYGAMEMENU_' + value
+        if isinstance(getattr(_events, event, None), _events._PymenuAction):
+            return _Ref('event', event)
+        return _Ref('callback', value)
+    if key in _CONSTANT_OPTIONS:
+        _check(isinstance(value, str), path, 'must be a string')
+        if value.startswith('PYGAME'):
+            _check(hasattr(_locals, value), path, 'unknown constant {0}'.format(value))
+            return getattr(_locals, value)
+        return value
+    if isinstance(value, list):  # Colors and other tuples
+        return tuple(value)
+    return value
+
+
+def _compile_widget(widget, menu_type, menu_names, path):
+    """
+    Validate and compile a widget definition.
+
+    :param widget: Widget definition
+    :type widget: dict
+    :param menu_type: Type of the menu that contains the widget
+    :type menu_type: basestring
+    :param menu_names: Names of the menus of the definition
+    :type menu_names: list
+    :param path: Location in the definition
+    :type path: basestring
+    :return: Method name, arguments and keyword arguments
+    :rtype: tuple
+    """
+    _check(isinstance(widget, dict), path, 'widget must be an object')
+    wtype = widget.get('type')
+    _check(wtype in _WIDGET_TYPES, path, 'unknown widget type {0!r}'.format(wtype))
+    _check(menu_type in _WIDGET_TYPES[wtype], path, '{0} is not allowed in a {1} menu'.format(wtype, menu_type))
+
+    if wtype == 'line':
+        text = widget.get('text', '')
+        _check(isinstance(text, str), path, 'text must be a string')
+        if text.startswith('PYGAMEMENU_') and hasattr(_locals, text):
+            text = getattr(_locals, text)
+        return 'add_line', (text,), {}
+
+    label = widget.get('label')
+    _check(isinstance(label, str), path, 'label must be a string')
+    kwargs = {}
+    if 'align' in widget:
+        kwargs['align'] = _compile_value('align', widget['align'], path + '.align')
+
+    if wtype == 'option':
+        targets = [key for key in ('menu', 'event', 'callback') if key in widget]
+        _check(len(targets) == 1, path, 'option needs one of menu, event or callback')
+        target = targets[0]
+        name = widget[target]
+        _check(isinstance(name, str), path, '{0} must be a string'.format(target))
+        args = widget.get('args', [])
+        _check(isinstance(args, list), path, 'args must be a list')
+        if target == 'menu':
+            _check(name in menu_names, path, 'unknown menu {0!r}'.format(name))
+            element = _Ref('menu', name)
+        elif target == 'event':
+            element = _compile_value('onclose', name, path)
+            _check(element.kind == 'event', path, 'unknown event {0!r}'.format(name))
+        else:
+            element = _Ref('callback', name)
+        return 'add_option', (label, element) + tuple(args), kwargs
+
+    # Selectors and text inputs
+    for key in ('onchange', 'onreturn'):
+        if key in widget:
+            kwargs[key] = _compile_value(key, widget[key], '{0}.{1}'.format(path, key))
+    if 'id' in widget:
+        _check(isinstance(widget['id'], str), path, 'id must be a string')
+    kwargs.update(widget.get('kwargs', {}))
+
+    if wtype == 'selector':
+        values = widget.get('values')
+        _check(isinstance(values, list) and len(values) > 0, path, 'values must be a non empty list')
+        items = []
+        for value in values:
+            _check(isinstance(value, list) and len(value) > 0 and isinstance(value[0], str), path,
+                   'each value must be a list starting with its label')
+            items.append(tuple(value))
+        default = widget.get('default', 0)
+        _check(isinstance(default, int) and 0 <= default < len(items), path, 'default must be a value index')
+        kwargs['selector_id'] = widget.get('id', '')
+        kwargs['default'] = default
+        return 'add_selector', (label, items), kwargs
+
+    for key in ('maxchar', 'maxwidth'):
+        if key in widget:
+            _check(isinstance(widget[key], int) and widget[key] >= 0, path,
+                   '{0} must be a positive integer'.format(key))
+            kwargs[key] = widget[key]
+    if 'input_type' in widget:
+        kwargs['input_type'] = _compile_value('input_type', widget['input_type'], path + '.input_type')
+    kwargs['textinput_id'] = widget.get('id', '')
+    kwargs['default'] = widget.get('default', '')
+    return 'add_text_input', (label,), kwargs
+
+
+def compile_definition(definition):
+    """
+    Validate a menu definition and compile it to the data used to build the
+    menus, made of builtin types so it can be pickled.
+
+    Definition:
+        {
+            "root": "main",
+            "styles": {"dark": {"font": "BEBAS", "menu_color": [0, 0, 0]}},
+            "menus": {
+                "main": {
+                    "type": "menu",
+                    "title": "Main menu",
+                    "style": "dark",
+                    "options": {"font_size": 30, "onclose": "DISABLE_CLOSE"},
+                    "widgets": [
+                        {"type": "option", "label": "Play", "menu": "play"},
+                        {"type": "option", "label": "Start", "callback": "start", "args": [1]},
+                        {"type": "selector", "label": "Mode", "id": "mode", "values": [["Easy", 1]]},
+                        {"type": "text_input", "label": "Name: ", "id": "name", "onreturn": "set_name"},
+                        {"type": "option", "label": "Quit", "event": "EXIT"}
+                    ]
+                },
+                ...
+            }
+        }
+
+    Menu types are "menu" and "text" (TextMenu, accepts "line" widgets). The
+    options are the Menu/TextMenu constructor arguments, fonts are embedded
+    font names, files or system fonts, lists are converted to tuples,
+    callbacks (bgfun, onclose, onchange, onreturn) are names of callbacks or
+    events. Styles are options shared by several menus.
+
+    :param definition: Menu definition
+    :type definition: dict
+    :return: Compiled definition
+    :rtype: dict
+    """
+    from pygameMenu.menu import Menu
+    from pygameMenu.textmenu import TextMenu
+    arguments = {'menu': _get_arguments(Menu), 'text': _get_arguments(TextMenu)}
+
+    _check(isinstance(definition, dict), 'definition', 'must be an object')
+    menus = definition.get('menus')
+    _check(isinstance(menus, dict) and len(menus) > 0, 'menus', 'must be a non empty object')
+    styles = definition.get('styles', {})
+    _check(isinstance(styles, dict), 'styles', 'must be an object')
+    root = definition.get('root')
+    _check(root in menus, 'root', 'must be the name of a menu')
+
+    compiled = {}
+    for name in sorted(menus.keys()):
+        menu = menus[name]
+        path = 'menus.' + name
+        _check(isinstance(menu, dict), path, 'menu must be an object')
+        for key in menu.keys():
+            _check(key in _MENU_KEYS, path, 'unknown key {0!r}'.format(key))
+        mtype = menu.get('type', 'menu')
+        _check(mtype in arguments, path, 'unknown menu type {0!r}'.format(mtype))
+        _check(isinstance(menu.get('title'), str), path, 'title must be a string')
+
+        # Merge the styles and the options of the menu
+        options = {}
+        menu_styles = menu.get('style', [])
+        if not isinstance(menu_styles, list):
+            menu_styles = [menu_styles]
+        for style in menu_styles:
+            _check(style in styles and isinstance(styles[style], dict), path, 'unknown style {0!r}'.format(style))
+            options.update(styles[style])
+        _check(isinstance(menu.get('options', {}), dict), path, 'options must be an object')
+        options.update(menu.get('options', {}))
+        _check('font' in options, path, 'font is required')
+
+        kwargs = {}
+        for key in options.keys():
+            _check(key in arguments[mtype] and key not in _RESERVED_OPTIONS, path, 'unknown option {0!r}'.format(key))
+            kwargs[key] = _compile_value(key, options[key], '{0}.options.{1}'.format(path, key))
+
+        widgets = menu.get('widgets', [])
+        _check(isinstance(widgets, list), path, 'widgets must be a list')
+        compiled[name] = {
+            'type': mtype,
+            'title': menu['title'],
+            'kwargs': kwargs,
+            'widgets': [_compile_widget(widgets[i], mtype, menus, '{0}.widgets[{1}]'.format(path, i))
+                        for i in range(len(widgets))]
+        }
+
+    # Menus are built after their submenus
+    order = []
+    state = {}  # 1: visiting, 2: done
+
+    def visit(menu_name):
+        _check(state.get(menu_name) != 1, 'menus.' + menu_name, 'submenus cannot contain their parent menu')
+        if state.get(menu_name) == 2:
+            return
+        state[menu_name] = 1
+        for method, args, _ in compiled[menu_name]['widgets']:
+            if method == 'add_option' and args[1].kind == 'menu':
+                visit(args[1].name)
+        state[menu_name] = 2
+        order.append(menu_name)
+
+    for name in sorted(compiled.keys()):
+        visit(name)
+
+    return {'version': _COMPILED_VERSION, 'root': root, 'order': order, 'menus': compiled}
+
+
+def _load_compiled(definition):
+    """
+    Return the compiled definition of a JSON file, from the cache if the file
+    was already compiled, or of a dict.
+
+    :param definition: JSON file path or definition
+    :type definition: basestring, dict
+    :return: Compiled definition
+    :rtype: dict
+    """
+    if isinstance(definition, dict):
+        return compile_definition(definition)
+
+    with open(definition, 'rb') as f:
+        data = f.read()
+    key = _hashlib.sha1(data + 'v{0}'.format(_COMPILED_VERSION).encode()).hexdigest()
+    path = _os.path.join(_get_cache_dir(), 'menus_{0}.pickle'.format(key))
+    compiled = _read_cache_file(path)
+    if isinstance(compiled, dict) and compiled.get('version') == _COMPILED_VERSION:
+        fonts = []
+        for menu in compiled['menus'].values():
+            for key in ('font', 'font_title'):
+                value = menu['kwargs'].get(key)
+                fonts.extend(value if isinstance(value, list) else [value] if value else [])
+        if all(_os.path.isfile(font) for font in fonts):  # Fonts have not been moved
+            return compiled
+
+    compiled = compile_definition(_json.loads(data.decode('utf-8')))
+    try:
+        _write_cache_file(path, compiled)
+    except (IOError, OSError):  # Cache is not writable, compile it again the next time
+        pass
+    return compiled
+
+
+def _build(compiled, surface, callbacks):
+    """
+    Build the menus of a compiled definition.
+
+    :param compiled: Compiled definition
+    :type compiled: dict
+    :param surface: Pygame surface of the menus
+    :type surface: pygame.surface.SurfaceType
+    :param callbacks: Functions used by the definition, by name
+    :type callbacks: dict, NoneType
+    :return: Menus by name
+    :rtype: dict
+    """
+    from pygameMenu.menu import Menu
+    from pygameMenu.textmenu import TextMenu
+    classes = {'menu': Menu, 'text': TextMenu}
+
+    if callbacks is None:
+        callbacks = {}
+    menus = {}
+
+    def resolve(value):
+        if not isinstance(value, _Ref):
+            return value
+        if value.kind == 'event':
+            return getattr(_events, value.name)
+        if value.kind == 'menu':
+            return menus[value.name]
+        if value.name not in callbacks:
+            raise ValueError('Callback "{0}" of the menu definition was not given'.format(value.name))
+        return callbacks[value.name]
+
+    width, height = surface.get_size()
+    for name in compiled['order']:
+        data = compiled['menus'][name]
+        kwargs = {'window_width': width, 'window_height': height}
+        for key in data['kwargs'].keys():
+            kwargs[key] = resolve(data['kwargs'][key])
+        menu = classes[data['type']](surface, title=data['title'], **kwargs)
+        for method, args, widget_kwargs in data['widgets']:
+            widget_kwargs = dict((key, resolve(value)) for key, value in widget_kwargs.items())
+            getattr(menu, method)(*[resolve(arg) for arg in args], **widget_kwargs)
+        menus[name] = menu
+    return menus
+
+
+def load_menus(definition, surface, callbacks=None):
+    """
+    Build the menus of a declarative definition (see compile_definition).
+    JSON files are validated and compiled once, later loads of the same file
+    build the menus from the compiled cache.
+
+    :param definition: JSON file path or definition
+    :type definition: basestring, dict
+    :param surface: Pygame surface of the menus
+    :type surface: pygame.surface.SurfaceType
+    :param callbacks: Functions used by the definition, by name
+    :type callbacks: dict, NoneType
+    :return: Menus by name
+    :rtype: dict
+    """
+    return _build(_load_compiled(definition), surface, callbacks)
+
+
+def load_menu(definition, surface, callbacks=None):
+    """
+    Build the menus of a declarative definition and return the root menu.
+
+    :param definition: JSON file path or definition
+    :type definition: basestring, dict
+    :param surface: Pygame surface of the menus
+    :type surface: pygame.surface.SurfaceType
+    :param callbacks: Functions used by the definition, by name
+    :type callbacks: dict, NoneType
+    :return: Root menu
+    :rtype: pygameMenu.menu.Menu
+    """
+    compiled = _load_compiled(definition)
+    return _build(compiled, surface, callbacks)[compiled['root']]
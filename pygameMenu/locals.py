@@ -45,11 +45,26 @@ JOY_LEFT = (-1, 0)
 JOY_RIGHT = (1, 0)
 JOY_UP = (0, 1)
 
+# Control actions
+PYGAME_CTRL_BACK = '__pygameMenu_ctrl_back__'
+PYGAME_CTRL_CLOSE_MENU = '__pygameMenu_ctrl_close_menu__'
+PYGAME_CTRL_DOWN = '__pygameMenu_ctrl_down__'
+PYGAME_CTRL_ENTER = '__pygameMenu_ctrl_enter__'
+PYGAME_CTRL_LEFT = '__pygameMenu_ctrl_left__'
+PYGAME_CTRL_RIGHT = '__pygameMenu_ctrl_right__'
+PYGAME_CTRL_UP = '__pygameMenu_ctrl_up__'
+
 # Alignment
 PYGAME_ALIGN_CENTER = '__pygameMenu_align_center__'
 PYGAME_ALIGN_LEFT = '__pygameMenu_align_left__'
 PYGAME_ALIGN_RIGHT = '__pygameMenu_align_right__'
 
+# Font renderers
+PYGAME_RENDERER_ATLAS = '__pygameMenu_renderer_atlas__'
+PYGAME_RENDERER_FONT = '__pygameMenu_renderer_font__'
+PYGAME_RENDERER_FREETYPE = '__pygameMenu_renderer_freetype__'
+PYGAME_RENDERER_PIXEL = '__pygameMenu_renderer_pixel__'
+
 # Input data type
 PYGAME_INPUT_FLOAT = '__pygameMenu_input_float__'
 PYGAME_INPUT_INT = '__pygameMenu_input_int__'
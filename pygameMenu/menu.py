@@ -31,22 +31,49 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 # Import constants
+from pygameMenu.controls import ControlMap as _ControlMap
 from pygameMenu.sound import Sound as _Sound
-import pygameMenu.config_controls as _ctrl
 import pygameMenu.config_menu as _cfg
 import pygameMenu.events as _events
 import pygameMenu.fonts as _fonts
 import pygameMenu.locals as _locals
+import pygameMenu.utils as _utils
 
 # Library imports
 import pygameMenu.widgets as _widgets
 import pygame as _pygame
 import pygame.gfxdraw as _gfxdraw
 import types
+import weakref as _weakref
+
+from array import array as _array
+from bisect import bisect_right as _bisect_right
+from itertools import count as _count
 
 # exit program
 from sys import exit
 
+# Surface.blits() was added in pygame 1.9.4
+_BLITS = hasattr(_pygame.Surface, 'blits')
+
+_SDL_EVENT_TYPES = []  # Event types known by SDL, computed on first use
+
+_open_count = _count(1)  # Order in which the menus are opened
+
+
+def _get_sdl_event_types():
+    """
+    Return the event types that SDL can generate, user events are excluded.
+
+    :return: List of event types
+    :rtype: list
+    """
+    if len(_SDL_EVENT_TYPES) == 0:
+        for event_type in range(1, _pygame.USEREVENT):
+            if _pygame.event.event_name(event_type) != 'Unknown':
+                _SDL_EVENT_TYPES.append(event_type)
+    return _SDL_EVENT_TYPES
+
 
 # noinspection PyBroadException,PyProtectedMember,PyArgumentEqualDefault
 class Menu(object):
@@ -63,11 +90,13 @@ class Menu(object):
                  back_box=True,
                  bgfun=None,
                  color_selected=_cfg.MENU_SELECTEDCOLOR,
+                 control_map=None,
                  dopause=True,
                  draw_region_x=_cfg.MENU_DRAW_X,
                  draw_region_y=_cfg.MENU_DRAW_Y,
                  draw_select=_cfg.MENU_SELECTED_DRAW,
                  enabled=True,
+                 filter_events=False,
                  font_color=_cfg.MENU_FONT_COLOR,
                  font_size=_cfg.MENU_FONT_SIZE,
                  font_size_title=_cfg.MENU_FONT_SIZE_TITLE,
@@ -99,8 +128,8 @@ class Menu(object):
         :type window_width: int
         :param window_height: Window height size (px)
         :type window_height: int
-        :param font: Font file path
-        :type font: basestring
+        :param font: Font file path, or list of fonts where each character is rendered with the first one that has it
+        :type font: basestring, list, tuple
         :param title: Title of the menu (main title)
         :type title: basestring
         :param back_box: Draw a back-box button on header
@@ -109,6 +138,8 @@ class Menu(object):
         :type bgfun: function
         :param color_selected: Color of selected item
         :type color_selected: tuple
+        :param control_map: Map of controls, if None the default controls are used
+        :type control_map: pygameMenu.controls.ControlMap, NoneType
         :param dopause: Pause game
         :type dopause: bool
         :param draw_region_x: Drawing position of element inside menu (x-axis)
@@ -119,6 +150,8 @@ class Menu(object):
         :type draw_select: bool
         :param enabled: Menu is enabled by default or not
         :type enabled: bool
+        :param filter_events: Block the events not used by the menu while a pausing menu is running
+        :type filter_events: bool
         :param fps: FPS of the menu
         :type fps: int, float
         :param font_color: Color of font
@@ -127,8 +160,8 @@ class Menu(object):
         :type font_size: int
         :param font_size_title: Font size of the title
         :type font_size_title: int
-        :param font_title: Alternative font of the title (file path)
-        :type font_title: basestring
+        :param font_title: Alternative font of the title (file path or list of fonts)
+        :type font_title: basestring, list, tuple
         :param joystick_enabled: Enable/disable joystick on menu
         :type joystick_enabled: bool
         :param menu_alpha: Alpha of background (0=transparent, 100=opaque)
@@ -164,20 +197,22 @@ class Menu(object):
         """
         assert isinstance(window_width, int)
         assert isinstance(window_height, int)
-        assert isinstance(font, str)
+        assert isinstance(font, (str, list, tuple))
         assert isinstance(title, str)
 
         assert isinstance(back_box, bool)
         assert isinstance(color_selected, tuple)
+        assert isinstance(control_map, (_ControlMap, type(None)))
         assert isinstance(dopause, bool)
         assert isinstance(draw_region_x, int)
         assert isinstance(draw_region_y, int)
         assert isinstance(draw_select, bool)
         assert isinstance(enabled, bool)
+        assert isinstance(filter_events, bool)
         assert isinstance(font_color, tuple)
         assert isinstance(font_size, int)
         assert isinstance(font_size_title, int)
-        assert isinstance(font_title, (str, type(None)))
+        assert isinstance(font_title, (str, list, tuple, type(None)))
         assert isinstance(joystick_enabled, bool)
         assert isinstance(menu_alpha, int)
         assert isinstance(menu_color, tuple)
@@ -217,6 +252,9 @@ class Menu(object):
 
         # Store configuration
         self._bgfun = bgfun
+        if control_map is None:
+            control_map = _ControlMap()
+        self._control_map = control_map
         self._bgcolor = (menu_color[0], menu_color[1], menu_color[2],
                          int(255 * (1 - (100 - menu_alpha) / 100.0)))
 
@@ -230,24 +268,45 @@ class Menu(object):
         self._option_shadow_position = option_shadow_position
         self._rect_width = rect_width
         self._sel_color = color_selected
-        self._surface = surface
+        self._surface = surface  # Surface where the menu is drawn
         self._width = menu_width
+        self._window = surface  # Target surface
+        self._window_display = surface is _pygame.display.get_surface()
+        self._window_size = (window_width, window_height)
 
         # Inner variables
         self._actual = self  # Actual menu
+        self._blocked_events = []  # Event types blocked while the menu is running
+        self._cache_budget = None  # Memory budget of the cached surfaces of the menu tree (bytes)
         self._clock = _pygame.time.Clock()  # Inner clock
         self._closelocked = False  # Lock close until next mainloop
+        self._display_list = []  # Blit of each option (surface, position)
+        self._display_list_versions = []  # Widget and render version of each blit
         self._dopause = dopause  # Pause or not
         self._enabled = enabled  # Menu is enabled or not
+        self._filter_events = filter_events  # Block unused events while paused
+        self._hit_tops = _array('i')  # Top of each option rect, sorted by layout
         self._index = 0  # Selected index
         self._fps = 0
+        self._last_open = 0  # Order of the last time the menu was opened
+        self._logical = None  # Offscreen surface at logical resolution, allocated on first draw
+        self._logical_enabled = False  # Draw the menu at logical resolution
+        self._logical_pos = (0, 0)  # Position of the scaled menu on the target surface
+        self._logical_scaled = None  # Scaled menu
+        self._logical_smooth = True  # Use smoothscale
+        self._logical_state = None  # Selected widget and overlay of the offscreen surface
+        self._logical_transform = (1.0, 0, 0)  # Scale and offset of the logical resolution
+        self._logical_window_size = None  # Target size of the scaled menu
         self._onclose = onclose  # Function that calls after closing menu
         self._option = []  # Option menu
-        self._prev = None  # Previous menu
-        self._prev_draw = None  # Previous menu drawing function
         self._size = 0  # Menu total elements
+        self._snapshot = None  # Captured background
+        self._snapshot_blur = 0  # Blur radius of the captured background (px)
+        self._snapshot_dim = 0  # Darkening of the captured background
+        self._stack = _MenuStack(self)  # Opened menus, if the menu is the top level menu
+        self._snapshot_enabled = False  # Capture bgfun once instead of calling it every frame
         self._sounds = _Sound()
-        self._submenus = []  # List of all linked menus
+        self._submenus = []  # List of all linked menus and menu factories
         self._top = None  # Top level menu
         self.set_fps(fps)  # FPS of the menu
 
@@ -261,6 +320,7 @@ class Menu(object):
                         (self._posx + self._width, self._posy),
                         (self._posx + self._width, self._posy + self._height),
                         (self._posx, self._posy + self._height)]
+        self._rect = _pygame.Rect(int(self._posx), int(self._posy), self._width, self._height)
         self._draw_regionx = draw_region_x
         self._draw_regiony = draw_region_y
 
@@ -288,6 +348,7 @@ class Menu(object):
         self._menubar.set_font(font_title, font_size_title,
                                bg_color_title, self._font_color)
         self._menubar.set_controls(self._joystick, self._mouse)
+        self._menubar.set_control_map(self._control_map)
 
     def add_option(self, element_name, element, *args, **kwargs):
         """
@@ -298,8 +359,8 @@ class Menu(object):
 
         :param element_name: Name of the element
         :type element_name: basestring
-        :param element: Object
-        :type element: Menu, _PymenuAction, function
+        :param element: Object, submenus can be built on first open with a MenuFactory
+        :type element: Menu, MenuFactory, _PymenuAction, function
         :param args: Aditional arguments used by a function
         :param kwargs: Additional keyword arguments
         :return: Widget object
@@ -311,9 +372,10 @@ class Menu(object):
         if self._size > 1:
             dy = -self._fsize / 2 - self._opt_dy / 2
             self._opt_posy += dy
+            self._invalidate_layout()
 
         # If element is a Menu
-        if isinstance(element, Menu):
+        if isinstance(element, (Menu, MenuFactory)):
             self._submenus.append(element)
             widget = _widgets.Button(element_name, None, self._open, element)
         # If option is a PyMenuAction
@@ -330,7 +392,7 @@ class Menu(object):
         elif isinstance(element, (types.FunctionType, types.MethodType)) or callable(element):
             widget = _widgets.Button(element_name, None, element, *args)
         else:
-            raise ValueError('Element must be a Menu, a PymenuAction or a function')
+            raise ValueError('Element must be a Menu, a MenuFactory, a PymenuAction or a function')
 
         widget.set_font(self._font, self._fsize,
                         self._font_color, self._sel_color)
@@ -339,6 +401,7 @@ class Menu(object):
                           position=self._option_shadow_position,
                           offset=self._option_shadow_offset)
         widget.set_controls(self._joystick, self._mouse)
+        widget.set_control_map(self._control_map)
         widget.set_alignment(kwargs.pop('align', self._widget_align))
 
         self._option.append(widget)
@@ -357,6 +420,11 @@ class Menu(object):
         Values of the selector are like:
             values = [('Item1', a, b, c...), ('Item2', a, b, c..)]
 
+        Values can also be a lazy provider, whose elements are generated
+        when displayed: a range, an object with __len__ and __getitem__, or a
+        function returning one of them. Items that are not tuples are labeled
+        with their string, e.g. range(101) gives ('0', 0), ('1', 1)...
+
         And functions onchange and onreturn does
             onchange(a, b, c..., **kwargs)
             onreturn(a, b, c..., **kwargs)
@@ -364,7 +432,7 @@ class Menu(object):
         :param title: Title of the selector
         :type title: basestring
         :param values: Values of the selector [('Item1', var1..), ('Item2'...)]
-        :type values: list
+        :type values: list, tuple, range, object, function
         :param selector_id: ID of the selector
         :type selector_id: basestring
         :param default: Index of default value to display
@@ -379,13 +447,14 @@ class Menu(object):
         :return: Widget object
         :rtype: pygameMenu.widgets.selector.Selector
         """
-        # Check value list
-        for vl in values:
-            assert len(vl) >= 1, \
-                'Length of each element in value list must be greater than 1'
-            assert isinstance(vl[0], str), \
-                'First element of value list component must be a string'
-        assert default < len(values), 'default position should be lower than number of values'
+        # Check value list, lazy providers are not evaluated
+        if isinstance(values, (list, tuple)):
+            for vl in values:
+                assert len(vl) >= 1, \
+                    'Length of each element in value list must be greater than 1'
+                assert isinstance(vl[0], str), \
+                    'First element of value list component must be a string'
+            assert default < len(values), 'default position should be lower than number of values'
         assert isinstance(selector_id, str), 'id must be a string'
         assert isinstance(default, int), 'default must be integer'
         assert isinstance(align, str), 'align must be a string'
@@ -396,6 +465,7 @@ class Menu(object):
         if self._size > 1:
             dy = -self._fsize / 2 - self._opt_dy / 2
             self._opt_posy += dy
+            self._invalidate_layout()
 
         # Create widget
         widget = _widgets.Selector(title, values, selector_id, default,
@@ -410,6 +480,7 @@ class Menu(object):
                           position=self._option_shadow_position,
                           offset=self._option_shadow_offset)
         widget.set_controls(self._joystick, self._mouse)
+        widget.set_control_map(self._control_map)
         widget.set_alignment(align)
 
         # Store widget
@@ -457,6 +528,7 @@ class Menu(object):
         if self._size > 1:
             dy = -self._fsize / 2 - self._opt_dy / 2
             self._opt_posy += dy
+            self._invalidate_layout()
         if align == '':
             align = self._widget_align
 
@@ -484,6 +556,7 @@ class Menu(object):
                           position=self._option_shadow_position,
                           offset=self._option_shadow_offset)
         widget.set_controls(self._joystick, self._mouse)
+        widget.set_control_map(self._control_map)
         widget.set_alignment(align)
 
         # Store widget
@@ -493,11 +566,44 @@ class Menu(object):
 
         return widget
 
+    def _apply_submenus(self, method, *args, **kwargs):
+        """
+        Call a method on all the submenus. Submenus that have not been built
+        record the call and apply it when they are built.
+
+        :param method: Method name
+        :type method: basestring
+        :param args: Method arguments
+        :param kwargs: Method keyword arguments
+        :return: None
+        """
+        for menu in self._submenus:
+            if isinstance(menu, MenuFactory):
+                menu.apply(method, args, kwargs)
+            else:
+                getattr(menu, method)(*args, **kwargs)
+
+    def _get_submenus(self):
+        """
+        Return the submenus that have been built.
+
+        :return: Submenus
+        :rtype: list
+        """
+        menus = []
+        for menu in self._submenus:
+            if isinstance(menu, MenuFactory):
+                if not menu.is_built():
+                    continue
+                menu = menu.get_menu()
+            menus.append(menu)
+        return menus
+
     def _back(self):
         """
         Go to previous menu or close if top menu is currently displayed.
         """
-        if self._top._actual._prev is not None:
+        if len(self._top._stack) > 1:
             self.reset(1)
         else:
             self._close()
@@ -558,31 +664,361 @@ class Menu(object):
 
     def draw(self):
         """
-        Draw menu to surface.
+        Draw menu to surface, or the opened submenu if the menu is the top
+        level menu.
+
+        :return: None
+        """
+        self._actual._draw()
+
+    def _draw(self):
+        """
+        Draw the menu to surface.
 
+        :return: None
+        """
+        selected, changed = self._update_display_list()
+        if not self._logical_enabled:
+            self._draw_menu(selected)
+            return
+
+        # Allocate the offscreen surface only for the menus that are drawn
+        if self._logical is None:
+            # noinspection PyArgumentList
+            self._logical = _pygame.Surface(self._window_size, _pygame.SRCALPHA, 32)
+            self._logical.fill((0, 0, 0, 0))
+            self._logical_state = None
+            self._surface = self._logical
+
+        # Draw the menu at logical resolution if something changed
+        state = (selected, self._menubar._render_version,
+                 selected._overlay_state() if selected is not None else None)
+        rect = self._get_logical_rect()
+        if changed or state != self._logical_state:
+            self._logical_state = state
+            self._logical_scaled = None
+            self._logical.fill((0, 0, 0, 0), rect)
+            self._draw_menu(selected)
+
+        # Scale the menu to the target surface, keeping the aspect ratio
+        window_size = self._window.get_size()
+        if self._logical_scaled is None or window_size != self._logical_window_size:
+            self._logical_window_size = window_size
+            scale = min(float(window_size[0]) / self._logical.get_width(),
+                        float(window_size[1]) / self._logical.get_height())
+            offsetx = (window_size[0] - scale * self._logical.get_width()) / 2
+            offsety = (window_size[1] - scale * self._logical.get_height()) / 2
+            self._logical_transform = (scale, offsetx, offsety)
+            size = (max(1, int(rect.width * scale)), max(1, int(rect.height * scale)))
+            menu = self._logical.subsurface(rect)
+            if self._logical_smooth:
+                scaled = _pygame.transform.smoothscale(menu, size)
+            else:
+                scaled = _pygame.transform.scale(menu, size)
+            self._logical_scaled = _utils.convert_surface(scaled)
+            self._logical_pos = (int(offsetx + rect.x * scale), int(offsety + rect.y * scale))
+        self._window.blit(self._logical_scaled, self._logical_pos)
+
+    def _update_display_list(self):
+        """
+        Update the blits of the options that changed since last frame.
+
+        :return: Selected widget (None if there are no options), and True if the display list changed
+        :rtype: tuple
+        """
+        changed = False
+
+        # Rebuild the display list and hit-test index if options were added
+        if len(self._display_list) != len(self._option):
+            self._hit_tops = _array('i', [0]) * len(self._option)
+            self._display_list = [None] * len(self._option)
+            self._display_list_versions = [None] * len(self._option)
+            changed = True
+
+        selected = None
+        for index in range(len(self._option)):
+            widget = self._option[index]
+            if widget.selected:
+                selected = widget
+            version = self._display_list_versions[index]
+            if version is not None and version[0] is widget and version[1] == widget._render_version:
+                continue
+
+            # Update widget position and hit-test index
+            widget.set_position(*self._get_option_pos(index))
+            rect = widget.get_rect()
+            self._hit_tops[index] = rect.y
+            self._display_list[index] = (widget.get_surface(), rect.topleft)
+            self._display_list_versions[index] = (widget, widget._render_version)
+            changed = True
+
+        return selected, changed
+
+    def _draw_menu(self, selected):
+        """
+        Draw the menu background, title and options to the menu surface.
+
+        :param selected: Selected widget
+        :type selected: pygameMenu.widgets.widget.Widget, NoneType
         :return: None
         """
         # Draw background rectangle
-        _gfxdraw.filled_polygon(self._surface, self._bgrect, self._bgcolor)
+        if not self._logical_enabled:
+            _gfxdraw.filled_polygon(self._surface, self._bgrect, self._bgcolor)
+        else:  # Blending with the transparent offscreen surface would darken the color
+            self._surface.fill(self._bgcolor, self._get_logical_rect())
 
         # Update menu bar position
         self._menubar.set_position(self._posx, self._posy)
         self._menubar.draw(self._surface)
 
-        # Draw options
-        for index in range(len(self._option)):
-            widget = self._option[index]
+        # Draw options within the menu
+        clip = self._surface.get_clip()
+        self._surface.set_clip(self._rect)
+        if _BLITS:
+            self._surface.blits(self._display_list, False)
+        else:
+            for blit in self._display_list:
+                self._surface.blit(*blit)
+
+        # Draw the selected option parts changing every frame, and a rectangle
+        if selected is not None:
+            selected.draw_overlay(self._surface)
+            if self._drawselrect:
+                _pygame.draw.rect(self._surface, self._sel_color, selected.get_rect().inflate(16, 4),
+                                  self._rect_width)
+        self._surface.set_clip(clip)
+
+    def set_logical_resolution(self, enabled=True, smooth=True, recursive=True):
+        """
+        Draw the menu on an offscreen surface at its logical resolution (the
+        window size given to the constructor), and present it scaled to the
+        size of the target surface with a single blit, keeping the aspect
+        ratio. The scaled menu is reused while nothing changes; mouse
+        positions are mapped back to logical coordinates.
 
-            # Update widget position
-            widget.set_position(*self._get_option_pos(index))
+        :param enabled: Enable logical resolution
+        :type enabled: bool
+        :param smooth: Use smoothscale instead of scale
+        :type smooth: bool
+        :param recursive: Set to all the submenus
+        :type recursive: bool
+        :return: None
+        """
+        assert isinstance(enabled, bool)
+        assert isinstance(smooth, bool)
+        assert isinstance(recursive, bool)
+        self._logical = None
+        self._logical_enabled = enabled
+        self._surface = self._window
+        self._logical_scaled = None
+        self._logical_smooth = smooth
+        self._logical_state = None
+        self._logical_transform = (1.0, 0, 0)
+        if recursive:
+            self._apply_submenus('set_logical_resolution', enabled, smooth, recursive=True)
+
+    def _get_logical_rect(self):
+        """
+        Return the menu area of the offscreen surface, the background polygon
+        includes its right and bottom edges.
+
+        :return: Menu area
+        :rtype: pygame.rect.RectType
+        """
+        rect = _pygame.Rect(self._rect.x, self._rect.y, self._rect.width + 1, self._rect.height + 1)
+        return rect.clip(_pygame.Rect((0, 0), self._window_size))
+
+    def _to_logical(self, events):
+        """
+        Map the position of mouse events from the target surface to the
+        logical resolution.
+
+        :param events: Pygame events
+        :type events: list
+        :return: Events with mapped positions
+        :rtype: list
+        """
+        scale, offsetx, offsety = self._logical_transform
+        mapped = []
+        for event in events:
+            if event.type in (_pygame.MOUSEBUTTONDOWN, _pygame.MOUSEBUTTONUP, _pygame.MOUSEMOTION):
+                data = dict(event.dict)
+                data['pos'] = (int((event.pos[0] - offsetx) / scale), int((event.pos[1] - offsety) / scale))
+                event = _pygame.event.Event(event.type, data)
+            mapped.append(event)
+        return mapped
+
+    def set_cache_budget(self, budget=None):
+        """
+        Set the memory budget of the cached surfaces of the menu tree. If the
+        built menus use more memory when a menu is opened, the caches of the
+        least recently opened menus are cleared until the budget is met; the
+        menu being displayed is never cleared. Set it on the main menu.
+
+        :param budget: Budget (bytes), None if unlimited
+        :type budget: int, NoneType
+        :return: None
+        """
+        assert isinstance(budget, (int, type(None)))
+        assert budget is None or budget >= 0, 'budget must be greater or equal than zero'
+        self._cache_budget = budget
+        self._check_cache_budget()
+
+    def get_cache_size(self, recursive=False):
+        """
+        Return the memory used by the cached surfaces of the menu.
+
+        :param recursive: Add the built submenus
+        :type recursive: bool
+        :return: Size (bytes)
+        :rtype: int
+        """
+        assert isinstance(recursive, bool)
+        if recursive:
+            return sum(menu.get_cache_size() for menu in self._get_menu_tree())
+        size = self._menubar.get_cache_size()
+        size += _utils.get_surface_bytes(self._logical) + _utils.get_surface_bytes(self._logical_scaled)
+        for widget in self._option:
+            size += widget.get_cache_size()
+        return size
+
+    def clear_cache(self, recursive=False):
+        """
+        Clear the cached surfaces of the menu, they are rendered again when
+        the menu is drawn.
+
+        :param recursive: Clear the built submenus
+        :type recursive: bool
+        :return: None
+        """
+        assert isinstance(recursive, bool)
+        if recursive:
+            for menu in self._get_menu_tree():
+                menu.clear_cache()
+            return
+        self._menubar.clear_cache()
+        for widget in self._option:
+            widget.clear_cache()
+        self._display_list = []  # Built again on next draw
+        self._logical = None  # Allocated again on next draw
+        self._logical_scaled = None
+        if self._logical_enabled:
+            self._surface = self._window
+        self._logical_state = None
+
+    def _get_menu_tree(self):
+        """
+        Return the menu and all its built submenus, each once.
+
+        :return: Menus
+        :rtype: list
+        """
+        menus = [self]
+        found = {id(self)}
+        i = 0
+        while i < len(menus):
+            for menu in menus[i]._get_submenus():
+                if id(menu) not in found:
+                    found.add(id(menu))
+                    menus.append(menu)
+            i += 1
+        return menus
+
+    def _check_cache_budget(self):
+        """
+        Clear the caches of the least recently opened menus of the tree until
+        the budget of the top menu is met.
+
+        :return: None
+        """
+        top = self._top if self._top is not None else self
+        if top._cache_budget is None:
+            return
+        menus = top._get_menu_tree()
+        opened = set(id(menu) for menu in top._stack)  # Kept so going back is instant
+        sizes = [menu.get_cache_size() for menu in menus]
+        total = sum(sizes)
+        if total <= top._cache_budget:
+            return
+        order = sorted(range(len(menus)), key=lambda i: menus[i]._last_open)
+        for i in order:
+            if id(menus[i]) in opened or sizes[i] == 0:
+                continue
+            menus[i].clear_cache()
+            total -= sizes[i]
+            if total <= top._cache_budget:
+                break
+
+    def _resize(self, window_width, window_height):
+        """
+        Update the layout after the window has been resized. Menus drawn at
+        logical resolution are only scaled again, others are moved to the
+        center of the new window.
+
+        :param window_width: Window width (px)
+        :type window_width: int
+        :param window_height: Window height (px)
+        :type window_height: int
+        :return: None
+        """
+        if self._window_display:  # The display surface may be a new object
+            self._window = _pygame.display.get_surface()
+            if not self._logical_enabled:
+                self._surface = self._window
+        if self._logical_enabled:
+            self._logical_scaled = None
+        else:
+            self._move((window_width - self._width) / 2 - self._posx,
+                       (window_height - self._height) / 2 - self._posy)
+        self._apply_submenus('_resize', window_width, window_height)
+
+    def _move(self, dx, dy):
+        """
+        Move the menu, options are laid out again on the next frame.
+
+        :param dx: X displacement (px)
+        :type dx: int, float
+        :param dy: Y displacement (px)
+        :type dy: int, float
+        :return: None
+        """
+        self._posx += dx
+        self._posy += dy
+        self._bgrect = [(x + dx, y + dy) for (x, y) in self._bgrect]
+        self._rect = _pygame.Rect(int(self._posx), int(self._posy), self._width, self._height)
+        self._opt_posx += dx
+        self._opt_posy += dy
+        self._invalidate_layout()
+
+    def _invalidate_layout(self):
+        """
+        Mark the layout as changed, options are positioned again and the menu
+        is drawn again on the next frame. Called when the options move.
 
-            # Draw widget
-            widget.draw(self._surface)
+        :return: None
+        """
+        self._display_list_versions = [None] * len(self._display_list)
+        self._logical_state = None
+
+    def _get_option_index_at(self, pos):
+        """
+        Return the index of the option that collides with the given position.
+        Options are laid out vertically, so the index of rectangle tops built
+        by ``draw()`` is sorted and can be bisected.
+
+        :param pos: Position (x, y)
+        :type pos: tuple
+        :return: Option index, -1 if no option collides
+        :rtype: int
+        """
+        index = _bisect_right(self._hit_tops, pos[1]) - 1
 
-            # If selected item then draw a rectangle
-            if self._drawselrect and widget.selected:
-                rect = widget.get_rect()
-                _pygame.draw.rect(self._surface, self._sel_color, rect.inflate(16, 4), self._rect_width)
+        # Check the candidate and the previous option, in case rects overlap
+        for i in (index, index - 1):
+            if 0 <= i < len(self._option) and self._option[i].get_rect().collidepoint(*pos):
+                return i
+        return -1
 
     def _get_option_pos(self, index):
         """
@@ -658,15 +1094,20 @@ class Menu(object):
         """
         if events is None:
             events = _pygame.event.get()
+        if self._actual._logical_enabled:
+            events = self._actual._to_logical(events)
 
         if self._actual._dopause:  # If menu pauses game then apply function
-            self._bgfun()
+            if self._snapshot_enabled:
+                self._draw_snapshot()
+            else:
+                self._bgfun()
 
         # Clock tick
         self._actual._clock.tick(self._fps)
 
         # Draw the menu
-        self._actual.draw()
+        self._actual._draw()
 
         # Process events, first check widgets, then the menu
         if self._actual._menubar.update(events):
@@ -678,46 +1119,50 @@ class Menu(object):
                 return True
 
         else:
+            hover_pos = None  # Motion events are coalesced, only last one is used
+
             for event in events:
                 # noinspection PyUnresolvedReferences
                 if event.type == _pygame.locals.QUIT:
                     self._exit()
 
-                elif event.type == _pygame.locals.KEYDOWN:
-                    if event.key == _ctrl.MENU_CTRL_DOWN:
+                elif event.type in (_pygame.KEYDOWN, _pygame.JOYBUTTONDOWN, _pygame.JOYHATMOTION,
+                                    _pygame.JOYAXISMOTION):
+                    action = self._actual._control_map.get_action(event, self._joystick)
+                    if action == _locals.PYGAME_CTRL_DOWN:
                         self._select(self._actual._index - 1)
                         self._sounds.play_key_add()
-                    elif event.key == _ctrl.MENU_CTRL_UP:
+                    elif action == _locals.PYGAME_CTRL_UP:
                         self._select(self._actual._index + 1)
                         self._sounds.play_key_add()
-                    elif event.key == _ctrl.MENU_CTRL_BACK and self._actual._prev is not None:
+                    elif action == _locals.PYGAME_CTRL_BACK and len(self._stack) > 1:
                         self._sounds.play_close_menu()
                         self.reset(1)
-                    elif event.key == _ctrl.MENU_CTRL_CLOSE_MENU and not self._closelocked:
+                    elif action == _locals.PYGAME_CTRL_CLOSE_MENU and not self._closelocked:
                         self._sounds.play_close_menu()
                         if self._close():
                             return True
 
-                elif self._joystick and event.type == _pygame.JOYHATMOTION:
-                    if event.value == _locals.JOY_UP:
-                        self._select(self._actual._index + 1)
-                    elif event.value == _locals.JOY_DOWN:
-                        self._select(self._actual._index - 1)
-
-                elif self._joystick and event.type == _pygame.JOYAXISMOTION:
-                    if event.axis == _locals.JOY_AXIS_Y and event.value < -_locals.JOY_DEADZONE:
-                        self._select(self._actual._index - 1)
-                    if event.axis == _locals.JOY_AXIS_Y and event.value > _locals.JOY_DEADZONE:
-                        self._select(self._actual._index + 1)
-
                 elif self._mouse and event.type == _pygame.MOUSEBUTTONUP:
                     self._sounds.play_click_mouse()
-                    for index in range(len(self._actual._option)):
-                        widget = self._actual._option[index]
-                        if widget.get_rect().collidepoint(*event.pos):
-                            self._select(index)
-                            widget.update(events)
-                            return True  # It is updated
+                    index = self._actual._get_option_index_at(event.pos)
+                    if index != -1:
+                        self._select(index)
+                        self._actual._option[index].update(events)
+                        return True  # It is updated
+
+                elif self._mouse and event.type == _pygame.MOUSEMOTION:
+                    hover_pos = event.pos
+
+                elif event.type == _pygame.VIDEORESIZE:
+                    self._resize(event.w, event.h)
+
+            # Select the option below the mouse
+            if hover_pos is not None:
+                index = self._actual._get_option_index_at(hover_pos)
+                if index != -1 and index != self._actual._index:
+                    self._select(index)
+                    self._sounds.play_key_add()
 
         if not self._enabled:
             # A widget has closed the menu
@@ -740,18 +1185,117 @@ class Menu(object):
         if self.is_disabled():
             return
         if self._actual._dopause:
-            while True:
-                if self._main():
-                    return
+            self._snapshot = None  # Capture the background again
+            blocked = []
+            if self._filter_events:
+                blocked = self._block_events()
+            self._blocked_events = blocked  # Submenus built later allow their events
+            try:
+                while True:
+                    if self._main():
+                        return
+            finally:
+                # Restore the events, unless the application has been closed
+                if len(blocked) > 0 and _pygame.display.get_init():
+                    _pygame.event.set_allowed(blocked)
+                self._blocked_events = []
         else:
             self._main(events)
 
+    def _draw_snapshot(self):
+        """
+        Draw the captured background. It is captured from bgfun on first use,
+        or if the surface has been resized.
+
+        :return: None
+        """
+        if self._snapshot is None or self._snapshot.get_size() != self._window.get_size():
+            self._bgfun()
+            snapshot = _utils.blur_surface(self._window, self._snapshot_blur)
+            _utils.dim_surface(snapshot, self._snapshot_dim)
+            self._snapshot = _utils.convert_surface(snapshot)
+        self._window.blit(self._snapshot, (0, 0))
+
+    def refresh_background(self):
+        """
+        Capture the background again from bgfun on the next frame, used if
+        background snapshot is enabled.
+
+        :return: None
+        """
+        self._snapshot = None
+
+    def set_background_snapshot(self, enabled=True, dim=0, blur=0):
+        """
+        Draw a snapshot of the background behind the menu instead of calling
+        bgfun on every frame. Bgfun is called once when the menu is opened, the
+        result is captured (optionally darkened and blurred) and drawn on each
+        frame. It is captured again if the surface is resized, or after
+        refresh_background().
+
+        :param enabled: Enable background snapshot
+        :type enabled: bool
+        :param dim: Fraction of the brightness removed from the snapshot, between 0 and 1
+        :type dim: float, int
+        :param blur: Blur radius of the snapshot (px)
+        :type blur: int
+        :return: None
+        """
+        assert isinstance(enabled, bool)
+        assert isinstance(dim, (float, int))
+        assert isinstance(blur, int)
+        assert 0 <= dim <= 1, 'dim must be between 0 and 1'
+        assert blur >= 0, 'blur must be equal or greater than zero'
+        self._snapshot = None
+        self._snapshot_blur = blur
+        self._snapshot_dim = dim
+        self._snapshot_enabled = enabled
+
+    def _block_events(self):
+        """
+        Block the event types that are not used by the menu tree.
+
+        :return: List of event types that were allowed before and have been blocked
+        :rtype: list
+        """
+        used = self.get_event_types(recursive=True)
+        blocked = []
+        for event_type in _get_sdl_event_types():
+            if event_type not in used and not _pygame.event.get_blocked(event_type):
+                blocked.append(event_type)
+        if len(blocked) > 0:
+            _pygame.event.set_blocked(blocked)
+        return blocked
+
+    def get_event_types(self, recursive=False):
+        """
+        Return the event types used by the menu and its widgets.
+
+        :param recursive: Also add the events used by the submenus
+        :type recursive: bool
+        :return: Event types
+        :rtype: set
+        """
+        assert isinstance(recursive, bool)
+        event_types = {_pygame.QUIT, _pygame.KEYDOWN, _pygame.KEYUP, _pygame.VIDEORESIZE}
+        if self._joystick:
+            event_types.update((_pygame.JOYAXISMOTION, _pygame.JOYBUTTONDOWN, _pygame.JOYHATMOTION))
+        if self._mouse:
+            event_types.update((_pygame.MOUSEBUTTONUP, _pygame.MOUSEMOTION))
+        event_types.update(self._menubar.get_event_types())
+        for widget in self._option:
+            event_types.update(widget.get_event_types())
+        if recursive:
+            for menu in self._get_submenus():
+                event_types.update(menu.get_event_types(recursive=True))
+        return event_types
+
     def get_input_data(self, recursive=False):
         """
         Return input data as a dict.
 
         With ``recursive=True``: it looks for a widget inside the current menu
-        and all sub-menus.
+        and all sub-menus. Submenus that have not been built are skipped.
 
         :param recursive: Look in menu and sub-menus
         :type recursive: bool
@@ -783,8 +1327,8 @@ class Menu(object):
                 pass
         if recursive:
             depth += 1
-            for menu in self._submenus:
-                data_submenu = menu.get_input_data(recursive=recursive, depth=depth)
+            for menu in self._get_submenus():  # Menus not built yet have no input
+                data_submenu = menu._get_input_data(recursive=recursive, depth=depth)
 
                 # Check if there's a colission between keys
                 data_keys = data.keys()
@@ -823,8 +1367,7 @@ class Menu(object):
         for widget in self._option:
             widget.set_fps(fps)
         if recursive:
-            for menu in self._submenus:
-                menu.set_fps(fps, recursive=True)
+            self._apply_submenus('set_fps', fps, recursive=True)
 
     def set_sound(self, sound, recursive=False):
         """
@@ -843,8 +1386,36 @@ class Menu(object):
         for widget in self._option:
             widget.set_sound(sound)
         if recursive:
-            for menu in self._submenus:
-                menu.set_sound(sound, recursive=True)
+            self._apply_submenus('set_sound', sound, recursive=True)
+
+    def get_control_map(self):
+        """
+        Return the map of controls of the menu.
+
+        :return: Control map
+        :rtype: pygameMenu.controls.ControlMap
+        """
+        return self._control_map
+
+    def set_control_map(self, control_map, recursive=False):
+        """
+        Set the map of controls of the menu and its widgets. The map can be
+        modified at runtime to rebind the controls.
+
+        :param control_map: Control map
+        :type control_map: pygameMenu.controls.ControlMap
+        :param recursive: Set the map to all the submenus
+        :type recursive: bool
+        :return: None
+        """
+        assert isinstance(control_map, _ControlMap)
+        assert isinstance(recursive, bool)
+        self._control_map = control_map
+        self._menubar.set_control_map(control_map)
+        for widget in self._option:
+            widget.set_control_map(control_map)
+        if recursive:
+            self._apply_submenus('set_control_map', control_map, recursive=True)
 
     def get_title(self):
         """
@@ -867,46 +1438,51 @@ class Menu(object):
         assert isinstance(total, int), 'total must be an integer'
         assert total > 0, 'total must be greater than zero'
 
-        i = 0
-        while True:
-            if self._top._actual._prev is not None:
-                prev = self._top._actual._prev
-                prev_draw = self._top._actual._prev_draw
-                self._top.draw = prev_draw
-                self._select(0)
-                self._top._actual = prev
-                self._top._actual._prev = None
-                self._top._actual._prev_draw = None
-                i += 1
-                if i == total:
-                    break
-            else:
-                break
+        stack = self._top._stack
+        depth = max(0, len(stack) - 1 - total)
+        if depth == len(stack) - 1:
+            return
+        for menu in stack.pop_to(depth):
+            self._select(0, menu)
+        self._top._actual = stack.get()
+        self._top._actual._last_open = next(_open_count)
+        self._top._check_cache_budget()
 
     def _open(self, menu):
         """
         Open the given menu.
 
-        :param menu: Menu object
-        :type menu: Menu, TextMenu
+        :param menu: Menu object, or factory that is built on first open
+        :type menu: Menu, TextMenu, MenuFactory
         :return: None
         """
-        actual = self
+        if isinstance(menu, MenuFactory):
+            built = menu.is_built()
+            menu = menu.get_menu()
+            if not built and len(self._top._blocked_events) > 0:  # Allow the events of the new menu
+                used = menu.get_event_types(recursive=True)
+                allowed = [event_type for event_type in self._top._blocked_events if event_type in used]
+                if len(allowed) > 0:
+                    _pygame.event.set_allowed(allowed)
+                    for event_type in allowed:
+                        self._top._blocked_events.remove(event_type)
         menu._top = self._top
-        self._top._actual._actual = menu._actual
-        self._top._actual._prev = actual
-        self._top._actual._prev_draw = self.draw
-        self._top.draw = menu.draw
+        self._top._stack.push(menu)
+        self._top._actual = menu
+        menu._last_open = next(_open_count)
+        self._top._check_cache_budget()
 
-    def _select(self, index):
+    def _select(self, index, menu=None):
         """
         Select the widget at the given index and unselect others.
 
         :param index: Widget index
         :type index: int
+        :param menu: Menu, if None use the displayed menu
+        :type menu: Menu, NoneType
         :return: None
         """
-        actual = self._top._actual
+        actual = self._top._actual if menu is None else menu
         if actual._size == 0:
             return
         actual._option[actual._index].set_selected(False)
@@ -918,7 +1494,8 @@ class Menu(object):
         Return the widget with the given ID.
 
         With ``recursive=True``: it looks for a widget inside the current menu
-        and all sub-menus.
+        and all sub-menus. Submenus that have not been built are built if the
+        widget is not found in the others.
 
         None is returned if no widget found.
 
@@ -934,9 +1511,152 @@ class Menu(object):
         for widget in self._option:
             if widget.get_id() == widget_id:
                 return widget
-        if recursive:
-            for menu in self._submenus:
-                widget = menu.get_widget(widget_id, recursive)
-                if widget:
-                    return widget
+        if not recursive:
+            return None
+
+        # Look in the built submenus, then build the others level by level
+        for build in (False, True):
+            menus = [self]
+            visited = set()
+            i = 0
+            while i < len(menus):
+                menu = menus[i]
+                i += 1
+                if isinstance(menu, MenuFactory):
+                    if not build and not menu.is_built():
+                        continue
+                    menu = menu.get_menu()
+                if id(menu) in visited:
+                    continue
+                visited.add(id(menu))
+                for widget in menu._option:
+                    if widget.get_id() == widget_id:
+                        return widget
+                menus.extend(menu._submenus)
         return None
+
+
+class MenuFactory(object):
+    """
+    Submenu built by a function the first time it is opened, so its widgets
+    and surfaces are not created until needed. Settings applied recursively
+    to the parent menus before that are applied to the submenu when built.
+    """
+
+    def __init__(self, factory, *args, **kwargs):
+        """
+        Constructor.
+
+        :param factory: Function that returns the submenu
+        :type factory: function
+        :param args: Arguments of the function
+        :param kwargs: Keyword arguments of the function
+        """
+        assert callable(factory), 'factory must be a function'
+        self._args = args
+        self._factory = factory
+        self._kwargs = kwargs
+        self._menu = None
+        self._settings = {}  # Recursive settings, by method name
+
+    def apply(self, method, args, kwargs):
+        """
+        Call a method of the submenu, or record it until the submenu is built.
+
+        :param method: Method name
+        :type method: basestring
+        :param args: Method arguments
+        :type args: tuple
+        :param kwargs: Method keyword arguments
+        :type kwargs: dict
+        :return: None
+        """
+        if self._menu is not None:
+            getattr(self._menu, method)(*args, **kwargs)
+        else:
+            self._settings.pop(method, None)  # Keep the order of the last calls
+            self._settings[method] = (args, kwargs)
+
+    def get_menu(self):
+        """
+        Return the submenu, building it if needed.
+
+        :return: Submenu
+        :rtype: Menu
+        """
+        if self._menu is None:
+            menu = self._factory(*self._args, **self._kwargs)
+            assert isinstance(menu, Menu), 'factory must return a Menu'
+            for method in self._settings.keys():
+                args, kwargs = self._settings[method]
+                getattr(menu, method)(*args, **kwargs)
+            self._menu = menu
+            self._settings = {}
+        return self._menu
+
+    def is_built(self):
+        """
+        Check if the submenu has been built.
+
+        :return: True if built
+        :rtype: bool
+        """
+        return self._menu is not None
+
+
+class _MenuStack(object):
+    """
+    Stack of the menus opened from a top level menu, the first one is the top
+    level menu. Menus are kept alive by their parents, so they are stored as
+    weak references.
+    """
+
+    def __init__(self, menu):
+        """
+        Constructor.
+
+        :param menu: Top level menu
+        :type menu: Menu
+        """
+        self._menus = [_weakref.ref(menu)]
+
+    def __iter__(self):
+        return iter([menu() for menu in self._menus])
+
+    def __len__(self):
+        return len(self._menus)
+
+    def get(self, depth=-1):
+        """
+        Return the menu at the given depth.
+
+        :param depth: Depth, the last opened menu if -1
+        :type depth: int
+        :return: Menu
+        :rtype: Menu
+        """
+        return self._menus[depth]()
+
+    def push(self, menu):
+        """
+        Add an opened menu.
+
+        :param menu: Menu
+        :type menu: Menu
+        :return: None
+        """
+        self._menus.append(_weakref.ref(menu))
+
+    def pop_to(self, depth):
+        """
+        Remove the menus above the given depth.
+
+        :param depth: Depth of the menu kept on top
+        :type depth: int
+        :return: Removed menus, last opened first
+        :rtype: list
+        """
+        assert 0 <= depth < len(self._menus)
+        menus = [menu() for menu in reversed(self._menus[depth + 1:])]
+        del self._menus[depth + 1:]
+        return menus
@@ -0,0 +1,220 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+PIXEL FONT
+Text renderer for pixel fonts, scaled by integer factors from their native size.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import OrderedDict as _OrderedDict
+import pygame as _pygame
+import pygame.font as _font
+
+# Number of texts cached for each scale factor
+_CACHE_SIZE = 256
+
+
+class PixelRaster(object):
+    """
+    Pixel font rasterized once at its native size. The text masks are 8-bit
+    surfaces, scaled with nearest neighbour and cached for each factor.
+    """
+
+    def __init__(self, name, native_size):
+        """
+        Constructor.
+
+        :param name: Font file
+        :type name: basestring
+        :param native_size: Size of the font grid, glyph pixels match screen pixels
+        :type native_size: int
+        """
+        self._font = _font.Font(name, native_size)
+        self._height = self._font.get_height()
+        self._masks = {}  # Masks of each factor
+        self.native_size = native_size
+
+    def get_mask(self, text, factor):
+        """
+        Return the white text mask scaled by a factor.
+
+        :param text: Text
+        :type text: basestring
+        :param factor: Scale factor
+        :type factor: int
+        :return: 8-bit surface, color 0 is the colorkey and color 1 the text
+        :rtype: pygame.surface.SurfaceType
+        """
+        masks = self._masks.get(factor)
+        if masks is None:
+            masks = _OrderedDict()
+            self._masks[factor] = masks
+        mask = masks.get(text)
+        if mask is not None:
+            masks[text] = masks.pop(text)  # Most recently used
+            return mask
+
+        if factor == 1:
+            mask = self._font.render(text, False, (255, 255, 255))
+            if mask.get_bitsize() != 8:  # Empty text is rendered on a 32-bit surface
+                mask = _pygame.Surface(mask.get_size(), 0, 8)
+                mask.set_palette([(0, 0, 0), (255, 255, 255)])
+                mask.set_colorkey(0)
+        else:
+            mask = self.get_mask(text, 1)
+            width, height = mask.get_size()
+            mask = _pygame.transform.scale(mask, (width * factor, height * factor))
+        if len(masks) >= _CACHE_SIZE:
+            masks.popitem(last=False)
+        masks[text] = mask
+        return mask
+
+    def get_height(self):
+        """
+        Return the height of the font at native size.
+
+        :return: Height (px)
+        :rtype: int
+        """
+        return self._height
+
+    def get_metrics(self):
+        """
+        Return the ascent, descent and line size at native size.
+
+        :return: Metrics (px)
+        :rtype: tuple
+        """
+        return self._font.get_ascent(), self._font.get_descent(), self._font.get_linesize()
+
+    def get_width(self, text):
+        """
+        Return the width of a text at native size.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width (px)
+        :rtype: int
+        """
+        return self._font.size(text)[0]
+
+
+class PixelFont(object):
+    """
+    Pixel font at a multiple of its native size. It has the same rendering
+    methods as pygame.font.Font, text is never antialiased.
+    """
+
+    def __init__(self, raster, size):
+        """
+        Constructor.
+
+        :param raster: Font rasterized at native size
+        :type raster: PixelRaster
+        :param size: Font size, rounded to a multiple of the native size
+        :type size: int
+        """
+        self._factor = max(1, int(round(float(size) / raster.native_size)))
+        self._raster = raster
+
+    def get_ascent(self):
+        """
+        Return the ascent of the font.
+
+        :return: Ascent (px)
+        :rtype: int
+        """
+        return self._raster.get_metrics()[0] * self._factor
+
+    def get_descent(self):
+        """
+        Return the descent of the font.
+
+        :return: Descent (px)
+        :rtype: int
+        """
+        return self._raster.get_metrics()[1] * self._factor
+
+    def get_factor(self):
+        """
+        Return the scale factor of the font.
+
+        :return: Factor
+        :rtype: int
+        """
+        return self._factor
+
+    def get_height(self):
+        """
+        Return the height of the font.
+
+        :return: Height (px)
+        :rtype: int
+        """
+        return self._raster.get_height() * self._factor
+
+    def get_linesize(self):
+        """
+        Return the line size of the font.
+
+        :return: Line size (px)
+        :rtype: int
+        """
+        return self._raster.get_metrics()[2] * self._factor
+
+    def render(self, text, antialias, color, background=None):
+        """
+        Render text on a new 8-bit surface, antialias is ignored.
+
+        :param text: Text
+        :type text: basestring
+        :param antialias: Not used, pixel fonts are not antialiased
+        :type antialias: bool
+        :param color: Text color
+        :type color: tuple
+        :param background: Background color, transparent if None
+        :type background: tuple, NoneType
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        surface = self._raster.get_mask(text, self._factor).copy()
+        surface.set_palette_at(1, color[0:3])
+        if background is not None:
+            surface.set_palette_at(0, background[0:3])
+            surface.set_colorkey(None)
+        return surface
+
+    def size(self, text):
+        """
+        Return the size of the rendered text.
+
+        :param text: Text
+        :type text: basestring
+        :return: Width and height (px)
+        :rtype: tuple
+        """
+        return self._raster.get_width(text) * self._factor, self.get_height()
@@ -0,0 +1,138 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+PREBAKE
+Rasterize the font atlases of a menu ahead of time, usage:
+
+    python -m pygameMenu.prebake OPEN_SANS:30 path/to/font.ttf:20 --text strings.txt
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import argparse as _argparse
+import multiprocessing as _multiprocessing
+import string as _string
+import pygameMenu.fonts as _fonts
+
+# Characters prebaked for every font, kerning is measured for all the pairs
+PREBAKE_CHARS = ''.join(c for c in _string.printable if c not in '\t\n\r\x0b\x0c')
+
+
+def _prebake(job):
+    """
+    Prebake the atlas of a font in a worker process.
+
+    :param job: Font file, size, characters and lines of text
+    :type job: tuple
+    :return: Font file, size and atlas file
+    :rtype: tuple
+    """
+    import pygame.font
+    from pygameMenu.atlas import FontAtlas, save_atlas
+    name, size, chars, lines = job
+    pygame.font.init()
+    atlas = FontAtlas(name, size)
+    atlas.prebake(chars, lines)
+    return name, size, save_atlas(atlas)
+
+
+def parse_font(spec):
+    """
+    Return the font file and size from a FONT:SIZE string, FONT is an
+    embedded font name (e.g. OPEN_SANS), a system font or a font file.
+
+    :param spec: Font and size
+    :type spec: basestring
+    :return: Font file and size
+    :rtype: tuple
+    """
+    name, size = spec.rsplit(':', 1)
+    embedded = 'FONT_' + name.upper()
+    if hasattr(_fonts, embedded):
+        name = getattr(_fonts, embedded)
+    return _fonts.get_font_file(name), int(size)
+
+
+def prebake(fonts, lines=(), chars=PREBAKE_CHARS, processes=None):
+    """
+    Rasterize the atlases of some fonts in parallel and save them to the
+    cache directory, get_font() loads them when using PYGAME_RENDERER_ATLAS.
+
+    :param fonts: List of (font, size), font is a name or a file
+    :type fonts: list
+    :param lines: Lines of text used by the menus
+    :type lines: list, tuple
+    :param chars: Characters to prebake
+    :type chars: basestring
+    :param processes: Number of processes, if None use the number of CPU cores
+    :type processes: int, NoneType
+    :return: List of (font file, size, atlas file)
+    :rtype: list
+    """
+    import pygame.font
+    pygame.font.init()
+    jobs = []
+    for font in fonts:
+        name, size = font
+        jobs.append((_fonts.get_font_file(name), size, chars, tuple(lines)))
+    if len(jobs) < 2 or processes == 1:
+        return [_prebake(job) for job in jobs]
+    pool = _multiprocessing.Pool(processes)
+    try:
+        return pool.map(_prebake, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main(args=None):
+    """
+    Run the prebake command.
+
+    :param args: Command line arguments, if None use sys.argv
+    :type args: list, NoneType
+    :return: None
+    """
+    parser = _argparse.ArgumentParser(prog='python -m pygameMenu.prebake',
+                                      description='Rasterize font atlases ahead of time.')
+    parser.add_argument('fonts', metavar='FONT:SIZE', nargs='+', type=parse_font,
+                        help='embedded font name (e.g. OPEN_SANS), system font or font file, and size')
+    parser.add_argument('--text', metavar='FILE',
+                        help='file with the text of the menus, one string per line')
+    parser.add_argument('--jobs', metavar='N', type=int, default=None,
+                        help='number of processes, by default the number of CPU cores')
+    args = parser.parse_args(args)
+
+    lines = []
+    if args.text is not None:
+        with open(args.text, 'rb') as f:
+            lines = [line for line in f.read().decode('utf-8').splitlines() if line != '']
+    for name, size, path in prebake(args.fonts, lines, processes=args.jobs):
+        print('{0}:{1} -> {2}'.format(name, size, path))
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import pygame as _pygame
 
 from pygameMenu.menu import Menu
+from pygameMenu.utils import convert_surface as _convert_surface
+from pygameMenu.utils import get_surface_bytes as _get_surface_bytes
 import pygameMenu.config_textmenu as _cfg
 import pygameMenu.locals as _locals
 
@@ -110,6 +112,7 @@ class TextMenu(Menu):
 
         # Inner variables
         self._text = []
+        self._text_surfaces = []  # Rendered lines
 
         # Position of text
         self._pos_text_x = int(self._width * (self._draw_text_region_x / 100.0)) + self._posx
@@ -128,6 +131,7 @@ class TextMenu(Menu):
         self._text.append(text)
         dy = -self._font_textsize / 2 - self._textdy / 2
         self._opt_posy += dy
+        self._invalidate_layout()
 
     def add_option(self, element_name, element, *args, **kwargs):
         """
@@ -148,20 +152,39 @@ class TextMenu(Menu):
         if self._size <= 1:
             dy = -0.5 * (self._fsize + self._opt_dy)
             self._opt_posy += dy
+            self._invalidate_layout()
         return super(TextMenu, self).add_option(element_name, element, *args, **kwargs)
 
-    def draw(self):
+    def get_cache_size(self, recursive=False):
         """
-        Draw menu on surface.
+        See upper class doc.
+        """
+        size = super(TextMenu, self).get_cache_size(recursive)
+        if not recursive:
+            size += sum(_get_surface_bytes(text) for text in self._text_surfaces)
+        return size
 
-        :return: None
+    def clear_cache(self, recursive=False):
+        """
+        See upper class doc.
         """
-        super(TextMenu, self).draw()
+        super(TextMenu, self).clear_cache(recursive)
+        if not recursive:
+            self._text_surfaces = []
+
+    def _draw_menu(self, selected):
+        """
+        See upper class doc.
+        """
+        super(TextMenu, self)._draw_menu(selected)
 
         # Draw text
         dy = 0
-        for line in self._text:
-            text = self._fonttext.render(line, 1, self._font_textcolor)
+        for i in range(len(self._text)):
+            if i == len(self._text_surfaces):  # Render new lines once
+                self._text_surfaces.append(_convert_surface(
+                    self._fonttext.render(self._text[i], 1, self._font_textcolor)))
+            text = self._text_surfaces[i]
             text_width = text.get_size()[0]
 
             # Check text align
@@ -182,6 +205,13 @@ class TextMenu(Menu):
             self._surface.blit(text, (self._pos_text_x + text_dx, ycoords))
             dy += 1
 
+    def _move(self, dx, dy):
+        """
+        See upper class doc.
+        """
+        super(TextMenu, self)._move(dx, dy)
+        self._pos_text_x += dx
+
     def _get_option_pos(self, index):
         """
         Get option position from the option index.
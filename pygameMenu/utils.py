@@ -0,0 +1,201 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+UTILS
+Utility functions.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import hashlib as _hashlib
+import os as _os
+import pickle as _pickle
+import pygame as _pygame
+
+
+def convert_surface(surface):
+    """
+    Convert a surface to the display format, so it is blitted without a
+    per-pixel conversion. Surfaces with per-pixel alpha keep it, surfaces
+    with a colorkey (text without antialias) are RLE accelerated. If no
+    display mode is set the surface is returned as it is.
+
+    :param surface: Surface to convert
+    :type surface: pygame.surface.SurfaceType
+    :return: Converted surface
+    :rtype: pygame.surface.SurfaceType
+    """
+    if _pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & _pygame.SRCALPHA:
+        return surface.convert_alpha()
+    colorkey = surface.get_colorkey()
+    surface = surface.convert()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey, _pygame.RLEACCEL)
+    return surface
+
+
+def get_surface_bytes(surface):
+    """
+    Return the memory used by the pixels of a surface. Subsurfaces share the
+    pixels of their parent and use none.
+
+    :param surface: Surface
+    :type surface: pygame.surface.SurfaceType
+    :return: Size (bytes)
+    :rtype: int
+    """
+    if surface is None or surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def blur_surface(surface, radius):
+    """
+    Return a blurred copy of the surface. A box blur is computed with NumPy
+    if available, otherwise the surface is scaled down and up again.
+
+    :param surface: Surface to blur
+    :type surface: pygame.surface.SurfaceType
+    :param radius: Blur radius (px)
+    :type radius: int
+    :return: Blurred surface
+    :rtype: pygame.surface.SurfaceType
+    """
+    # noinspection PyArgumentList
+    surface = surface.convert(32) if surface.get_bitsize() not in (24, 32) else surface.copy()
+    if radius <= 0:
+        return surface
+    try:
+        import numpy as _numpy
+        import pygame.surfarray as _surfarray
+    except ImportError:
+        width, height = surface.get_size()
+        small = _pygame.transform.smoothscale(surface, (max(1, width // (radius + 1)),
+                                                        max(1, height // (radius + 1))))
+        return _pygame.transform.smoothscale(small, (width, height))
+
+    # Separable box blur, each axis is averaged with a cumulative sum
+    pixels = _surfarray.array3d(surface).astype(_numpy.int32)
+    size = 2 * radius + 1
+    for axis in (0, 1):
+        pad = [(0, 0), (0, 0), (0, 0)]
+        pad[axis] = (radius + 1, radius)
+        total = _numpy.cumsum(_numpy.pad(pixels, pad, mode='edge'), axis=axis)
+        length = pixels.shape[axis]
+        pixels = (_numpy.take(total, range(size, size + length), axis=axis) -
+                  _numpy.take(total, range(length), axis=axis)) // size
+    _surfarray.blit_array(surface, pixels.astype(_numpy.uint8))
+    return surface
+
+
+def dim_surface(surface, dim):
+    """
+    Darken a surface in place.
+
+    :param surface: Surface to darken
+    :type surface: pygame.surface.SurfaceType
+    :param dim: Fraction of the brightness that is removed, between 0 and 1
+    :type dim: float, int
+    :return: None
+    """
+    if dim <= 0:
+        return
+    value = int(round(255 * (1 - dim)))
+    surface.fill((value, value, value), special_flags=_pygame.BLEND_RGB_MULT)
+
+
+def get_cache_dir():
+    """
+    Return the directory of the files cached on disk (e.g. prebaked font
+    atlases), it can be set with the PYGAMEMENU_CACHE environment variable.
+
+    :return: Directory
+    :rtype: basestring
+    """
+    cache_dir = _os.environ.get('PYGAMEMENU_CACHE')
+    if not cache_dir:
+        cache_dir = _os.path.join(_os.path.expanduser('~'), '.cache', 'pygameMenu')
+    return cache_dir
+
+
+def get_cache_file(kind, source, key):
+    """
+    Return the cache file of some data computed from a source file, it
+    changes if the source file, the key or the pygame version change.
+
+    :param kind: Kind of data, prefix of the file name
+    :type kind: basestring
+    :param source: Source file (e.g. a font)
+    :type source: basestring
+    :param key: Other values the data depends on (e.g. a version)
+    :type key: tuple
+    :return: File path
+    :rtype: basestring
+    """
+    stat = _os.stat(source)
+    key = repr((_pygame.version.ver, _os.path.abspath(source), stat.st_size, stat.st_mtime) + tuple(key))
+    return _os.path.join(get_cache_dir(), '{0}_{1}.pickle'.format(kind, _hashlib.sha1(key.encode()).hexdigest()))
+
+
+def read_cache_file(path):
+    """
+    Read a cache file.
+
+    :param path: File path
+    :type path: basestring
+    :return: Cached data, None if the file does not exist or is not valid
+    :rtype: object
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _pickle.load(f)
+    except (IOError, OSError, EOFError, _pickle.UnpicklingError):
+        return None
+
+
+def write_cache_file(path, data):
+    """
+    Write a cache file. The file is replaced at once, so other processes
+    never read a partial file.
+
+    :param path: File path
+    :type path: basestring
+    :param data: Data, must be pickable
+    :type data: object
+    :return: None
+    """
+    directory = _os.path.dirname(path)
+    try:
+        _os.makedirs(directory)
+    except OSError:  # Already exists
+        if not _os.path.isdir(directory):
+            raise
+    temp = '{0}.{1}'.format(path, _os.getpid())
+    with open(temp, 'wb') as f:
+        _pickle.dump(data, f, _pickle.HIGHEST_PROTOCOL)
+    _os.replace(temp, path)
@@ -30,7 +30,44 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-from pygameMenu.widgets.button import Button
-from pygameMenu.widgets.menubar import MenuBar
-from pygameMenu.widgets.selector import Selector
-from pygameMenu.widgets.textinput import TextInput
+import importlib as _importlib
+import sys as _sys
+
+# Widgets imported on first access
+_LAZY = {
+    'Button': 'pygameMenu.widgets.button',
+    'MenuBar': 'pygameMenu.widgets.menubar',
+    'Selector': 'pygameMenu.widgets.selector',
+    'TextInput': 'pygameMenu.widgets.textinput',
+}
+
+
+def __getattr__(name):
+    """
+    Import the widgets on first access (PEP 562).
+
+    :param name: Attribute name
+    :type name: basestring
+    :return: Widget class
+    :rtype: type
+    """
+    if name not in _LAZY:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(_importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the attributes of the package, including the widgets.
+
+    :return: Attribute names
+    :rtype: list
+    """
+    return sorted(set(globals().keys()) | set(_LAZY.keys()))
+
+
+if _sys.version_info < (3, 7):  # Module __getattr__ is not supported, import all now
+    for _name in _LAZY.keys():
+        __getattr__(_name)
@@ -31,7 +31,6 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import pygame as _pygame
-from pygameMenu import config_controls as _ctrl
 from pygameMenu.widgets.widget import Widget
 from pygameMenu import locals as _locals
 
@@ -83,6 +82,8 @@ class Button(Widget):
         """
         See upper class doc.
         """
+        if not self._render_outdated():
+            return
         if self.selected:
             color = self._font_selected_color
         else:
@@ -96,16 +97,11 @@ class Button(Widget):
         updated = False
         for event in events:
 
-            if event.type == _pygame.KEYDOWN:
-                if event.key == _ctrl.MENU_CTRL_ENTER:
+            if self._control_map.get_action(event, self.joystick_enabled) == _locals.PYGAME_CTRL_ENTER:
+                if event.type == _pygame.KEYDOWN:
                     self.sound.play_open_menu()
-                    self.apply()
-                    updated = True
-
-            elif self.joystick_enabled and event.type == _pygame.JOYBUTTONDOWN:
-                if event.button == _locals.JOY_BUTTON_SELECT:
-                    self.apply()
-                    updated = True
+                self.apply()
+                updated = True
 
             elif self.mouse_enabled and event.type == _pygame.MOUSEBUTTONUP:
                 self.sound.play_click_mouse()
@@ -92,7 +92,10 @@ class MenuBar(Widget):
         """
         self._render()
 
-        _gfxdraw.filled_polygon(surface, self._polygon_pos, self._font_color)
+        if surface.get_flags() & _pygame.SRCALPHA:  # Blending would darken a transparent surface
+            _pygame.draw.polygon(surface, self._font_color, self._polygon_pos)
+        else:
+            _gfxdraw.filled_polygon(surface, self._polygon_pos, self._font_color)
 
         if self.mouse_enabled and self._backbox:
             _pygame.draw.rect(surface, self._font_selected_color, self._backbox_rect, 1)
@@ -114,6 +117,8 @@ class MenuBar(Widget):
         """
         See upper class doc.
         """
+        if not self._render_outdated():
+            return
         self._surface = self.render_string(self.label, self._font_selected_color)
 
         # Usually done in  get_rect(), but can not be called here because it call _render() itself
@@ -174,7 +179,7 @@ class MenuBar(Widget):
                     updated = True
 
             elif self.joystick_enabled and event.type == _pygame.JOYBUTTONDOWN:
-                if event.button == _locals.JOY_BUTTON_BACK:
+                if self._control_map.get_action(event) == _locals.PYGAME_CTRL_BACK:
                     self.apply()
                     updated = True
 
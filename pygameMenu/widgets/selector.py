@@ -30,8 +30,9 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
+from bisect import bisect_left as _bisect_left
+
 import pygame as _pygame
-from pygameMenu import config_controls as _ctrl
 from pygameMenu.widgets.widget import Widget
 from pygameMenu import locals as _locals
 
@@ -55,8 +56,8 @@ class Selector(Widget):
 
         :param title: Title of the selector
         :type title: basestring
-        :param elements: Elements of the selector
-        :type elements: list
+        :param elements: Elements of the selector, or a lazy provider (range, sequence or function returning one)
+        :type elements: list, tuple, range, object, function
         :param selector_id: ID of the selector
         :type selector_id: basestring
         :param default: Index of default element to display
@@ -69,18 +70,27 @@ class Selector(Widget):
         """
         super(Selector, self).__init__(widget_id=selector_id, onchange=onchange,
                                        onreturn=onreturn, kwargs=kwargs)
-        self._elements = elements
+        self._elements = []
+        self._element_cache = {}  # Neighbour elements of lazy providers
         self._index = 0
+        self._labels = None  # Index of the first element of each label, None if lazy
+        self._provider = None  # Function returning the elements, evaluated on first use
         self._sformat = '{0} < {1} >'
         self._labelsize = 0
 
+        # Type-ahead search
+        self._search = ''  # Typed prefix
+        self._search_labels = None  # Sorted labels (lowercase), built on first search
+        self._search_indices = None  # Element index of each sorted label
+        self._search_ms = 0  # Time of the last typed key
+        self._search_timeout_ms = 1000  # The prefix is reset after this time
+
         # Public attributs
         self.label = title
 
-        # Apply default item
-        default %= len(self._elements)
-        for k in range(0, default):
-            self.right()
+        # Apply default item, callbacks are not called
+        self._index = default
+        self._set_elements(elements)
 
     def _apply_font(self):
         """
@@ -102,7 +112,7 @@ class Selector(Widget):
         :return: Value and index as a tuple
         :rtype: tuple
         """
-        return self._elements[self._index][0], self._index
+        return self._get_selected()[0], self._index
 
     def left(self):
         """
@@ -110,8 +120,9 @@ class Selector(Widget):
 
         :return: None
         """
-        self._index = (self._index - 1) % len(self._elements)
-        self.change(*self._elements[self._index][1:])
+        size = len(self._get_elements())
+        self._select((self._index - 1) % size)
+        self.change(*self._get_selected()[1:])
 
     def right(self):
         """
@@ -119,19 +130,197 @@ class Selector(Widget):
 
         :return: None
         """
-        self._index = (self._index + 1) % len(self._elements)
-        self.change(*self._elements[self._index][1:])
+        size = len(self._get_elements())
+        self._select((self._index + 1) % size)
+        self.change(*self._get_selected()[1:])
+
+    def _set_elements(self, elements):
+        """
+        Store the elements and index their labels. Lists and tuples are
+        indexed, lazy providers are kept as they are.
+
+        :param elements: Elements of the selector, or a lazy provider
+        :type elements: list, tuple, range, object, function
+        :return: None
+        """
+        self._invalidate_render()
+        self._element_cache = {}
+        self._search_labels = None
+        self._search_indices = None
+        if isinstance(elements, (list, tuple)):
+            labels = {}
+            for index in range(len(elements) - 1, -1, -1):
+                labels[elements[index][0]] = index
+            self._elements = elements
+            self._labels = labels
+            self._provider = None
+            self._index %= len(elements)
+        elif callable(elements):
+            self._elements = None
+            self._labels = None
+            self._provider = elements
+        else:
+            assert hasattr(elements, '__len__') and hasattr(elements, '__getitem__'), \
+                'elements must be a list, a range, a sequence or a function'
+            self._elements = elements
+            self._labels = None
+            self._provider = None
+            self._index %= len(elements)
+
+    def _get_elements(self):
+        """
+        Return the elements of the selector, evaluating the provider function
+        if not done yet.
+
+        :return: Elements
+        :rtype: list, tuple, range, object
+        """
+        if self._provider is not None:
+            provider = self._provider
+            self._provider = None
+            self._set_elements(provider())
+        return self._elements
+
+    def _get_element(self, index):
+        """
+        Return the element at the given index. Elements of lazy providers
+        are generated on demand, and only the selected element and its
+        neighbours are cached.
+
+        :param index: Element index
+        :type index: int
+        :return: Element as a tuple (label, values...)
+        :rtype: tuple
+        """
+        elements = self._get_elements()
+        if self._labels is not None:
+            return elements[index]
+        element = self._element_cache.get(index)
+        if element is None:
+            element = self._make_element(elements[index])
+            if abs(index - self._index) <= 1:
+                self._element_cache[index] = element
+        return element
+
+    def _get_selected(self):
+        """
+        Return the selected element.
+
+        :return: Element as a tuple (label, values...)
+        :rtype: tuple
+        """
+        self._get_elements()  # The provider may change the index
+        return self._get_element(self._index)
+
+    @staticmethod
+    def _make_element(item):
+        """
+        Convert an item of a lazy provider to an element. Tuples are used as
+        they are, other values are labeled with their string.
+
+        :param item: Provider item
+        :type item: object
+        :return: Element as a tuple (label, values...)
+        :rtype: tuple
+        """
+        if isinstance(item, tuple):
+            return item
+        return str(item), item
+
+    def _find_label(self, text):
+        """
+        Return the index of the first element with the given label.
+
+        :param text: Label of the element
+        :type text: basestring
+        :return: Element index, None if not found
+        :rtype: int, NoneType
+        """
+        if self._labels is not None:
+            return self._labels.get(text)
+        elements = self._get_elements()
+        if isinstance(elements, range):  # Index of a range is computed
+            try:
+                value = int(text)
+            except ValueError:
+                return None
+            if str(value) == text and value in elements:
+                return elements.index(value)
+            return None
+        for index in range(len(elements)):  # Labels are not stored, scan them
+            if self._make_element(elements[index])[0] == text:
+                return index
+        return None
+
+    def _select(self, index):
+        """
+        Select an element, keeping only its neighbours in the cache of lazy
+        providers.
+
+        :param index: Element index
+        :type index: int
+        :return: None
+        """
+        self._index = index
+        self._invalidate_render()
+        if self._element_cache:
+            for i in list(self._element_cache.keys()):
+                if abs(i - index) > 1:
+                    del self._element_cache[i]
+
+    def _search_element(self, char):
+        """
+        Add a character to the type-ahead prefix and select the first element
+        whose label starts with it. Lazy providers are not searched, as
+        that would require generating all their labels.
+
+        :param char: Typed character
+        :type char: basestring
+        :return: True if the selected element changed
+        :rtype: bool
+        """
+        if self._labels is None:
+            return False
+        if self._search_labels is None:  # Build sorted prefix index
+            order = sorted(range(len(self._elements)), key=lambda i: self._elements[i][0].lower())
+            self._search_labels = [self._elements[i][0].lower() for i in order]
+            self._search_indices = order
+
+        # Continue the prefix if typed fast enough, else start a new one
+        time = _pygame.time.get_ticks()
+        if time - self._search_ms > self._search_timeout_ms:
+            self._search = ''
+        self._search_ms = time
+
+        for prefix in (self._search + char.lower(), char.lower()):
+            pos = _bisect_left(self._search_labels, prefix)
+            if pos < len(self._search_labels) and self._search_labels[pos].startswith(prefix):
+                self._search = prefix
+                index = self._search_indices[pos]
+                if index == self._index:
+                    return False
+                self._select(index)
+                self.change(*self._get_selected()[1:])
+                return True
+        return False
 
     def _render(self):
         """
         See upper class doc.
         """
-        string = self._sformat.format(self.label, self.get_value()[0])
+        if not self._render_outdated():
+            return
         if self.selected:
             color = self._font_selected_color
         else:
             color = self._font_color
-        self._surface = self.render_string(string, color)
+        value = self.get_value()[0]
+        if self._sformat.count('{1}') == 1:  # Label and value are rendered apart
+            prefix, suffix = self._sformat.split('{1}')
+            segments = (prefix.format(self.label), value, suffix.format(self.label))
+            self._surface = self.render_segments(segments, color)
+        else:
+            self._surface = self.render_string(self._sformat.format(self.label, value), color)
 
     def set_selection_format(self, s):
         """
@@ -142,6 +331,7 @@ class Selector(Widget):
         :return: None
         """
         self._sformat = s
+        self._invalidate_render()
 
     def set_value(self, text):
         """
@@ -149,11 +339,10 @@ class Selector(Widget):
 
         :return: None
         """
-        for element in self._elements:
-            if element[0] == text:
-                self._index = self._elements.index(element)
-                return
-        raise ValueError("No value '{}' found in selector".format(text))
+        index = self._find_label(text)
+        if index is None:
+            raise ValueError("No value '{}' found in selector".format(text))
+        self._select(index)
 
     def update(self, events):
         """
@@ -161,39 +350,33 @@ class Selector(Widget):
         """
         updated = False
         for event in events:
-            if event.type == _pygame.KEYDOWN:
+            keydown = event.type == _pygame.KEYDOWN
 
-                # Check key is valid
-                if not self.check_key_pressed_valid(event):
-                    continue
+            # Check key is valid
+            if keydown and not self.check_key_pressed_valid(event):
+                continue
 
-                if event.key == _ctrl.MENU_CTRL_LEFT:
+            action = self._control_map.get_action(event, self.joystick_enabled)
+            if action == _locals.PYGAME_CTRL_LEFT:
+                if keydown:
                     self.sound.play_key_add()
-                    self.left()
-                    updated = True
-                elif event.key == _ctrl.MENU_CTRL_RIGHT:
+                self.left()
+                updated = True
+
+            elif action == _locals.PYGAME_CTRL_RIGHT:
+                if keydown:
                     self.sound.play_key_add()
-                    self.right()
-                    updated = True
-                elif event.key == _ctrl.MENU_CTRL_ENTER:
-                    self.sound.play_open_menu()
-                    self.apply(*self._elements[self._index][1:])
-                    updated = True
+                self.right()
+                updated = True
 
-            elif self.joystick_enabled and event.type == _pygame.JOYHATMOTION:
-                if event.value == _locals.JOY_LEFT:
-                    self.left()
-                    updated = True
-                elif event.value == _locals.JOY_RIGHT:
-                    self.right()
-                    updated = True
+            elif action == _locals.PYGAME_CTRL_ENTER and keydown:
+                self.sound.play_open_menu()
+                self.apply(*self._get_selected()[1:])
+                updated = True
 
-            elif self.joystick_enabled and event.type == _pygame.JOYAXISMOTION:
-                if event.axis == _locals.JOY_AXIS_X and event.value < _locals.JOY_DEADZONE:
-                    self.left()
-                    updated = True
-                if event.axis == _locals.JOY_AXIS_X and event.value > -_locals.JOY_DEADZONE:
-                    self.right()
+            elif action is None and keydown and getattr(event, 'unicode', '').isalnum():
+                if self._search_element(event.unicode):
+                    self.sound.play_key_add()
                     updated = True
 
             elif self.mouse_enabled and event.type == _pygame.MOUSEBUTTONUP:
@@ -219,17 +402,26 @@ class Selector(Widget):
         """
         Update selector elements.
 
-        :param elements: Elements of the selector
-        :type elements: Object
+        :param elements: Elements of the selector, or a lazy provider
+        :type elements: list, tuple, range, object, function
         :return: None
         """
-        for elem in elements:  # Check value list
-            assert len(elem) >= 1, 'Length of each element in value list must be greater than 1'
-            assert isinstance(elem[0], str), 'First element of value list component must be a string'
-        selected_element = self._elements[self._index]
-        self._elements = elements
-        try:
-            self._index = self._elements.index(selected_element)
-        except ValueError:
-            if self._index >= len(self._elements):
-                self._index = len(self._elements) - 1
+        if isinstance(elements, (list, tuple)):
+            for elem in elements:  # Check value list
+                assert len(elem) >= 1, 'Length of each element in value list must be greater than 1'
+                assert isinstance(elem[0], str), 'First element of value list component must be a string'
+        selected_element = self._get_selected()
+        index = self._index
+        self._index = 0
+        self._set_elements(elements)
+        self._get_elements()
+        new_index = self._find_label(selected_element[0])
+        if new_index is not None and self._get_element(new_index) == selected_element:
+            self._select(new_index)
+        elif self._labels is not None:
+            try:
+                self._select(self._elements.index(selected_element))
+            except ValueError:
+                self._select(min(index, len(self._elements) - 1))
+        else:
+            self._select(min(index, len(self._elements) - 1))
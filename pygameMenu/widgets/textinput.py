@@ -31,31 +31,197 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import pygame as _pygame
-from pygameMenu import config_controls as _ctrl
 from pygameMenu import locals as _locals
+from pygameMenu.clipboard import Clipboard as _Clipboard
+from pygameMenu.utils import get_surface_bytes as _get_surface_bytes
+from pygameMenu.utils import convert_surface as _convert_surface
 from pygameMenu.widgets.widget import Widget
 
-try:
-    from pyperclip import copy, paste
-except ImportError:
-    # noinspection PyUnusedLocal
-    def copy(text):
+# Text events are only generated by pygame>=2.0.0
+_TEXT_EVENTS = _pygame.version.vernum[0] >= 2 and hasattr(_pygame, 'TEXTINPUT')
+
+# Translation table that deletes the control characters
+_CONTROL_CHARS = dict.fromkeys(list(range(32)) + [127])
+
+
+def _is_text(string):
+    """
+    Check if the string can be written into the input.
+
+    :param string: String
+    :type string: basestring
+    :return: True if the string is not empty and has no control characters
+    :rtype: bool
+    """
+    return string != '' and string.translate(_CONTROL_CHARS) == string
+
+
+class _GlyphRun(object):
+    """
+    Text mask that grows and shrinks at its end. Appending a character
+    renders its glyph only, deleting the last characters clears their
+    pixels; any other change requires a new run.
+    """
+
+    def __init__(self, font, antialias, string):
         """
-        Copy method.
+        Render the string as the base of the run.
 
-        :return: None
+        :param font: Font object
+        :type font: pygame.font.FontType
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :param string: Base text
+        :type string: basestring
+        """
+        self._antialias = antialias
+        self._font = font
+        self.string = string
+
+        if hasattr(font, 'render_to'):  # Render the base into the run
+            text = None
+            width, self._height = font.size(string)
+        else:
+            text = font.render(string, antialias, (255, 255, 255))
+            width, self._height = text.get_size()
+        self._base_len = len(string)  # Characters rendered at once
+        self._offsets = [font.size(string)[0]]  # Position after each character added to the base
+        self._width = max(width, self._offsets[0])  # Width of the rendered pixels
+        self._surface = self._new_surface(max(2 * self._width, 4 * self._height))
+        if text is None:
+            font.render_to(self._surface, (0, 0), string, antialias, (255, 255, 255))
+        else:
+            self._surface.blit(text, (0, 0))
+
+    def _new_surface(self, width):
+        """
+        Create a transparent surface of the run height.
+
+        :param width: Surface width
+        :type width: int
+        :return: Surface
+        :rtype: pygame.surface.SurfaceType
         """
-        pass
+        # noinspection PyArgumentList
+        surface = _pygame.Surface((width, self._height), _pygame.SRCALPHA, 32)
+        surface.fill((0, 0, 0, 0))
+        return surface
 
+    def _kerned(self, left, right):
+        """
+        Check if two characters are not drawn side by side.
+
+        :param left: Left character
+        :type left: basestring
+        :param right: Right character
+        :type right: basestring
+        :return: True if the pair needs a full render
+        :rtype: bool
+        """
+        font = self._font
+        return font.size(left + right)[0] != font.size(left)[0] + font.size(right)[0]
+
+    def matches(self, font, antialias):
+        """
+        Check if the run was rendered with the given style.
+
+        :param font: Font object
+        :type font: pygame.font.FontType
+        :param antialias: Text is antialiased
+        :type antialias: bool
+        :return: True if the style is the same
+        :rtype: bool
+        """
+        return self._font is font and self._antialias == antialias
+
+    def set_string(self, string):
+        """
+        Update the run to the given string by appending or deleting
+        characters at its end.
 
-    def paste():
+        :param string: New text
+        :type string: basestring
+        :return: False if the string cannot be reached incrementally
+        :rtype: bool
         """
-        Paste method.
+        old = self.string
+        if string.startswith(old):
+            for i in range(len(old), len(string)):
+                if not self._append(string[i - 1] if i > 0 else '', string[i]):
+                    return False
+                self.string = string[:i + 1]
+            return True
+        if old.startswith(string):
+            return self._delete(len(string))
+        return False
 
-        :return: Empty string
-        :rtype: basestring
+    def _append(self, prev, char):
         """
-        return ''
+        Append the glyph of a character.
+
+        :param prev: Previous character
+        :type prev: basestring
+        :param char: Character to append
+        :type char: basestring
+        :return: False if a full render is needed
+        :rtype: bool
+        """
+        if prev != '' and self._kerned(prev, char):
+            return False
+        x = self._offsets[-1]
+        advance = self._font.size(char)[0]
+        if hasattr(self._font, 'render_to'):  # Render the glyph into the run
+            glyph = None
+            width = x + advance
+        else:
+            glyph = self._font.render(char, self._antialias, (255, 255, 255))
+            width = max(x + glyph.get_width(), x + advance)
+        if width > self._surface.get_width():  # Double the capacity
+            surface = self._new_surface(2 * width)
+            surface.blit(self._surface, (0, 0))
+            self._surface = surface
+        if glyph is None:
+            self._font.render_to(self._surface, (x, 0), char, self._antialias, (255, 255, 255))
+        else:
+            # Copy the glyph alpha, glyphs without it use a colorkey
+            flags = _pygame.BLEND_RGBA_MAX if glyph.get_flags() & _pygame.SRCALPHA else 0
+            self._surface.blit(glyph, (x, 0), special_flags=flags)
+        self._offsets.append(x + advance)
+        self._width = max(self._width, width)
+        return True
+
+    def _delete(self, length):
+        """
+        Delete the characters from the given length to the end.
+
+        :param length: Length of the new string
+        :type length: int
+        :return: False if a full render is needed
+        :rtype: bool
+        """
+        if 0 < length < len(self.string) and self._kerned(self.string[length - 1], self.string[length]):
+            return False
+        if length >= self._base_len:
+            del self._offsets[length - self._base_len + 1:]
+            x = self._offsets[-1]
+        else:  # Deleting into the base, measure it
+            x = self._font.size(self.string[:length])[0]
+            self._base_len = length
+            self._offsets = [x]
+        if x < self._width:
+            self._surface.fill((0, 0, 0, 0), (x, 0, self._width - x, self._height))
+        self._width = x
+        self.string = self.string[:length]
+        return True
+
+    def get_surface(self):
+        """
+        Return the rendered text mask.
+
+        :return: Surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        return self._surface.subsurface((0, 0, max(self._width, 1), self._height))
 
 
 class TextInput(Widget):
@@ -78,6 +244,7 @@ class TextInput(Widget):
                  repeat_keys_interval_ms=25,
                  repeat_mouse_interval_ms=50,
                  text_ellipsis='...',
+                 text_events=True,
                  **kwargs
                  ):
         """
@@ -111,6 +278,8 @@ class TextInput(Widget):
         :type repeat_mouse_interval_ms: float, int
         :param text_ellipsis: Ellipsis text when overflow occurs
         :type text_ellipsis: basestring
+        :param text_events: Read the text from TEXTINPUT events if supported by pygame (pygame>=2.0.0)
+        :type text_events: bool
         :param kwargs: Optional keyword-arguments for callbacks
         """
         super(TextInput, self).__init__(widget_id=textinput_id, onchange=onchange,
@@ -124,14 +293,15 @@ class TextInput(Widget):
             raise ValueError('history must be equal or greater than zero')
 
         self._input_string = ''  # Inputted text
-        self._ignore_keys = (_ctrl.MENU_CTRL_UP, _ctrl.MENU_CTRL_DOWN,
-                             _pygame.K_LCTRL, _pygame.K_RCTRL,
+        self._ignore_keys = (_pygame.K_LCTRL, _pygame.K_RCTRL,
                              _pygame.K_LSHIFT, _pygame.K_RSHIFT,
                              _pygame.K_NUMLOCK, _pygame.K_CAPSLOCK,
                              _pygame.K_TAB, _pygame.K_RETURN, _pygame.K_ESCAPE)
 
         # Vars to make keydowns repeat after user pressed a key for some time:
         self._block_copy_paste = False  # Blocks event
+        self._clipboard = _Clipboard()
+        self._glyph_run = None  # Rendered input, updated incrementally while typing
         self._key_is_pressed = False
         self._keyrepeat_counters = {}  # {event.key: (counter_int, event.unicode)} (look for "***")
         self._keyrepeat_initial_interval_ms = repeat_keys_initial_ms
@@ -175,6 +345,11 @@ class TextInput(Widget):
         self._maxchar = maxchar
         self._maxwidth = maxwidth
 
+        # Text events
+        self._text_editing = ''  # Text being composed by the input method (IME)
+        self._text_editing_surface = None
+        self._text_events = text_events and _TEXT_EVENTS
+
         # Set default value
         if self._check_input_type(default):
             default = str(default)
@@ -200,6 +375,7 @@ class TextInput(Widget):
         """
         self._input_string = ''
         self._cursor_position = 0
+        self._invalidate_render()
 
     def get_value(self):
         """
@@ -224,28 +400,82 @@ class TextInput(Widget):
         """
         See upper class doc.
         """
-        self._clock.tick()
         self._render()
 
         # Draw string
         surface.blit(self._surface, (self._rect.x, self._rect.y))
+        self.draw_overlay(surface)
+
+    def draw_overlay(self, surface):
+        """
+        See upper class doc.
+        """
+        self._render_cursor()
 
         # Draw cursor
         if self.selected and (self._cursor_visible or (self._mouse_is_pressed or self._key_is_pressed)):
             surface.blit(self._cursor_surface, (self._rect.x + self._cursor_surface_pos[0],
                                                 self._rect.y + self._cursor_surface_pos[1]))
 
+        # Draw the text being composed by the input method after the cursor
+        if self.selected and self._text_editing != '':
+            if self._text_editing_surface is None:
+                self._text_editing_surface = _convert_surface(
+                    self._font.render(self._text_editing, self._font_antialias, self._font_selected_color))
+            surface.blit(self._text_editing_surface, (self._rect.x + self._cursor_surface_pos[0] + 2,
+                                                      self._rect.y))
+
+    def _overlay_state(self):
+        """
+        See upper class doc.
+        """
+        return (self._cursor_visible or self._mouse_is_pressed or self._key_is_pressed,
+                self._cursor_position, self._text_editing)
+
     def _render(self):
         """
         See upper class doc.
         """
-        string = self.label + self._get_input_string()
+        if not self._render_outdated():
+            return
         if self.selected:
             color = self._font_selected_color
         else:
             color = self._font_color
-        self._surface = self.render_string(string, color)
-        self._render_cursor()
+        self._surface = self.render_segments((self.label, self._get_input_string()), color)
+
+    def _render_segment(self, index, string):
+        """
+        See upper class doc.
+
+        The input segment is kept in a glyph run, so typing or deleting at the
+        end of the input renders the changed glyphs only.
+        """
+        if index != 1 or string == '':
+            return super(TextInput, self)._render_segment(index, string)
+        run = self._glyph_run
+        if run is None or not run.matches(self._font, self._font_antialias) or not run.set_string(string):
+            run = _GlyphRun(self._font, self._font_antialias, string)
+            self._glyph_run = run
+        return run.get_surface()
+
+    def clear_cache(self):
+        """
+        See upper class doc.
+        """
+        super(TextInput, self).clear_cache()
+        self._glyph_run = None
+        self._cursor_render = True
+        self._cursor_surface = None
+
+    def get_cache_size(self):
+        """
+        See upper class doc.
+        """
+        size = super(TextInput, self).get_cache_size() + _get_surface_bytes(self._cursor_surface)
+        if self._glyph_run is not None:
+            size += _get_surface_bytes(self._glyph_run._surface)
+        return size
 
     def _render_cursor(self):
         """
@@ -329,6 +559,7 @@ class TextInput(Widget):
         :return: None
         """
         self._cursor_render = True
+        self._invalidate_render()
         if self._maxwidth == 0:
             return
         ls = len(self._input_string)
@@ -488,17 +719,7 @@ class TextInput(Widget):
         See upper class doc.
         """
         self._input_string = text
-
-    def _check_input_size(self):
-        """
-        Check input size.
-
-        :return: True if the input must be limited
-        :rtype: bool
-        """
-        if self._maxchar == 0:
-            return False
-        return self._maxchar < len(self._input_string)
+        self._invalidate_render()
 
     def _check_input_type(self, string):
         """
@@ -533,6 +754,69 @@ class TextInput(Widget):
         except ValueError:
             return False
 
+    def get_event_types(self):
+        """
+        See upper class doc.
+        """
+        event_types = super(TextInput, self).get_event_types()
+        if self._text_events:
+            event_types += (_pygame.TEXTEDITING, _pygame.TEXTINPUT)
+        return event_types
+
+    def _insert_text(self, text):
+        """
+        Insert text at the cursor position. The text is validated, stored in
+        the history and rendered once, as a single edition.
+
+        :param text: Text to insert
+        :type text: basestring
+        :return: True if the text was inserted
+        :rtype: bool
+        """
+        text = text.translate(_CONTROL_CHARS)
+        if text == '':
+            return False
+
+        # Cut text (if limit exists)
+        if self._maxchar != 0:
+            char_limit = self._maxchar - len(self._input_string)
+            if char_limit <= 0:  # If there's not more space, returns
+                self.sound.play_event_error()
+                return False
+            text = text[0:char_limit]
+
+        new_string = self._input_string[0:self._cursor_position] + \
+                     text + \
+                     self._input_string[self._cursor_position:len(self._input_string)]
+
+        # If data is not valid
+        if not self._check_input_type(new_string):
+            self.sound.play_event_error()
+            return False
+
+        self.sound.play_key_add()
+        self._input_string = new_string  # For a purpose of computing render_box
+        self._cursor_position += len(text)
+        for i in range(len(text)):
+            self._update_renderbox(right=1, addition=True)
+        self._update_input_string(new_string)
+        self.change()
+        return True
+
+    def _is_ignored_key(self, key):
+        """
+        Check if the key must not be written into the input, menu navigation
+        keys are read from the control map.
+
+        :param key: Pygame key
+        :type key: int
+        :return: True if the key is ignored
+        :rtype: bool
+        """
+        if key in self._ignore_keys:
+            return True
+        return self._control_map.get_key_action(key) in (_locals.PYGAME_CTRL_DOWN, _locals.PYGAME_CTRL_UP)
+
     def _move_cursor_left(self):
         """
         Move cursor to left position.
@@ -553,15 +837,36 @@ class TextInput(Widget):
         self._cursor_position = min(self._cursor_position + 1, len(self._input_string))
         self._update_renderbox(right=1)
 
+    def set_position(self, posx, posy):
+        """
+        See upper class doc.
+        """
+        position = self._rect.topleft
+        super(TextInput, self).set_position(posx, posy)
+        if position != self._rect.topleft and self.selected and self._text_events and _pygame.display.get_init():
+            _pygame.key.set_text_input_rect(self._rect)  # The candidate list follows the widget
+
+    def _focus(self):
+        """
+        See upper class doc.
+        """
+        if self._text_events and _pygame.display.get_init():
+            _pygame.key.start_text_input()
+            _pygame.key.set_text_input_rect(self._rect)
+
     def _blur(self):
         """
         See upper class doc.
         """
+        if self._text_events and _pygame.display.get_init():
+            _pygame.key.stop_text_input()
         # self._key_is_pressed = False
         self._mouse_is_pressed = False
         self._keyrepeat_mouse_ms = 0
         self._cursor_render = True
         self._cursor_visible = False
+        self._text_editing = ''
+        self._text_editing_surface = None
         # self._history_index = len(self._history) - 1
 
     def _update_input_string(self, new_string):
@@ -597,6 +902,7 @@ class TextInput(Widget):
 
         # Updates string
         self._input_string = new_string
+        self._invalidate_render()
 
     def _copy(self):
         """
@@ -608,7 +914,7 @@ class TextInput(Widget):
             return False
 
         # Copy all text
-        copy(self._input_string)
+        self._clipboard.copy(self._input_string)
 
         self._block_copy_paste = True
         return True
@@ -629,51 +935,30 @@ class TextInput(Widget):
 
     def _paste(self):
         """
-        Paste text from clipboard.
+        Request the text of the clipboard, it is inserted by ``_apply_paste()``
+        when received.
 
-        :return: None
+        :return: True if the text has been inserted
+        :rtype: bool
         """
         if self._block_copy_paste:  # Prevents multiple executions of event
             return False
+        self._block_copy_paste = True
 
-        # Paste text in cursor
-        text = paste().strip()
-        for i in ['\n', '\r']:
-            text = text.replace(i, '')
-
-        # Delete escape chars
-        escapes = ''.join([chr(char) for char in range(1, 32)])
-        text = text.translate(escapes)
-        if text == '':
-            return False
-
-        # Cut string (if limit exists)
-        text_end = len(text)
-        if self._maxchar != 0:
-            char_limit = self._maxchar - len(self._input_string) + 1
-            text_end = min(char_limit, text_end)
-            if text_end <= 0:  # If there's not more space, returns
-                self.sound.play_event_error()
-                return False
+        self._clipboard.paste()
+        return self._apply_paste()
 
-        new_string = self._input_string[0:self._cursor_position] + \
-                     text[0:text_end] + \
-                     self._input_string[self._cursor_position:len(self._input_string)]
+    def _apply_paste(self):
+        """
+        Insert the text received from the clipboard in cursor.
 
-        # If string is valid
-        if self._check_input_type(new_string):
-            self.sound.play_key_add()
-            self._input_string = new_string  # For a purpose of computing render_box
-            for i in range(len(text) + 1):  # Move cursor
-                self._move_cursor_right()
-            self._update_input_string(new_string)
-            self.change()
-            self._block_copy_paste = True
-        else:
-            self.sound.play_event_error()
+        :return: True if the text has been inserted
+        :rtype: bool
+        """
+        text = self._clipboard.get_paste()
+        if text is None:
             return False
-
-        return True
+        return self._insert_text(text.strip())
 
     def _update_from_history(self):
         """
@@ -687,6 +972,7 @@ class TextInput(Widget):
         self._renderbox[2] = self._history_renderbox[self._history_index][2]
         self._cursor_position = self._history_cursor[self._history_index]
         self._cursor_render = True
+        self._invalidate_render()
 
     def _undo(self):
         """
@@ -718,7 +1004,10 @@ class TextInput(Widget):
         """
         See upper class doc.
         """
+        self._clock.tick()
         updated = False
+        text_input = []  # Text of the TEXTINPUT events, inserted as a single edition
+        control_text = []  # Text of the keys bound to controls, their TEXTINPUT events are dropped
 
         for event in events:
             if event.type == _pygame.KEYDOWN:
@@ -732,11 +1021,22 @@ class TextInput(Widget):
                 self._last_key = event.key
 
                 # If none exist, create counter for that key:
-                if event.key not in self._keyrepeat_counters and event.key not in self._ignore_keys:
+                if event.key not in self._keyrepeat_counters and not self._is_ignored_key(event.key):
                     self._keyrepeat_counters[event.key] = [0, event.unicode]
 
+                # Printable keys bound to controls (e.g. by a ControlMap) are not typed
+                control = self._control_map.get_key_action(event.key) is not None
+                if self._text_events and control:
+                    control_text.append(event.unicode)
+
+                # Commands are applied after the text typed before them
+                ctrl = _pygame.key.get_mods() & _pygame.KMOD_CTRL
+                if len(text_input) > 0 and (ctrl or control or not _is_text(event.unicode)):
+                    updated = self._insert_text(''.join(text_input)) or updated
+                    text_input = []
+
                 # User press ctrl+something
-                if _pygame.key.get_mods() & _pygame.KMOD_CTRL:
+                if ctrl:
 
                     # Ctrl+C copy
                     if event.key == _pygame.K_c:
@@ -824,44 +1124,27 @@ class TextInput(Widget):
                     self._update_renderbox(start=True)
                     updated = True
 
-                elif event.key == _ctrl.MENU_CTRL_ENTER:
+                elif self._control_map.get_key_action(event.key) == _locals.PYGAME_CTRL_ENTER:
                     self.sound.play_open_menu()
                     self.apply()
                     updated = True
 
-                elif event.key not in self._ignore_keys:
+                elif not self._text_events and not self._is_ignored_key(event.key):
 
-                    # Check input exceeded the limit returns
-                    if self._check_input_size():
-                        self.sound.play_event_error()
-                        break
+                    # If no special key is pressed, add unicode of key to input_string,
+                    # with text events the text is read from TEXTINPUT instead
+                    if self._insert_text(event.unicode):
+                        updated = True
 
-                    # If no special key is pressed, add unicode of key to input_string
-                    new_string = (
-                            self._input_string[:self._cursor_position]
-                            + event.unicode
-                            + self._input_string[self._cursor_position:]
-                    )
+            elif self._text_events and event.type == _pygame.TEXTINPUT:
+                if event.text in control_text:
+                    control_text.remove(event.text)
+                else:
+                    text_input.append(event.text)
 
-                    # If unwanted escape sequences
-                    event_escaped = repr(event.unicode)
-                    if '\\x' in event_escaped or '\\r' in event_escaped:
-                        _pygame.event.pump()  # Sync events
-                        return False
-
-                    # If data is valid
-                    if self._check_input_type(new_string):
-                        lkey = len(event.unicode)
-                        if lkey > 0:
-                            self.sound.play_key_add()
-                            self._cursor_position += 1  # Some are empty, e.g. K_UP
-                            self._input_string = new_string  # Only here this is changed (due to renderbox update)
-                            self._update_renderbox(right=1, addition=True)
-                            self._update_input_string(new_string)
-                            self.change()
-                            updated = True
-                    else:
-                        self.sound.play_event_error()
+            elif self._text_events and event.type == _pygame.TEXTEDITING:
+                self._text_editing = event.text
+                self._text_editing_surface = None
 
             elif event.type == _pygame.KEYUP:
                 # *** Because KEYUP doesn't include event.unicode, this dict is stored in such a weird way
@@ -875,6 +1158,13 @@ class TextInput(Widget):
             elif self.mouse_enabled and event.type == _pygame.MOUSEBUTTONUP:
                 self._check_mouse_collide_input(event.pos)
 
+        # Insert the text of this frame
+        if len(text_input) > 0:
+            updated = self._insert_text(''.join(text_input)) or updated
+
+        # Insert the text received from the clipboard
+        updated = self._apply_paste() or updated
+
         # Get time clock
         time_clock = self._clock.get_time()
         self._keyrepeat_mouse_ms += time_clock
@@ -897,11 +1187,15 @@ class TextInput(Widget):
                 self._keyrepeat_counters[key][0] = self._keyrepeat_initial_interval_ms - self._keyrepeat_interval_ms
 
                 event_key, event_unicode = key, self._keyrepeat_counters[key][1]
-                # noinspection PyArgumentList
-                _pygame.event.post(_pygame.event.Event(_pygame.KEYDOWN,
-                                                       key=event_key,
-                                                       unicode=event_unicode)
-                                   )
+                if self._text_events and _is_text(event_unicode) and self._control_map.get_key_action(key) is None:
+                    # noinspection PyArgumentList
+                    _pygame.event.post(_pygame.event.Event(_pygame.TEXTINPUT, text=event_unicode))
+                else:
+                    # noinspection PyArgumentList
+                    _pygame.event.post(_pygame.event.Event(_pygame.KEYDOWN,
+                                                           key=event_key,
+                                                           unicode=event_unicode)
+                                       )
 
         # Update self._cursor_visible
         self._cursor_ms_counter += time_clock
@@ -32,11 +32,14 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 from uuid import uuid4
 
+from pygameMenu.controls import ControlMap as _ControlMap
 from pygameMenu.sound import Sound as _Sound
 import pygame as _pygame
 import pygameMenu.config_menu as _cfg
 import pygameMenu.locals as _locals
 import pygameMenu.fonts as _fonts
+from pygameMenu.utils import convert_surface as _convert_surface
+from pygameMenu.utils import get_surface_bytes as _get_surface_bytes
 
 
 class Widget(object):
@@ -69,8 +72,14 @@ class Widget(object):
         self._surface = None  # Rendering surface
         self._render_string_cache = 0
         self._render_string_cache_surface = None
+        self._render_segment_cache = []  # (string, mask, colored masks) of each segment
+        self._render_color_cache = {}  # Composed surface of each color
+        self._render_version = 0  # Increased by every change of the rendered surface
+        self._render_version_drawn = -1  # Version of the current surface
+        self._label = ''
         self._rect = _pygame.Rect(0, 0, 0, 0)
         self._alignment = _locals.PYGAME_ALIGN_CENTER
+        self._control_map = _ControlMap()
         self._fps = 0
 
         self._on_change = onchange
@@ -156,6 +165,38 @@ class Widget(object):
         """
         raise NotImplementedError('Override is mandatory')
 
+    def draw_overlay(self, surface):
+        """
+        Draw the parts of the widget that change on every frame (e.g. a
+        blinking cursor). Menus blit the widget surface and call this method
+        only on the selected widget.
+
+        :param surface: Surface to draw
+        :type surface: pygame.surface.SurfaceType
+        :return: None
+        """
+        pass
+
+    def _overlay_state(self):
+        """
+        Return the state drawn by draw_overlay(), menus drawing offscreen
+        only draw the widget again if it changed.
+
+        :return: Any comparable object
+        :rtype: object
+        """
+        return None
+
+    def get_surface(self):
+        """
+        Return the widget surface, rendering it if changed.
+
+        :return: Widget surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        self._render()
+        return self._surface
+
     def get_rect(self):
         """
         Return the Rect object.
@@ -178,6 +219,20 @@ class Widget(object):
         raise ValueError('{}({}) does not accept value'.format(self.__class__.__name__,
                                                                self.get_id()))
 
+    def get_event_types(self):
+        """
+        Return the event types read by ``update()``.
+
+        :return: Event types
+        :rtype: tuple
+        """
+        event_types = (_pygame.KEYDOWN, _pygame.KEYUP)
+        if self.joystick_enabled:
+            event_types += (_pygame.JOYAXISMOTION, _pygame.JOYBUTTONDOWN, _pygame.JOYHATMOTION)
+        if self.mouse_enabled:
+            event_types += (_pygame.MOUSEBUTTONUP,)
+        return event_types
+
     def get_id(self):
         """
         Returns widget ID.
@@ -192,7 +247,9 @@ class Widget(object):
         Render the widget surface.
 
         This method shall update the attribute ``_surface`` with a pygame.Surface
-        representing the outer borders of the widget.
+        representing the outer borders of the widget. Widgets only render it
+        again if _render_outdated() is True, so every method changing the
+        surface shall call _invalidate_render().
         """
         raise NotImplementedError('Override is mandatory')
 
@@ -219,26 +276,219 @@ class Widget(object):
         :return: Text surface
         :rtype: pygame.surface.SurfaceType
         """
-        render_hash = self.hash_variables(string, color)
-        if render_hash != self._render_string_cache:  # If render changed
+        return self.render_segments((string,), color)
+
+    def render_segments(self, segments, color):
+        """
+        Render a text made of several segments and turn it into a surface.
+        Each segment is rasterized only when its own text changes, so a
+        static label followed by a changing value costs a render of the
+        value only.
 
-            text = self._font.render(string, self._font_antialias, color)
+        Segments are rasterized once as a white mask, text and shadow colors
+        are applied to copies of it and cached, so changing the color (e.g.
+        when the widget is selected) does not render the text again.
 
-            if self._shadow:
-                size = (text.get_width() + 2, text.get_height() + 2)
-                text_bg = self._font.render(string, self._font_antialias, self._shadow_color)
-                # noinspection PyArgumentList
-                surface = _pygame.Surface(size, _pygame.SRCALPHA, 32).convert_alpha()
-                surface.blit(text_bg, self._shadow_tuple)
-                surface.blit(text, (0, 0))
+        :param segments: Texts to render, one after another
+        :type segments: list, tuple
+        :param color: Text color
+        :type color: tuple
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        render_hash = self.hash_variables(tuple(segments), color)
+        if render_hash == self._render_string_cache:
+            return self._render_string_cache_surface
+
+        # Render the segments that changed
+        cache = self._render_segment_cache
+        if len(cache) != len(segments):
+            del cache[len(segments):]
+            self._render_color_cache = {}
+        for i in range(len(segments)):
+            string = segments[i]
+            if i < len(cache) and cache[i][0] == string:
+                continue
+            segment = (string, self._render_segment(i, string), {})  # Text, mask, colored masks
+            if i < len(cache):
+                cache[i] = segment
+            else:
+                cache.append(segment)
+            self._render_color_cache = {}
+
+        # Compose the segments, or use a previous composition of the same color
+        surface = self._render_color_cache.get(color)
+        if surface is None:
+            # Empty segments are skipped, an empty text keeps the font height
+            visible = [segment for segment in cache if segment[0] != ''] or cache[:1]
+            texts = [self._tint_segment(segment, color) for segment in visible]
+            if len(texts) == 1 and not self._shadow:
+                surface = texts[0]
+            else:
+                surface = self._compose_segments(texts, [self._tint_segment(segment, self._shadow_color)
+                                                         for segment in visible])
+            self._render_color_cache[color] = surface
+
+        self._render_string_cache = render_hash
+        self._render_string_cache_surface = surface
+        return surface
+
+    def _compose_segments(self, texts, shadows):
+        """
+        Blit the text surfaces one after another, over their shadows if
+        shadow is enabled.
+
+        :param texts: Text surfaces
+        :type texts: list
+        :param shadows: Shadow surfaces
+        :type shadows: list
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        width = 0
+        height = 0
+        for text in texts:
+            width += text.get_width()
+            height = max(height, text.get_height())
+        if self._shadow:
+            width += 2
+            height += 2
+        # noinspection PyArgumentList
+        surface = _pygame.Surface((max(width, 1), max(height, 1)), _pygame.SRCALPHA, 32)
+        if self._shadow:
+            x = self._shadow_tuple[0]
+            for text in shadows:
+                surface.blit(text, (x, self._shadow_tuple[1]))
+                x += text.get_width()
+        x = 0
+        for text in texts:
+            surface.blit(text, (x, 0))
+            x += text.get_width()
+        return _convert_surface(surface)
+
+    @staticmethod
+    def _tint_segment(segment, color):
+        """
+        Return the mask of a segment in the given color, converted to the
+        display format.
+
+        :param segment: Segment (text, mask, colored masks)
+        :type segment: tuple
+        :param color: Text color
+        :type color: tuple
+        :return: Colored text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        key = tuple(color)
+        text = segment[2].get(key)
+        if text is None:
+            text = segment[1].copy()
+            if text.get_bitsize() == 8:  # Text without antialias is rendered with a palette
+                text.set_palette_at(1, key[:3])
             else:
-                surface = text
+                text.fill((key[0], key[1], key[2], 255), special_flags=_pygame.BLEND_RGBA_MULT)
+            text = _convert_surface(text)
+            segment[2][key] = text
+        return text
 
-            self._render_string_cache = render_hash
-            self._render_string_cache_surface = surface
+    def _render_segment(self, index, string):
+        """
+        Rasterize a segment of the text rendered by render_segments() as a
+        white mask.
+
+        :param index: Segment position
+        :type index: int
+        :param string: Segment text
+        :type string: basestring
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        return self._font.render(string, self._font_antialias, (255, 255, 255))
+
+    def _clear_render_cache(self):
+        """
+        Clear the rendered strings, used when the font or shadow changes.
+
+        :return: None
+        """
+        self._render_string_cache = 0
+        self._render_string_cache_surface = None
+        self._render_segment_cache = []
+        self._render_color_cache = {}
+        self._invalidate_render()
+
+    def clear_cache(self):
+        """
+        Drop all the rendered surfaces to free memory, they are rendered
+        again when the widget is drawn.
+
+        :return: None
+        """
+        self._clear_render_cache()
+        self._surface = None
 
-        # Return rendered surface
-        return self._render_string_cache_surface
+    def get_cache_size(self):
+        """
+        Return the memory used by the rendered surfaces of the widget.
+
+        :return: Size (bytes)
+        :rtype: int
+        """
+        surfaces = {}  # Surfaces are shared between the caches
+        for segment in self._render_segment_cache:
+            surfaces[id(segment[1])] = segment[1]
+            for text in segment[2].values():
+                surfaces[id(text)] = text
+        for text in self._render_color_cache.values():
+            surfaces[id(text)] = text
+        for surface in (self._render_string_cache_surface, self._surface):
+            if surface is not None:
+                surfaces[id(surface)] = surface
+        return sum(_get_surface_bytes(surface) for surface in surfaces.values())
+
+    def _invalidate_render(self):
+        """
+        Mark the widget surface as outdated, it is rendered again on the next
+        call to _render().
+
+        :return: None
+        """
+        self._render_version += 1
+
+    def _render_outdated(self):
+        """
+        Check if the widget changed since its surface was rendered, and mark
+        the surface as updated.
+
+        :return: True if the surface must be rendered again
+        :rtype: bool
+        """
+        if self._render_version == self._render_version_drawn and self._surface is not None:
+            return False
+        self._render_version_drawn = self._render_version
+        return True
+
+    @property
+    def label(self):
+        """
+        Text of the widget.
+
+        :return: Label
+        :rtype: basestring
+        """
+        return self._label
+
+    @label.setter
+    def label(self, label):
+        """
+        Set the text of the widget.
+
+        :param label: Label
+        :type label: basestring
+        :return: None
+        """
+        self._label = label
+        self._invalidate_render()
 
     def set_font(self, font, font_size, color, selected_color, antialias=True):
         """
@@ -261,6 +511,7 @@ class Widget(object):
         self._font_color = color
         self._font_selected_color = selected_color
         self._font_antialias = antialias
+        self._clear_render_cache()
         self._apply_font()
 
     def _apply_font(self):
@@ -281,8 +532,11 @@ class Widget(object):
         :type posy: int, float
         :return: None
         """
-        self._rect.x = posx
-        self._rect.y = posy
+        posx, posy = int(posx), int(posy)  # Compare the stored position, layouts use floats
+        if self._rect.x != posx or self._rect.y != posy:
+            self._rect.x = posx
+            self._rect.y = posy
+            self._invalidate_render()
 
     def set_alignment(self, align):
         """
@@ -316,6 +570,7 @@ class Widget(object):
         :return: None
         """
         self.selected = selected
+        self._invalidate_render()
         if selected:
             self._focus()
         else:
@@ -391,6 +646,7 @@ class Widget(object):
 
         # Create shadow tuple position
         self._create_shadow_tuple()
+        self._clear_render_cache()
 
     def set_fps(self, fps):
         """
@@ -464,6 +720,17 @@ class Widget(object):
         self.joystick_enabled = joystick
         self.mouse_enabled = mouse
 
+    def set_control_map(self, control_map):
+        """
+        Set the map of controls used by the widget.
+
+        :param control_map: Control map
+        :type control_map: pygameMenu.controls.ControlMap
+        :return: None
+        """
+        assert isinstance(control_map, _ControlMap)
+        self._control_map = control_map
+
     def set_value(self, value):
         """
         Set the value.
@@ -0,0 +1,104 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST UTILS
+Helpers of the headless tests.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+
+# Run without a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pygameMenu
+from pygameMenu.widgets.widget import Widget
+
+pygame.init()
+
+# Window size of the test menus
+W_SIZE = 600
+surface = pygame.display.set_mode((W_SIZE, W_SIZE))
+
+
+def create_menu(title='Menu', menu_class=pygameMenu.Menu, **kwargs):
+    """
+    Return a menu that does not pause the execution.
+
+    :param title: Title of the menu
+    :type title: basestring
+    :param menu_class: Menu class
+    :type menu_class: type
+    :param kwargs: Additional parameters of the menu
+    :return: Menu
+    :rtype: pygameMenu.Menu
+    """
+    return menu_class(surface, W_SIZE, W_SIZE, pygameMenu.fonts.FONT_8BIT, title, dopause=False, **kwargs)
+
+
+def get_pixels(surface):
+    """
+    Return the color of each pixel of a surface.
+
+    :param surface: Surface
+    :type surface: pygame.surface.SurfaceType
+    :return: Colors by row
+    :rtype: list
+    """
+    width, height = surface.get_size()
+    return [[tuple(surface.get_at((x, y))) for x in range(width)] for y in range(height)]
+
+
+def keydown(key, unicode=''):
+    """
+    Return a key down event.
+
+    :param key: Key
+    :type key: int
+    :param unicode: Typed text
+    :type unicode: basestring
+    :return: Event
+    :rtype: pygame.event.EventType
+    """
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)
+
+
+class KeyTestCase(unittest.TestCase):
+    """
+    Test case that accepts the key events created by the tests, the dummy
+    video driver does not report any key as pressed.
+    """
+
+    def setUp(self):
+        self._check_key_pressed_valid = Widget.__dict__['check_key_pressed_valid']
+        Widget.check_key_pressed_valid = staticmethod(lambda event: True)
+
+    def tearDown(self):
+        Widget.check_key_pressed_valid = self._check_key_pressed_valid
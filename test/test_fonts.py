@@ -0,0 +1,257 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST FONTS
+Test the font renderers.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from contextlib import redirect_stdout
+
+from _utils import create_menu, get_pixels, surface, W_SIZE
+from pygameMenu.atlas import FontAtlas, load_atlas
+from pygameMenu.fontchain import get_coverage
+from pygameMenu.ftfont import FreeTypeFont
+from pygameMenu.widgets.textinput import _GlyphRun
+import pygame
+import pygameMenu
+import pygameMenu.fontchain
+import pygameMenu.locals as _locals
+import pygameMenu.prebake as prebake
+
+RENDERERS = (_locals.PYGAME_RENDERER_ATLAS, _locals.PYGAME_RENDERER_FONT, _locals.PYGAME_RENDERER_FREETYPE,
+             _locals.PYGAME_RENDERER_PIXEL)
+
+
+class FontsTest(unittest.TestCase):
+
+    def tearDown(self):
+        pygameMenu.fonts.set_default_renderer(_locals.PYGAME_RENDERER_FONT)
+
+    @staticmethod
+    def _get_visible(surface):
+        """
+        Return the color of the visible pixels, the color of the transparent
+        ones depends on the renderer.
+
+        :param surface: Surface
+        :type surface: pygame.surface.SurfaceType
+        :return: Colors by row, None if transparent
+        :rtype: list
+        """
+        return [[pixel if pixel[3] > 0 else None for pixel in row] for row in get_pixels(surface)]
+
+    def test_empty_text(self):
+        """
+        Test that all the renderers render an empty text with the font height.
+        """
+        for renderer in RENDERERS:
+            font = pygameMenu.fonts.get_font(pygameMenu.fonts.FONT_8BIT, 24, renderer)
+            for background in (None, (0, 0, 0)):
+                surface = font.render('', True, (255, 0, 0), background)
+                self.assertEqual(surface.get_height(), font.get_height(), renderer)
+                self.assertEqual(surface.get_size(), font.size(''), renderer)
+
+    def test_empty_widgets(self):
+        """
+        Test that menus with empty texts are drawn with all the renderers.
+        """
+        for renderer in RENDERERS:
+            pygameMenu.fonts.set_default_renderer(renderer)
+            menu = create_menu()
+            menu.add_text_input('')
+            menu.add_option('', pygameMenu.events.PYGAMEMENU_CLOSE)
+            menu.draw()
+
+    def test_atlas(self):
+        """
+        Test that the atlas renders the same text as pygame.font, rasterizing
+        each glyph once.
+        """
+        text = 'Hello, AVA!'
+        for name in (pygameMenu.fonts.FONT_8BIT, pygameMenu.fonts.FONT_OPEN_SANS):
+            atlas = FontAtlas(name, 24)
+            font = pygame.font.Font(name, 24)
+            self.assertEqual(atlas.size(text), font.size(text))
+            for antialias in (True, False):
+                surface = atlas.render(text, antialias, (255, 0, 0))
+                expected = font.render(text, antialias, (255, 0, 0)).convert_alpha()
+                self.assertEqual(self._get_visible(surface), self._get_visible(expected), name)
+            self.assertEqual(sorted(atlas._glyphs[True].keys()), sorted(set(text)))
+
+        # Glyphs in the atlas are not rendered again
+        rendered = []
+
+        class Font(object):
+            def __getattr__(self, name):
+                return getattr(font, name)
+
+            @staticmethod
+            def render(*args):
+                rendered.append(args[0])
+                return font.render(*args)
+
+        atlas._font = Font()
+        atlas.render(text[::-1], True, (0, 0, 255))
+        self.assertEqual(rendered, [])
+        atlas.render('Hi', True, (0, 0, 255))
+        self.assertEqual(rendered, ['i'])
+
+    def test_prebake(self):
+        """
+        Test that the prebaked atlases are loaded by get_font(), and render
+        the prebaked text without loading the font file.
+        """
+        cache_env = os.environ.get('PYGAMEMENU_CACHE')
+        cache_dir = tempfile.mkdtemp()
+        os.environ['PYGAMEMENU_CACHE'] = cache_dir
+        fonts = [(pygameMenu.fonts.FONT_8BIT, 20), (pygameMenu.fonts.FONT_OPEN_SANS, 18)]
+        try:
+            text = os.path.join(cache_dir, 'text.txt')
+            with open(text, 'w') as f:
+                f.write('Play\n\nQuit\n')
+            output = io.StringIO()
+            with redirect_stdout(output):
+                prebake.main(['8BIT:20', 'OPEN_SANS:18', '--text', text, '--jobs', '2'])
+            self.assertEqual(len(output.getvalue().splitlines()), 2)
+            self.assertEqual(prebake.parse_font('OPEN_SANS:18'), fonts[1])
+
+            for name, size in fonts:
+                atlas = load_atlas(name, size)
+                self.assertIsNotNone(atlas)
+                self.assertEqual(sorted(atlas._widths.keys()), ['Play', 'Quit'])
+                pygameMenu.fonts._atlas_cache.pop((name, size), None)
+                font = pygameMenu.fonts.get_font(name, size, _locals.PYGAME_RENDERER_ATLAS)
+                expected = pygame.font.Font(name, size).render('Play', True, (255, 255, 255)).convert_alpha()
+                self.assertEqual(self._get_visible(font.render('Play', True, (255, 255, 255))),
+                                 self._get_visible(expected))
+                self.assertIsNone(font._font)  # Font file not loaded
+        finally:
+            for name, size in fonts:
+                pygameMenu.fonts._atlas_cache.pop((name, size), None)
+            shutil.rmtree(cache_dir)
+            if cache_env is None:
+                del os.environ['PYGAMEMENU_CACHE']
+            else:
+                os.environ['PYGAMEMENU_CACHE'] = cache_env
+
+    def test_freetype(self):
+        """
+        Test that the FreeType font renders into a surface the same text as
+        render(), and that styles share the loaded font.
+        """
+        font = FreeTypeFont(pygameMenu.fonts.FONT_OPEN_SANS, 24)
+        text = 'Typed jy'
+        for antialias in (True, False):
+            rendered = font.render(text, antialias, (255, 0, 0))
+            self.assertEqual(rendered.get_size(), font.size(text))
+            size = (rendered.get_width() + 10, rendered.get_height() + 10)
+            # noinspection PyArgumentList
+            surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+            surface.fill((0, 0, 0, 0))
+            font.render_to(surface, (5, 5), text, antialias, (255, 0, 0))
+            # noinspection PyArgumentList
+            expected = pygame.Surface(size, pygame.SRCALPHA, 32)
+            expected.fill((0, 0, 0, 0))
+            expected.blit(rendered, (5, 5))
+            self.assertEqual(self._get_visible(surface), self._get_visible(expected), antialias)
+
+        # Widths of consecutive texts add up
+        self.assertEqual(font.size('ab')[0], font.size('a')[0] + font.size('b')[0])
+        self.assertEqual(len(font.get_metrics(text)), len(text))
+
+        strong = font.get_styled(strong=True)
+        self.assertIs(strong._font, font._font)
+        self.assertGreater(sum(pixel[3] for row in get_pixels(strong.render(text, True, (0, 0, 0))) for pixel in row),
+                           sum(pixel[3] for row in get_pixels(font.render(text, True, (0, 0, 0))) for pixel in row))
+
+    def test_font_chain(self):
+        """
+        Test that each character is rendered with the first font that has its
+        glyph, using the coverage cached on disk.
+        """
+        cache_env = os.environ.get('PYGAMEMENU_CACHE')
+        cache_dir = tempfile.mkdtemp()
+        os.environ['PYGAMEMENU_CACHE'] = cache_dir
+        names = [pygameMenu.fonts.FONT_8BIT, pygameMenu.fonts.FONT_OPEN_SANS]
+        files = [pygameMenu.fonts.get_font_file(name) for name in names]
+        try:
+            for name in files:
+                pygameMenu.fontchain._coverages.pop(name, None)
+            chain = pygameMenu.fonts.get_font(names, 20)
+            self.assertEqual(chain._get_runs('Ab\xe9 \u0436'), [(0, 'Ab'), (1, '\xe9'), (0, ' '), (1, '\u0436')])
+            self.assertEqual(chain._get_runs('A\u4e2d'), [(0, 'A\u4e2d')])  # Missing in all the fonts
+            fonts = chain._fonts
+            self.assertEqual(chain.size('Ab\xe9')[0], fonts[0].size('Ab')[0] + fonts[1].size('\xe9')[0])
+            self.assertEqual(chain.render('Ab\xe9', True, (255, 255, 255)).get_size(), chain.size('Ab\xe9'))
+
+            # The coverage is loaded from the disk without loading the font
+            bitmaps = [pygameMenu.fontchain._coverages.pop(name).bitmap for name in files]
+            for name, bitmap in zip(files, bitmaps):
+                coverage = get_coverage(name)
+                self.assertEqual(coverage.bitmap, bitmap)
+                coverage.has_glyph('\xe9')
+                self.assertIsNone(coverage._font)
+
+            # Menus accept the fallback fonts
+            menu = pygameMenu.Menu(surface, W_SIZE, W_SIZE, names, 'Men\xfa', dopause=False)
+            button = menu.add_option('Caf\xe9', pygameMenu.events.PYGAMEMENU_CLOSE)
+            menu.draw()
+            self.assertIsInstance(button._font, pygameMenu.fontchain.FontChain)
+            self.assertEqual(button.get_rect().width, button._font.size('Caf\xe9')[0])
+        finally:
+            for name in files:
+                pygameMenu.fontchain._coverages.pop(name, None)
+            shutil.rmtree(cache_dir)
+            if cache_env is None:
+                del os.environ['PYGAMEMENU_CACHE']
+            else:
+                os.environ['PYGAMEMENU_CACHE'] = cache_env
+
+    def test_glyph_run(self):
+        """
+        Test that typing at the end of a text renders the same as rendering
+        the whole text.
+        """
+        for renderer in RENDERERS:
+            font = pygameMenu.fonts.get_font(pygameMenu.fonts.FONT_8BIT, 24, renderer)
+            for antialias in (True, False):
+                run = _GlyphRun(font, antialias, 'a')
+                for i in range(2, 6):
+                    self.assertTrue(run.set_string('abcde'[:i]))
+                expected = _GlyphRun(font, antialias, 'abcde').get_surface()
+                self.assertEqual(get_pixels(run.get_surface()), get_pixels(expected), renderer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST IMPORT
+Test the import time of the package.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import os
+import subprocess
+import sys
+import types
+import unittest
+
+import pygameMenu
+
+# Budget of the cumulative time of "import pygameMenu" (us), about ten times
+# the import of the constants and events only
+IMPORT_BUDGET = 30000
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTest(unittest.TestCase):
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'Submodules are imported lazily from Python 3.7')
+    def test_import_time(self):
+        """
+        Test that importing the package does not import pygame, and that it
+        takes less than the budget.
+        """
+        env = dict(os.environ)
+        env['PYTHONPATH'] = _ROOT
+        code = 'import sys; import pygameMenu; print("\\n".join(sys.modules.keys()))'
+        process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', code], cwd=_ROOT, env=env,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        out, err = process.communicate()
+        self.assertEqual(process.returncode, 0, err)
+
+        modules = out.splitlines()
+        self.assertFalse('pygame' in modules, 'pygame is imported')
+        self.assertFalse('pygameMenu.menu' in modules, 'pygameMenu.menu is imported')
+
+        # Lines are "import time: self | cumulative | package"
+        cumulative = None
+        for line in err.splitlines():
+            columns = line.split('|')
+            if len(columns) == 3 and columns[2].strip() == 'pygameMenu':
+                cumulative = int(columns[1])
+        self.assertIsNotNone(cumulative, err)
+        self.assertLess(cumulative, IMPORT_BUDGET)
+
+    def test_submodules(self):
+        """
+        Test that the submodules imported by the package before are still its
+        attributes.
+        """
+        for name in ('config_controls', 'config_menu', 'config_textmenu', 'events', 'fonts', 'locals', 'menu',
+                     'sound', 'textmenu', 'widgets'):
+            self.assertIsInstance(getattr(pygameMenu, name), types.ModuleType, name)
+        self.assertIs(pygameMenu.sound.Sound, pygameMenu.Sound)
+        self.assertIn('widgets', dir(pygameMenu))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST LOADER
+Test the declarative menu definitions.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from _utils import surface
+import pygameMenu.loader as loader
+
+DEFINITION = {
+    'root': 'main',
+    'styles': {'base': {'font': '8BIT', 'font_size': 30, 'bgfun': 'background', 'onclose': 'DISABLE_CLOSE'}},
+    'menus': {
+        'main': {
+            'title': 'Main menu',
+            'style': 'base',
+            'widgets': [
+                {'type': 'option', 'label': 'Play', 'menu': 'play'},
+                {'type': 'option', 'label': 'Quit', 'event': 'EXIT'}
+            ]
+        },
+        'play': {
+            'title': 'Play menu',
+            'style': 'base',
+            'widgets': [
+                {'type': 'option', 'label': 'Start', 'callback': 'start', 'args': ['EASY']},
+                {'type': 'selector', 'label': 'Mode', 'id': 'mode', 'values': [['Easy', 1], ['Hard', 2]]},
+                {'type': 'text_input', 'label': 'Name: ', 'id': 'name', 'default': 'bob'},
+                {'type': 'option', 'label': 'Back', 'event': 'BACK'}
+            ]
+        }
+    }
+}
+
+
+class LoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self._cache_env = os.environ.get('PYGAMEMENU_CACHE')
+        self._dir = tempfile.mkdtemp()
+        os.environ['PYGAMEMENU_CACHE'] = os.path.join(self._dir, 'cache')
+        self._file = os.path.join(self._dir, 'menus.json')
+        with open(self._file, 'w') as f:
+            json.dump(DEFINITION, f)
+
+    def tearDown(self):
+        if self._cache_env is None:
+            del os.environ['PYGAMEMENU_CACHE']
+        else:
+            os.environ['PYGAMEMENU_CACHE'] = self._cache_env
+        shutil.rmtree(self._dir)
+
+    def test_compiled_cache(self):
+        """
+        Test that a file is compiled once, and that the menus built from the
+        compiled cache are the same.
+        """
+        compiled = []
+        compile_definition = loader.compile_definition
+
+        def compile_count(definition):
+            compiled.append(definition)
+            return compile_definition(definition)
+
+        started = []
+        callbacks = {'background': lambda: None, 'start': started.append}
+        loader.compile_definition = compile_count
+        try:
+            first = loader.load_menus(self._file, surface, callbacks)
+            second = loader.load_menus(self._file, surface, callbacks)
+        finally:
+            loader.compile_definition = compile_definition
+        self.assertEqual(len(compiled), 1)
+        self.assertEqual(len(os.listdir(os.environ['PYGAMEMENU_CACHE'])), 1)
+
+        for menus in (first, second):
+            self.assertEqual(sorted(menus.keys()), ['main', 'play'])
+            self.assertEqual(menus['main'].get_title(), 'Main menu')
+            self.assertEqual(menus['play'].get_input_data(), {'mode': ('Easy', 0), 'name': 'bob'})
+            menus['play'].get_widget('mode')  # Widgets keep their ID
+            menus['play']._option[0].apply()
+        self.assertEqual(started, ['EASY', 'EASY'])
+
+    def test_unknown_keys(self):
+        """
+        Test that unknown keys of the definition are rejected.
+        """
+        definition = json.loads(json.dumps(DEFINITION))
+        definition['menus']['play']['bogus'] = 1
+        self.assertRaises(ValueError, loader.compile_definition, definition)
+
+        definition = json.loads(json.dumps(DEFINITION))
+        definition['menus']['play']['options'] = {'bogus': 1}
+        self.assertRaises(ValueError, loader.compile_definition, definition)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,348 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST MENU
+Test the menu navigation and caches.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import gc
+import unittest
+import weakref
+
+from _utils import create_menu, keydown, KeyTestCase, surface, W_SIZE
+from pygameMenu.controls import ControlMap
+import pygame
+import pygameMenu
+
+
+class MenuTest(KeyTestCase):
+
+    def test_hit_test(self):
+        """
+        Test that the option below the mouse is found, and that the motion
+        events of a frame select it once.
+        """
+        menu = create_menu()
+        buttons = [menu.add_option('Option {0}'.format(i), pygameMenu.events.PYGAMEMENU_BACK) for i in range(5)]
+        menu.mainloop([])
+        for i in range(len(buttons)):
+            rect = buttons[i].get_rect()
+            self.assertEqual(menu._get_option_index_at(rect.center), i)
+            self.assertEqual(menu._get_option_index_at(rect.topleft), i)
+        self.assertEqual(menu._get_option_index_at((0, 0)), -1)
+        self.assertEqual(menu._get_option_index_at(buttons[-1].get_rect().move(0, 100).center), -1)
+
+        # Hover selects the option below the last motion event, playing one sound
+        played = []
+        menu._sounds.play_key_add = lambda: played.append(menu._index)
+        events = [pygame.event.Event(pygame.MOUSEMOTION, pos=buttons[i].get_rect().center, rel=(0, 0),
+                                     buttons=(0, 0, 0)) for i in (1, 2, 3)]
+        menu.mainloop(events)
+        self.assertEqual(menu._index, 3)
+        self.assertEqual(played, [3])
+        menu.mainloop(events[-1:])
+        self.assertEqual(played, [3])
+
+    def test_filter_events(self):
+        """
+        Test that the events not used by a pausing menu are blocked while it
+        runs, and that the filters of the application are kept.
+        """
+        blocked = []
+
+        def bgfun():
+            blocked.append((pygame.event.get_blocked(pygame.JOYBALLMOTION), pygame.event.get_blocked(pygame.KEYDOWN)))
+            if len(blocked) == 1:
+                pygame.event.post(keydown(pygame.K_RETURN))
+            self.assertLess(len(blocked), 10, 'the menu was not closed')
+
+        menu = pygameMenu.Menu(surface, W_SIZE, W_SIZE, pygameMenu.fonts.FONT_8BIT, 'Menu', bgfun=bgfun,
+                               filter_events=True, onclose=lambda: None)
+        menu.add_option('Close', pygameMenu.events.PYGAMEMENU_CLOSE)
+        self.assertIn(pygame.MOUSEMOTION, menu.get_event_types())
+        self.assertNotIn(pygame.JOYBALLMOTION, menu.get_event_types(recursive=True))
+        pygame.event.clear()
+        pygame.event.set_blocked(pygame.DROPFILE)
+        try:
+            menu.mainloop()
+            self.assertEqual(blocked[0], (True, False))
+            self.assertFalse(pygame.event.get_blocked(pygame.JOYBALLMOTION))
+            self.assertTrue(pygame.event.get_blocked(pygame.DROPFILE))
+        finally:
+            pygame.event.set_allowed(pygame.DROPFILE)
+
+    def test_background_snapshot(self):
+        """
+        Test that a pausing menu draws the captured background instead of
+        calling bgfun on every frame.
+        """
+        captured = []
+        frames = []
+
+        def bgfun():
+            captured.append(len(frames))
+            surface.fill((200, 100, 50))
+
+        def step():
+            frames.append(step)
+            if len(frames) == 2:
+                menu.refresh_background()
+            if len(frames) % 3 == 0:
+                menu.disable()
+            else:
+                pygame.event.post(keydown(pygame.K_RETURN))
+
+        menu = pygameMenu.Menu(surface, W_SIZE, W_SIZE, pygameMenu.fonts.FONT_8BIT, 'Menu', bgfun=bgfun)
+        menu.add_option('Step', step)
+        menu.set_background_snapshot(dim=0.5, blur=2)
+        pygame.event.clear()
+        pygame.event.post(keydown(pygame.K_RETURN))
+        menu.mainloop()
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(captured, [0, 2])
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (99, 49, 24))  # Darkened
+
+        # The background is captured again when the menu is opened
+        menu.enable()
+        pygame.event.post(keydown(pygame.K_RETURN))
+        menu.mainloop()
+        self.assertEqual(captured, [0, 2, 3])
+
+    def test_factory(self):
+        """
+        Test that submenus of a factory are built when opened, with the
+        settings applied to the parent menus before.
+        """
+        built = []
+
+        def build(title):
+            menu = create_menu(title)
+            menu.add_text_input('Name: ', textinput_id='name')
+            built.append(menu)
+            return menu
+
+        menu = create_menu()
+        factory = pygameMenu.MenuFactory(build, 'Submenu')
+        button = menu.add_option('Submenu', factory)
+        menu.set_logical_resolution()
+        menu.mainloop([])
+        self.assertEqual(built, [])
+
+        # Only the built submenus are read
+        self.assertEqual(menu.get_input_data(recursive=True), {})
+        self.assertEqual(built, [])
+
+        button.apply()
+        self.assertEqual(len(built), 1)
+        self.assertTrue(factory.is_built())
+        self.assertIs(menu._actual, built[0])
+        self.assertTrue(built[0]._logical_enabled)  # Recorded setting
+        self.assertEqual(menu.get_input_data(recursive=True), {'name': ''})
+
+        # The submenu is built once
+        menu.reset(1)
+        button.apply()
+        self.assertEqual(len(built), 1)
+
+        # Searching a widget builds the submenus if it is not found in the others
+        menu = create_menu()
+        menu.add_option('Submenu', pygameMenu.MenuFactory(build, 'Submenu'))
+        self.assertIs(menu.get_widget('name', recursive=True), built[1].get_widget('name'))
+
+    def test_logical_resolution(self):
+        """
+        Test that the offscreen surfaces are allocated only for the drawn
+        menus.
+        """
+        menu = create_menu()
+        submenu = create_menu('Submenu')
+        submenu.add_option('Back', pygameMenu.events.PYGAMEMENU_BACK)
+        menu.add_option('Submenu', submenu)
+        menu.set_logical_resolution()
+        self.assertIsNone(menu._logical)
+        self.assertIsNone(submenu._logical)
+
+        menu.mainloop([])
+        self.assertIsNotNone(menu._logical)
+        self.assertIsNone(submenu._logical)
+
+        # The submenu is drawn at logical resolution once opened
+        menu._option[0].apply()
+        menu.draw()
+        self.assertIsNotNone(submenu._logical)
+        self.assertEqual(submenu._logical.get_size(), submenu._window_size)
+
+        # Disabling releases the offscreen surfaces
+        menu.set_logical_resolution(False)
+        self.assertIsNone(menu._logical)
+        self.assertIsNone(submenu._logical)
+        menu.draw()
+        self.assertIsNone(submenu._logical)
+        self.assertIs(submenu._surface, submenu._window)
+
+    def test_logical_resolution_scale(self):
+        """
+        Test that the menu is scaled to the target surface keeping the aspect
+        ratio, and that clicks are mapped to the logical resolution.
+        """
+        target = pygame.Surface((2 * W_SIZE, 3 * W_SIZE // 2))
+        menu = pygameMenu.Menu(target, W_SIZE, W_SIZE, pygameMenu.fonts.FONT_8BIT, 'Menu', dopause=False)
+        buttons = [menu.add_option('Option {0}'.format(i), pygameMenu.events.PYGAMEMENU_BACK) for i in range(3)]
+        menu.set_logical_resolution()
+        menu.mainloop([])
+        scale, offsetx, offsety = menu._logical_transform
+        self.assertEqual((scale, offsetx, offsety), (1.5, W_SIZE / 4, 0))
+        self.assertAlmostEqual(menu._logical_scaled.get_width(), menu._rect.width * scale, delta=2)
+        self.assertEqual(tuple(target.get_at((int(offsetx) - 1, target.get_height() // 2))), (0, 0, 0, 255))
+        self.assertNotEqual(tuple(target.get_at(target.get_rect().center)), (0, 0, 0, 255))
+
+        rect = buttons[2].get_rect()
+        pos = (int(offsetx + rect.centerx * scale), int(offsety + rect.centery * scale))
+        menu.mainloop([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)])
+        self.assertEqual(menu._index, 2)
+
+    def test_cache_budget(self):
+        """
+        Test that the caches of the least recently opened menus are cleared
+        when the budget is exceeded.
+        """
+        menu = create_menu()
+        submenus = []
+        for i in range(3):
+            submenu = create_menu('Submenu {0}'.format(i))
+            for j in range(5):
+                submenu.add_option('Option {0}'.format(j), pygameMenu.events.PYGAMEMENU_BACK)
+            menu.add_option('Submenu {0}'.format(i), submenu)
+            submenus.append(submenu)
+        menu.mainloop([])
+        for submenu in submenus:
+            menu._open(submenu)
+            menu.draw()
+            menu.reset(1)
+        menu.draw()
+        sizes = [submenu.get_cache_size() for submenu in submenus]
+        total = menu.get_cache_size(recursive=True)
+        self.assertEqual(total, menu.get_cache_size() + sum(sizes))
+        self.assertTrue(all(size > 0 for size in sizes))
+
+        # The first opened submenu is cleared
+        menu.set_cache_budget(total - 1)
+        self.assertEqual(submenus[0].get_cache_size(), 0)
+        self.assertEqual([submenu.get_cache_size() for submenu in submenus[1:]], sizes[1:])
+
+        # Opened again, it is rendered again and the next one is cleared
+        menu._open(submenus[0])
+        menu.draw()
+        self.assertEqual(submenus[0].get_cache_size(), sizes[0])
+        menu.reset(1)
+        self.assertEqual(submenus[1].get_cache_size(), 0)
+        self.assertEqual(submenus[2].get_cache_size(), sizes[2])
+
+        # The displayed menu is never cleared
+        menu.set_cache_budget(0)
+        self.assertEqual(menu.get_cache_size(recursive=True), menu.get_cache_size())
+        self.assertGreater(menu.get_cache_size(), 0)
+        menu.clear_cache(recursive=True)
+        self.assertEqual(menu.get_cache_size(recursive=True), 0)
+
+        # The offscreen surface of the logical resolution is counted and released
+        menu.set_logical_resolution()
+        menu.draw()
+        size = menu.get_cache_size()
+        self.assertGreater(size, menu._logical.get_width() * menu._logical.get_height() * 4)
+        menu.clear_cache()
+        self.assertIsNone(menu._logical)
+        self.assertEqual(menu.get_cache_size(), 0)
+        menu.draw()
+        self.assertIsNotNone(menu._logical)
+        self.assertEqual(menu.get_cache_size(), size)
+
+    def test_navigation_stack(self):
+        """
+        Test opening nested menus and going back several levels at once.
+        """
+        menus = [create_menu('Menu {0}'.format(i)) for i in range(4)]
+        for i in range(3):
+            menus[i].add_option('Next', menus[i + 1])
+            menus[i].add_option('Back', pygameMenu.events.PYGAMEMENU_BACK)
+        menus[3].add_option('Back', pygameMenu.events.PYGAMEMENU_BACK)
+        top = menus[0]
+        top.mainloop([])
+
+        for i in range(3):  # Options are applied from the displayed menu
+            top._actual._option[0].apply()
+            self.assertIs(top._actual, menus[i + 1])
+        self.assertEqual(list(top._stack), menus)
+        self.assertNotIn('draw', top.__dict__)  # Draw method is not replaced
+        top.draw()
+        self.assertGreater(len(menus[3]._display_list), 0)
+
+        # Back goes to the parent, reset pops several levels
+        top._actual._option[0].apply()
+        self.assertIs(top._actual, menus[2])
+        menus[2]._select(1)
+        top._actual._option[0].apply()
+        top.reset(2)
+        self.assertIs(top._actual, menus[1])
+        self.assertEqual(menus[2]._index, 0)  # Selection of the closed menus is reset
+        top.reset(100)
+        self.assertIs(top._actual, top)
+        self.assertEqual(len(top._stack), 1)
+
+        # The stack does not keep the menus alive
+        submenu = create_menu('Submenu')
+        top._open(submenu)
+        self.assertIs(top._actual, submenu)
+        top.reset(1)
+        ref = weakref.ref(submenu)
+        del submenu
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_control_map(self):
+        """
+        Test navigating with keys and joystick buttons bound to controls.
+        """
+        control_map = ControlMap()
+        control_map.bind_key(pygame.K_s, pygameMenu.locals.PYGAME_CTRL_UP)
+        control_map.bind_joy_button(3, pygameMenu.locals.PYGAME_CTRL_UP)
+        control_map.bind_joy_button(4, pygameMenu.locals.PYGAME_CTRL_DOWN)
+        for joystick in (True, False):
+            menu = create_menu(control_map=control_map, joystick_enabled=joystick)
+            for i in range(3):
+                menu.add_option('Option {0}'.format(i), pygameMenu.events.PYGAMEMENU_CLOSE)
+            menu.mainloop([keydown(pygame.K_s, 's')])
+            self.assertEqual(menu._index, 1)
+            menu.mainloop([pygame.event.Event(pygame.JOYBUTTONDOWN, joy=0, instance_id=0, button=3)])
+            self.assertEqual(menu._index, 2 if joystick else 1)
+            menu.mainloop([pygame.event.Event(pygame.JOYBUTTONDOWN, joy=0, instance_id=0, button=4)])
+            self.assertEqual(menu._index, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST TEXTMENU
+Test the text menu layout.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import unittest
+
+from _utils import create_menu
+from pygameMenu.textmenu import TextMenu
+import pygameMenu
+
+
+class TextMenuTest(unittest.TestCase):
+
+    def test_add_line_layout(self):
+        """
+        Test that the options are positioned again after adding a line.
+        """
+        menu = create_menu(menu_class=TextMenu)
+        menu.add_line('First line')
+        button = menu.add_option('Close', pygameMenu.events.PYGAMEMENU_CLOSE)
+        menu.draw()
+        y = button.get_rect().y
+
+        # Lines are drawn above the options, which move down
+        for line in ('Second line', 'Third line'):
+            menu.add_line(line)
+            menu.draw()
+            self.assertGreater(button.get_rect().y, y)
+            self.assertAlmostEqual(button.get_rect().y, menu._get_option_pos(0)[1], delta=1)
+            self.assertEqual(menu._get_option_index_at(button.get_rect().center), 0)
+            y = button.get_rect().y
+
+
+if __name__ == '__main__':
+    unittest.main()
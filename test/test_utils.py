@@ -0,0 +1,98 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST UTILS
+Test the surface utilities.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import unittest
+
+from _utils import create_menu, surface
+from pygameMenu.textmenu import TextMenu
+import pygame
+import pygameMenu
+import pygameMenu.utils as _utils
+
+
+class UtilsTest(unittest.TestCase):
+
+    def test_convert_surface(self):
+        """
+        Test that the surfaces are converted to the display format, keeping
+        their transparency.
+        """
+        # noinspection PyArgumentList
+        alpha = pygame.Surface((4, 4), pygame.SRCALPHA, 32)
+        alpha.fill((10, 20, 30, 40))
+        converted = _utils.convert_surface(alpha)
+        self.assertTrue(converted.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(tuple(converted.get_at((0, 0))), (10, 20, 30, 40))
+
+        # Surfaces with a colorkey are RLE accelerated
+        key = pygame.Surface((4, 4), 0, 8)
+        key.set_palette_at(1, (255, 255, 255))
+        key.set_colorkey((0, 0, 0))
+        converted = _utils.convert_surface(key)
+        self.assertEqual(converted.get_bitsize(), surface.get_bitsize())
+        self.assertEqual(converted.get_colorkey()[:3], (0, 0, 0))
+        self.assertTrue(converted.get_flags() & pygame.RLEACCELOK)  # Encoded on first blit
+
+    def test_blur_dim_surface(self):
+        """
+        Test blurring and darkening a copy of the background.
+        """
+        background = pygame.Surface((40, 40), 0, 32)
+        background.fill((255, 255, 255), (0, 0, 20, 40))
+        blurred = _utils.blur_surface(background, 4)
+        self.assertEqual(blurred.get_size(), background.get_size())
+        self.assertEqual(tuple(background.get_at((19, 20))), (255, 255, 255, 255))  # Not modified
+        self.assertTrue(0 < blurred.get_at((19, 20))[0] < 255)
+        self.assertTrue(0 < blurred.get_at((20, 20))[0] < 255)
+        self.assertGreater(blurred.get_at((0, 20))[0], 250)  # Scaling without NumPy loses some precision
+        self.assertLess(blurred.get_at((39, 20))[0], 5)
+        value = blurred.get_at((0, 20))[0]
+        _utils.dim_surface(blurred, 0.25)
+        self.assertAlmostEqual(blurred.get_at((0, 20))[0], value * 0.75, delta=1)
+
+    def test_cached_surfaces(self):
+        """
+        Test that the cached text surfaces of the widgets and menus use the
+        display format.
+        """
+        menu = create_menu(menu_class=TextMenu)
+        menu.add_line('Line')
+        menu.add_option('Close', pygameMenu.events.PYGAMEMENU_CLOSE)
+        menu.draw()
+        surfaces = [menu._menubar.get_surface(), menu._option[0].get_surface()] + menu._text_surfaces
+        for text in surfaces:
+            self.assertEqual(text.get_bitsize(), surface.get_bitsize())
+            self.assertEqual(text.get_masks()[:3], surface.get_masks()[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
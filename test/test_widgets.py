@@ -0,0 +1,292 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST WIDGETS
+Test the widgets rendering and events.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2019 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import threading
+import unittest
+
+from collections import Counter
+
+from _utils import create_menu, get_pixels, keydown, KeyTestCase, W_SIZE
+from pygameMenu.controls import ControlMap
+from pygameMenu.widgets.textinput import _GlyphRun
+import pygame
+import pygameMenu
+import pygameMenu.clipboard
+
+
+class WidgetsTest(KeyTestCase):
+
+    def test_empty_text(self):
+        """
+        Test that widgets with empty texts keep the height of the font.
+        """
+        menu = create_menu()
+        textinput = menu.add_text_input('Name: ')
+        button = menu.add_option('', pygameMenu.events.PYGAMEMENU_CLOSE)
+        empty = menu.add_text_input('')
+        menu.draw()
+        height = textinput.get_rect().height
+        self.assertGreater(height, 1)
+        self.assertEqual(button.get_rect().height, height)
+        self.assertEqual(empty.get_rect().height, height)
+
+    def test_selector_type_ahead(self):
+        """
+        Test the selector search by typing the first letters of a label.
+        """
+        menu = create_menu()
+        selector = menu.add_selector('Map', [('Alpha', 1), ('Beta', 1), ('Bravo', 2)], 'map')
+        selector.update([keydown(pygame.K_b, 'b')])
+        self.assertEqual(selector.get_value(), ('Beta', 1))
+        selector.update([keydown(pygame.K_r, 'r')])
+        self.assertEqual(selector.get_value(), ('Bravo', 2))
+
+        # Key events posted by the application may not have a text
+        selector.update([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0)])
+        self.assertEqual(selector.get_value(), ('Bravo', 2))
+
+    def test_selector_lazy_provider(self):
+        """
+        Test that the elements of lazy providers are generated on demand, and
+        that only the selected element and its neighbours are cached.
+        """
+        calls = []
+
+        def provider():
+            calls.append(provider)
+            return [('Low', 1), ('High', 2)]
+
+        class Sequence(object):
+            def __len__(self):
+                return 3
+
+            def __getitem__(self, index):
+                return 'Item {0}'.format(index), index * 10
+
+        menu = create_menu()
+        quality = menu.add_selector('Quality', provider)
+        values = menu.add_selector('Value', range(1000000), default=10)
+        items = menu.add_selector('Item', Sequence(), default=2)
+        self.assertEqual(calls, [])
+        self.assertEqual(values.get_value(), ('10', 10))
+        self.assertEqual(items.get_value(), ('Item 2', 2))
+
+        # The function is called once, when the selector is rendered
+        menu.draw()
+        self.assertEqual(calls, [provider])
+        quality.right()
+        self.assertEqual(quality.get_value(), ('High', 1))
+        self.assertEqual(calls, [provider])
+
+        values.left()
+        self.assertEqual(values.get_value(), ('9', 9))
+        values.set_value('999999')
+        values.right()
+        self.assertEqual(values.get_value(), ('0', 0))
+        self.assertLessEqual(len(values._element_cache), 3)
+        self.assertTrue(all(abs(index - values._index) <= 1 for index in values._element_cache))
+        items.right()
+        self.assertEqual(items.get_value(), ('Item 0', 0))
+
+    def test_tinted_masks(self):
+        """
+        Test that selecting a widget tints the cached mask of its text, the
+        text is not rendered again.
+        """
+        menu = create_menu(option_shadow=True)
+        buttons = [menu.add_option('Option {0}'.format(i), pygameMenu.events.PYGAMEMENU_BACK) for i in range(2)]
+        menu.mainloop([])
+        rendered = []
+        for button in buttons:
+            button._render_segment = lambda index, string, render=button._render_segment: \
+                rendered.append(string) or render(index, string)
+
+        def get_colors(widget):
+            colors = Counter(pixel[:3] for row in get_pixels(widget.get_surface()) for pixel in row
+                             if pixel[3] == 255)
+            shadow = colors.pop(tuple(widget._shadow_color[:3]), 0)
+            return colors.most_common(1)[0][0], shadow
+
+        button = buttons[0]
+        selected = get_pixels(button.get_surface())
+        self.assertEqual(get_colors(button)[0], tuple(button._font_selected_color[:3]))
+        self.assertGreater(get_colors(button)[1], 0)
+        menu._select(1)
+        menu.draw()
+        self.assertEqual(get_colors(button)[0], tuple(button._font_color[:3]))
+        self.assertGreater(get_colors(button)[1], 0)
+        menu._select(0)
+        menu.draw()
+        self.assertEqual(get_pixels(button.get_surface()), selected)
+        self.assertEqual(rendered, [])
+
+    def test_textinput_control_keys(self):
+        """
+        Test that the text of the keys bound to controls is not typed.
+        """
+        returned = []
+        menu = create_menu()
+        textinput = menu.add_text_input('Name: ', onreturn=returned.append)
+        if not textinput._text_events:
+            self.skipTest('TEXTINPUT events are not supported')
+        control_map = ControlMap()
+        control_map.bind_key(pygame.K_q, pygameMenu.locals.PYGAME_CTRL_ENTER)
+        textinput.set_control_map(control_map)
+
+        events = []
+        for key, text in ((pygame.K_a, 'a'), (pygame.K_q, 'q'), (pygame.K_b, 'b')):
+            events.append(keydown(key, text))
+            events.append(pygame.event.Event(pygame.TEXTINPUT, text=text))
+        textinput.update(events)
+        self.assertEqual(textinput.get_value(), 'ab')
+        self.assertEqual(returned, ['a'])
+
+    def test_textinput_incremental(self):
+        """
+        Test that typing and deleting at the end of the input updates the
+        rendered glyph run, and that other editions render it again.
+        """
+        menu = create_menu()
+        textinput = menu.add_text_input('Name: ')
+
+        def type_text(text):
+            events = []
+            for char in text:
+                events.append(keydown(getattr(pygame, 'K_' + char), char))
+                events.append(pygame.event.Event(pygame.TEXTINPUT, text=char))
+            textinput.update(events)
+            menu.draw()
+
+        type_text('a')
+        run = textinput._glyph_run
+        self.assertEqual(run.string, 'a')
+        type_text('bc')
+        self.assertIs(textinput._glyph_run, run)
+        self.assertEqual(run.string, 'abc')
+        textinput.update([keydown(pygame.K_BACKSPACE)])
+        menu.draw()
+        self.assertIs(textinput._glyph_run, run)
+        self.assertEqual(run.string, 'ab')
+        expected = _GlyphRun(textinput._font, textinput._font_antialias, 'ab').get_surface()
+        self.assertEqual(get_pixels(run.get_surface()), get_pixels(expected))
+
+        # Typing in the middle of the input
+        textinput.update([keydown(pygame.K_LEFT)])
+        type_text('x')
+        self.assertEqual(textinput.get_value(), 'axb')
+        self.assertIsNot(textinput._glyph_run, run)
+        self.assertEqual(textinput._glyph_run.string, 'axb')
+
+    def test_textinput_ime(self):
+        """
+        Test that the text input of the system is active while the widget is
+        selected, with the candidate list placed at the widget.
+        """
+        menu = create_menu()
+        textinput = menu.add_text_input('Name: ')
+        menu.add_option('Close', pygameMenu.events.PYGAMEMENU_CLOSE)
+        if not textinput._text_events:
+            self.skipTest('TEXTINPUT events are not supported')
+        calls = []
+        functions = {}
+        for name in ('start_text_input', 'stop_text_input', 'set_text_input_rect'):
+            functions[name] = getattr(pygame.key, name)
+            setattr(pygame.key, name, lambda *args, call=name: calls.append((call,) + args))
+        try:
+            menu.mainloop([])
+            self.assertEqual(calls[-1], ('set_text_input_rect', textinput.get_rect()))
+            self.assertGreater(calls[-1][1].y, 0)
+            menu._select(1)
+            self.assertEqual(calls[-1], ('stop_text_input',))
+            del calls[:]
+            menu._select(0)
+            self.assertEqual(calls, [('start_text_input',), ('set_text_input_rect', textinput.get_rect())])
+        finally:
+            for name in functions:
+                setattr(pygame.key, name, functions[name])
+
+    def test_textinput_paste(self):
+        """
+        Test that the text pasted with pyperclip is received on a worker
+        thread, and inserted without control characters on a later frame.
+        """
+        ready = threading.Event()
+
+        class Pyperclip(object):
+            PyperclipException = Exception
+
+            @staticmethod
+            def paste():
+                ready.wait(5)
+                return 'a\x1bb\tc\n'
+
+        menu = create_menu()
+        textinput = menu.add_text_input('Name: ', default='x')
+        textinput._clipboard._scrap = False  # Use pyperclip
+        pyperclip = pygameMenu.clipboard._pyperclip
+        pygameMenu.clipboard._pyperclip = Pyperclip
+        try:
+            self.assertFalse(textinput._paste())
+            self.assertTrue(textinput._clipboard.is_pasting())
+            self.assertFalse(textinput.update([]))
+            self.assertEqual(textinput.get_value(), 'x')
+            ready.set()
+            textinput._clipboard._paste_thread.join(5)
+            self.assertTrue(textinput.update([]))
+            self.assertEqual(textinput.get_value(), 'xabc')
+        finally:
+            ready.set()
+            pygameMenu.clipboard._pyperclip = pyperclip
+
+    def test_render_version_float_position(self):
+        """
+        Test that widgets at fractional positions are not rendered again on
+        each frame.
+        """
+        menu = create_menu(menu_width=W_SIZE - 1, menu_height=W_SIZE - 1)  # Menu position ends in .5
+        button = menu.add_option('Close', pygameMenu.events.PYGAMEMENU_CLOSE)
+        menu.draw()
+        versions = (menu._menubar._render_version, button._render_version)
+        for _ in range(3):
+            menu.draw()
+        self.assertEqual((menu._menubar._render_version, button._render_version), versions)
+
+        # The scaled menu is reused at logical resolution
+        menu.set_logical_resolution()
+        menu.draw()
+        scaled = menu._logical_scaled
+        menu.draw()
+        self.assertIs(menu._logical_scaled, scaled)
+
+
+if __name__ == '__main__':
+    unittest.main()